@@ -0,0 +1,127 @@
+"""
+Benchmark CSV parser throughput on a synthetic statement.
+
+Usage:
+    uv run python -m benchmarks.bench_csv_parser [--rows 100000]
+"""
+
+import argparse
+import csv
+import html
+import time
+from decimal import Decimal
+from io import StringIO
+from typing import Callable, Dict, List
+from src.schemas import TransactionCreate
+from src.services.csv_parser import CSVParser
+
+HEADER = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo"
+CATEGORIES = ["Shopping", "Food & Drink", "Groceries", "Travel", "Bills & Utilities"]
+
+
+def build_csv(rows: int) -> str:
+    """
+    Build a Chase-style CSV statement with the given number of rows.
+
+    Args:
+        rows: Number of transaction rows
+
+    Returns:
+        CSV content as string
+    """
+    lines = [HEADER]
+    for i in range(rows):
+        month, day = i % 12 + 1, i % 28 + 1
+        lines.append(
+            f"{month:02d}/{day:02d}/2025,{month:02d}/{day:02d}/2025,"
+            f"Merchant {i % 500},{CATEGORIES[i % len(CATEGORIES)]},Sale,"
+            f"-{i % 1000}.{i % 100:02d},"
+        )
+    return "\n".join(lines)
+
+
+def parse_dictreader(csv_content: str) -> List[TransactionCreate]:
+    """
+    Parse CSV content the way the parser did before it was optimized.
+
+    One csv.DictReader row dictionary and one TransactionCreate
+    construction per row; kept here as the baseline to compare against.
+
+    Args:
+        csv_content: CSV file content as string
+
+    Returns:
+        List of TransactionCreate objects
+    """
+    transactions = []
+    for row in csv.DictReader(StringIO(csv_content)):
+        transactions.append(
+            TransactionCreate(
+                transaction_date=row["Transaction Date"].strip(),
+                post_date=row["Post Date"].strip(),
+                description=html.unescape(row["Description"].strip()),
+                category=row["Category"].strip() or "Uncategorized",
+                type=row["Type"].strip(),
+                amount=Decimal(row["Amount"].strip()),
+                memo=row["Memo"].strip() if row["Memo"] else "",
+            )
+        )
+    return transactions
+
+
+def measure(
+    name: str,
+    parse: Callable[[str], object],
+    csv_content: str,
+    rows: int,
+    repeat: int,
+    baseline: float = 0.0,
+) -> float:
+    """
+    Run a parse function and print its best throughput in rows/sec.
+
+    Args:
+        name: Label to print
+        parse: Parse function to time
+        csv_content: CSV content to parse
+        rows: Number of rows in the content
+        repeat: Number of runs to take the best of
+        baseline: Baseline throughput to print a speedup against, if any
+
+    Returns:
+        Best throughput in rows/sec
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(csv_content)
+        timings.append(time.perf_counter() - start)
+    elapsed = min(timings)
+    throughput = rows / elapsed
+    speedup = f"  {throughput / baseline:.2f}x" if baseline else ""
+    print(f"{name:<16} {throughput:>12,.0f} rows/sec  ({elapsed:.2f}s){speedup}")
+    return throughput
+
+
+def main() -> None:
+    """Run the parser benchmarks."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--rows", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    csv_content = build_csv(args.rows)
+    parser = CSVParser()
+
+    print(f"Parsing {args.rows:,} rows")
+    baseline = measure("dictreader", parse_dictreader, csv_content, args.rows, args.repeat)
+    candidates: Dict[str, Callable[[str], object]] = {
+        "parse": parser.parse,
+        "parse_columnar": parser.parse_columnar,
+    }
+    for name, parse in candidates.items():
+        measure(name, parse, csv_content, args.rows, args.repeat, baseline)
+
+
+if __name__ == "__main__":
+    main()
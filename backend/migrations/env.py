@@ -0,0 +1,67 @@
+"""Alembic migration environment."""
+
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+from src.config import settings
+from src.models import Base
+
+config = context.config
+config.set_main_option("sqlalchemy.url", settings.database_url_sync)
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Indexes autogenerate cannot compare faithfully; migrations for them are
+# written by hand
+_MANUAL_INDEXES = {
+    index.name
+    for table in target_metadata.tables.values()
+    for index in table.indexes
+    if index.info.get("manual_migration")
+}
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Leave hand-migrated indexes out of autogenerate comparisons."""
+    return not (type_ == "index" and name in _MANUAL_INDEXES)
+
+
+def run_migrations_offline() -> None:
+    """Run migrations without a database connection, emitting SQL."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations against the database."""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
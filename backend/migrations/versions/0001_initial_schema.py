@@ -0,0 +1,41 @@
+"""Initial schema: uploads and transactions
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "uploads",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("upload_id", sa.Integer(), sa.ForeignKey("uploads.id"), nullable=False),
+        sa.Column("transaction_date", sa.String(10), nullable=False),
+        sa.Column("post_date", sa.String(10), nullable=False),
+        sa.Column("description", sa.String(255), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("memo", sa.String(255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("transactions")
+    op.drop_table("uploads")
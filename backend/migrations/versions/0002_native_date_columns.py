@@ -0,0 +1,43 @@
+"""Store transaction and post dates as native DATE columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for column in ("transaction_date", "post_date"):
+        op.alter_column(
+            "transactions",
+            column,
+            type_=sa.Date(),
+            existing_type=sa.String(10),
+            existing_nullable=False,
+            postgresql_using=f"to_date({column}, 'MM/DD/YYYY')",
+        )
+    op.create_index(
+        "ix_transactions_transaction_date", "transactions", ["transaction_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_transaction_date", table_name="transactions")
+    for column in ("transaction_date", "post_date"):
+        op.alter_column(
+            "transactions",
+            column,
+            type_=sa.String(10),
+            existing_type=sa.Date(),
+            existing_nullable=False,
+            postgresql_using=f"to_char({column}, 'MM/DD/YYYY')",
+        )
@@ -0,0 +1,29 @@
+"""Store transaction amounts as BIGINT cents
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("transactions", sa.Column("amount_cents", sa.BigInteger(), nullable=True))
+    op.execute("UPDATE transactions SET amount_cents = round(amount * 100)::bigint")
+    op.alter_column("transactions", "amount_cents", nullable=False)
+    op.drop_column("transactions", "amount")
+
+
+def downgrade() -> None:
+    op.add_column("transactions", sa.Column("amount", sa.Numeric(10, 2), nullable=True))
+    op.execute("UPDATE transactions SET amount = amount_cents / 100.0")
+    op.alter_column("transactions", "amount", nullable=False)
+    op.drop_column("transactions", "amount_cents")
@@ -0,0 +1,25 @@
+"""Fingerprint uploads by file hash
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("uploads", sa.Column("file_hash", sa.String(length=64), nullable=True))
+    op.create_index("ix_uploads_file_hash", "uploads", ["file_hash"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_uploads_file_hash", table_name="uploads")
+    op.drop_column("uploads", "file_hash")
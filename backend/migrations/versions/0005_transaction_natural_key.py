@@ -0,0 +1,87 @@
+"""Deduplicate transactions by natural key
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from src.services.natural_key import NaturalKeyBuilder
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BATCH_ROWS = 10_000
+
+
+def upgrade() -> None:
+    op.add_column("transactions", sa.Column("natural_key", sa.LargeBinary(length=32), nullable=True))
+    _backfill_natural_keys()
+    # Drop copies ingested from overlapping statements, keeping the first
+    op.execute(
+        """
+        DELETE FROM transactions t
+        USING transactions d
+        WHERE t.natural_key = d.natural_key AND t.id > d.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE uploads u SET transaction_count = (
+            SELECT count(*) FROM transactions t WHERE t.upload_id = u.id
+        )
+        """
+    )
+    op.alter_column("transactions", "natural_key", nullable=False)
+    op.create_index("ix_transactions_natural_key", "transactions", ["natural_key"], unique=True)
+
+
+def _backfill_natural_keys() -> None:
+    """
+    Key the stored rows with the code that keys new uploads.
+
+    Description normalization is Unicode-aware (e.g. NBSP is whitespace,
+    'ß' upper-cases to 'SS'), which Postgres' locale-dependent
+    regexp_replace() and upper() do not reproduce, so keys computed in
+    SQL would never match those of later uploads.
+    """
+    connection = op.get_bind()
+    connection.execute(sa.text(
+        "CREATE TEMPORARY TABLE natural_key_backfill "
+        "(id integer PRIMARY KEY, natural_key bytea NOT NULL) ON COMMIT DROP"
+    ))
+    backfill = sa.table("natural_key_backfill", sa.column("id"), sa.column("natural_key"))
+
+    rows = connection.execute(sa.text(
+        "SELECT id, upload_id, transaction_date, post_date, description, amount_cents "
+        "FROM transactions ORDER BY upload_id, id"
+    ).execution_options(stream_results=True))
+    # Occurrences are numbered within each upload, in insertion order
+    keys, upload_id, batch = None, None, []
+    for row in rows:
+        if row.upload_id != upload_id:
+            keys, upload_id = NaturalKeyBuilder(), row.upload_id
+        batch.append({
+            "id": row.id,
+            "natural_key": keys.key(row.transaction_date, row.post_date, row.description, row.amount_cents),
+        })
+        if len(batch) == _BACKFILL_BATCH_ROWS:
+            connection.execute(backfill.insert(), batch)
+            batch = []
+    if batch:
+        connection.execute(backfill.insert(), batch)
+
+    connection.execute(sa.text(
+        "UPDATE transactions t SET natural_key = k.natural_key "
+        "FROM natural_key_backfill k WHERE t.id = k.id"
+    ))
+
+
+def downgrade() -> None:
+    # Duplicate rows removed by the upgrade are not restored
+    op.drop_index("ix_transactions_natural_key", table_name="transactions")
+    op.drop_column("transactions", "natural_key")
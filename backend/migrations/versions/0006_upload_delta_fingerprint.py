@@ -0,0 +1,31 @@
+"""Record file size, row count and occurrence index of uploads
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing uploads stay NULL: without the size and occurrence index of
+    # their file they are never used as a delta base
+    op.add_column("uploads", sa.Column("file_size", sa.BigInteger(), nullable=True))
+    op.add_column("uploads", sa.Column("row_count", sa.Integer(), nullable=True))
+    op.add_column("uploads", sa.Column("occurrence_index", sa.LargeBinary(), nullable=True))
+    op.create_index("ix_uploads_file_size", "uploads", ["file_size"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_uploads_file_size", table_name="uploads")
+    op.drop_column("uploads", "occurrence_index")
+    op.drop_column("uploads", "row_count")
+    op.drop_column("uploads", "file_size")
@@ -0,0 +1,47 @@
+"""Add ingest job queue
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingest_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("file_size", sa.BigInteger(), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("rows_parsed", sa.Integer(), nullable=True),
+        sa.Column("rows_inserted", sa.Integer(), nullable=True),
+        sa.Column("rows_duplicate", sa.Integer(), nullable=True),
+        sa.Column("upload_id", sa.Integer(), sa.ForeignKey("uploads.id"), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "ix_ingest_jobs_unfinished",
+        "ingest_jobs",
+        ["id"],
+        postgresql_where=sa.text("status NOT IN ('succeeded', 'failed')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingest_jobs_unfinished", table_name="ingest_jobs")
+    op.drop_table("ingest_jobs")
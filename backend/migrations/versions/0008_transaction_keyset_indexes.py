@@ -0,0 +1,29 @@
+"""Add composite indexes for keyset-paginated transaction listing
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_transactions_date_id", "transactions", ["transaction_date", "id"])
+    op.create_index(
+        "ix_transactions_upload_date_id", "transactions", ["upload_id", "transaction_date", "id"]
+    )
+    # Superseded by the leading column of ix_transactions_date_id
+    op.drop_index("ix_transactions_transaction_date", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_transactions_transaction_date", "transactions", ["transaction_date"])
+    op.drop_index("ix_transactions_upload_date_id", table_name="transactions")
+    op.drop_index("ix_transactions_date_id", table_name="transactions")
@@ -0,0 +1,40 @@
+"""Add indexes for filtering and sorting the transaction listing
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_category_date_id", "transactions", ["category", "transaction_date", "id"]
+    )
+    op.create_index("ix_transactions_amount_id", "transactions", ["amount_cents", "id"])
+    op.create_index(
+        "ix_transactions_merchant_id",
+        "transactions",
+        [sa.text('(lower(description) COLLATE "C")'), "id"],
+    )
+    op.create_index(
+        "ix_transactions_debit_date_id",
+        "transactions",
+        ["transaction_date", "id"],
+        postgresql_where=sa.text("amount_cents < 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_debit_date_id", table_name="transactions")
+    op.drop_index("ix_transactions_merchant_id", table_name="transactions")
+    op.drop_index("ix_transactions_amount_id", table_name="transactions")
+    op.drop_index("ix_transactions_category_date_id", table_name="transactions")
@@ -0,0 +1,79 @@
+"""Store per-upload statistics computed at ingest
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("uploads", sa.Column("total_spent_cents", sa.BigInteger(), nullable=False, server_default="0"))
+    op.add_column("uploads", sa.Column("total_income_cents", sa.BigInteger(), nullable=False, server_default="0"))
+    op.add_column("uploads", sa.Column("min_transaction_date", sa.Date(), nullable=True))
+    op.add_column("uploads", sa.Column("max_transaction_date", sa.Date(), nullable=True))
+    op.add_column("uploads", sa.Column("category_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column(
+        "uploads",
+        sa.Column(
+            "category_totals",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+
+    # Backfill existing uploads from their stored transactions
+    op.execute(
+        """
+        WITH per_category AS (
+            SELECT upload_id,
+                   category,
+                   sum(amount_cents) AS net_cents,
+                   sum(-amount_cents) FILTER (WHERE amount_cents < 0) AS spent_cents,
+                   sum(amount_cents) FILTER (WHERE amount_cents >= 0) AS income_cents,
+                   min(transaction_date) AS min_date,
+                   max(transaction_date) AS max_date
+            FROM transactions
+            GROUP BY upload_id, category
+        ),
+        per_upload AS (
+            SELECT upload_id,
+                   coalesce(sum(spent_cents), 0) AS spent_cents,
+                   coalesce(sum(income_cents), 0) AS income_cents,
+                   min(min_date) AS min_date,
+                   max(max_date) AS max_date,
+                   count(*) AS category_count,
+                   jsonb_object_agg(category, net_cents) AS category_totals
+            FROM per_category
+            GROUP BY upload_id
+        )
+        UPDATE uploads
+        SET total_spent_cents = per_upload.spent_cents,
+            total_income_cents = per_upload.income_cents,
+            min_transaction_date = per_upload.min_date,
+            max_transaction_date = per_upload.max_date,
+            category_count = per_upload.category_count,
+            category_totals = per_upload.category_totals
+        FROM per_upload
+        WHERE uploads.id = per_upload.upload_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("uploads", "category_totals")
+    op.drop_column("uploads", "category_count")
+    op.drop_column("uploads", "max_transaction_date")
+    op.drop_column("uploads", "min_transaction_date")
+    op.drop_column("uploads", "total_income_cents")
+    op.drop_column("uploads", "total_spent_cents")
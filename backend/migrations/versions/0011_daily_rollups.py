@@ -0,0 +1,48 @@
+"""Add daily rollups of transaction totals for analytics
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_rollups",
+        sa.Column("transaction_date", sa.Date(), nullable=False),
+        sa.Column("category", sa.String(length=100), nullable=False),
+        sa.Column("type", sa.String(length=50), nullable=False),
+        sa.Column("transaction_count", sa.BigInteger(), nullable=False),
+        sa.Column("spent_cents", sa.BigInteger(), nullable=False),
+        sa.Column("income_cents", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("transaction_date", "category", "type"),
+    )
+
+    # Backfill from the transactions stored so far
+    op.execute(
+        """
+        INSERT INTO daily_rollups
+            (transaction_date, category, type, transaction_count, spent_cents, income_cents)
+        SELECT transaction_date,
+               category,
+               type,
+               count(*),
+               coalesce(sum(-amount_cents) FILTER (WHERE amount_cents < 0), 0),
+               coalesce(sum(amount_cents) FILTER (WHERE amount_cents >= 0), 0)
+        FROM transactions
+        GROUP BY transaction_date, category, type
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_rollups")
@@ -0,0 +1,31 @@
+"""Store ingest job files as large objects
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ingest_jobs", sa.Column("content_oid", postgresql.OID(), nullable=True))
+    op.execute(
+        "UPDATE ingest_jobs SET content_oid = lo_from_bytea(0, content) WHERE content IS NOT NULL"
+    )
+    op.drop_column("ingest_jobs", "content")
+
+
+def downgrade() -> None:
+    op.add_column("ingest_jobs", sa.Column("content", sa.LargeBinary(), nullable=True))
+    op.execute("UPDATE ingest_jobs SET content = lo_get(content_oid) WHERE content_oid IS NOT NULL")
+    op.execute("SELECT lo_unlink(content_oid) FROM ingest_jobs WHERE content_oid IS NOT NULL")
+    op.drop_column("ingest_jobs", "content_oid")
@@ -1,28 +1,61 @@
 """Async context manager for database operations - ensures sessions are properly managed."""
 
+from collections import Counter
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Integer, LargeBinary, Row, and_, any_, bindparam, column, delete, func, or_, select, table, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
-from src.models import Upload, Transaction, UploadDTO, TransactionDTO
-from src.schemas import TransactionCreate
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from src.models import (
+    DailyRollupDTO,
+    IngestJob,
+    IngestJobDTO,
+    IngestJobStatus,
+    Transaction,
+    TransactionDTO,
+    TransactionPage,
+    Upload,
+    UploadDTO,
+    UploadFingerprint,
+    UploadSummary,
+    UploadSummaryPage,
+)
+from src.config import settings
+from src.schemas import TransactionCreate, TransactionListQuery
 from src.database import AsyncSessionLocal
+from src.services.date_codec import parse_date
+from src.services.money import decimal_to_cents
+from src.services.natural_key import NaturalKeyBuilder, OccurrenceIndex, find_occurrence, transaction_base_hash
+from src.services.pagination import INT4_MAX, InvalidCursorError, decode_cursor, encode_cursor
+from src.services.progress import UploadProgress
+from src.services.summary import SummaryAccumulator
+from src.services.transaction_batch import TransactionBatch
+from src.transaction_query import TransactionQueryBuilder
 
+# Temporary table COPY loads into before rows are merged into transactions
+_STAGING_TABLE = "transactions_staging"
+_COPY_COLUMNS = (
+    "upload_id",
+    "transaction_date",
+    "post_date",
+    "description",
+    "category",
+    "type",
+    "amount_cents",
+    "memo",
+    "natural_key",
+)
+_COPY_CHUNK_ROWS = 25_000  # Rows staged and merged per step
 
-class UploadsContextManager:
+
+class SessionContextManager:
     """
-    Async context manager for Upload database operations.
+    Async context manager owning one database session.
 
     Ensures database sessions are properly created, committed/rolled back,
-    and closed. All methods return read-only domain models after converting
-    from DTOs while the session is still active.
-
-    Usage:
-        async with UploadsContextManager() as db:
-            upload = await db.create_upload(transactions)
-            # Session automatically committed and closed here
-
-        # upload is read-only and safe to use
+    and closed.
     """
 
     def __init__(self):
@@ -61,49 +94,479 @@ class UploadsContextManager:
             # Always close session
             await self.session.close()
 
+
+class UploadsContextManager(SessionContextManager):
+    """
+    Async context manager for Upload database operations.
+
+    Ensures database sessions are properly created, committed/rolled back,
+    and closed. All methods return read-only domain models after converting
+    from DTOs while the session is still active.
+
+    Usage:
+        async with UploadsContextManager() as db:
+            upload = await db.create_upload(transactions)
+            # Session automatically committed and closed here
+
+        # upload is read-only and safe to use
+    """
+
     async def create_upload(
         self,
-        transactions: List[TransactionCreate],
+        transactions: Union[List[TransactionCreate], TransactionBatch],
+        file_hash: Optional[str] = None,
+        file_size: Optional[int] = None,
+        base_upload_id: Optional[int] = None,
+        progress: Optional[UploadProgress] = None,
     ) -> Upload:
         """
         Create a new upload with transactions.
 
+        When ``file_hash`` is given and a file with the same hash was
+        already ingested, nothing is written and the existing upload is
+        returned with ``duplicate=True``. The hash is claimed with
+        INSERT ... ON CONFLICT DO NOTHING against a unique index, so of
+        several concurrent identical uploads exactly one ingests the rows;
+        the others wait for it to commit and then return its upload.
+
+        When ``base_upload_id`` is given, the file starts with that
+        upload's file and ``transactions`` are only the rows after it.
+        Their natural keys continue the base upload's occurrence counts,
+        so they match the keys a full parse of the file would produce.
+
         Args:
-            transactions: List of TransactionCreate schemas
+            transactions: List of TransactionCreate schemas or a columnar
+                TransactionBatch
+            file_hash: SHA-256 hex digest of the uploaded file
+            file_size: Size of the uploaded file in bytes
+            base_upload_id: ID of the upload whose file is a prefix of this one
+            progress: Upload progress to count persisted rows in
 
         Returns:
             Read-only Upload instance
+
+        Raises:
+            ValueError: If the base upload does not exist or has no
+                occurrence index
+        """
+        claimed = await self._claim_upload(len(transactions), file_hash, file_size)
+        if claimed is None:
+            existing = await self.get_upload_by_hash(file_hash)
+            if isinstance(transactions, TransactionBatch):
+                records = transactions.to_records(upload_id=existing.id)
+            else:
+                records = self._transaction_records(existing.id, transactions, NaturalKeyBuilder())
+            return replace(
+                existing,
+                duplicate=True,
+                duplicate_transaction_count=len(transactions),
+                row_ids=await self._row_ids(records, {}),
+            )
+
+        prior_rows = 0
+        keys = NaturalKeyBuilder()
+        if base_upload_id is not None:
+            base = (await self.session.execute(
+                select(UploadDTO.row_count, UploadDTO.occurrence_index)
+                .where(UploadDTO.id == base_upload_id)
+            )).one_or_none()
+            if base is None or base.occurrence_index is None:
+                raise ValueError(f"Upload {base_upload_id} cannot be used as a delta base")
+            prior_rows = base.row_count
+            keys = NaturalKeyBuilder(prior=OccurrenceIndex.from_bytes(base.occurrence_index))
+
+        if isinstance(transactions, TransactionBatch):
+            records = transactions.to_records(upload_id=claimed.id, keys=keys)
+        else:
+            records = self._transaction_records(claimed.id, transactions, keys)
+        if len(records) >= settings.copy_ingest_threshold:
+            returned = await self._copy_records(records, progress)
+        else:
+            returned = await self._insert_records(records)
+            if progress is not None:
+                progress.rows_persisted = len(records)
+        ids = {row.natural_key: row.id for row in returned}
+        inserted = self._inserted_transactions(records, ids)
+
+        # Rows already stored from an overlapping statement are not attached
+        await self._apply_rollups(self._rollup_records(inserted))
+        stats = self._upload_stats(transactions, inserted, len(records))
+        await self.session.execute(
+            update(UploadDTO)
+            .where(UploadDTO.id == claimed.id)
+            .values(
+                transaction_count=len(inserted),
+                row_count=prior_rows + len(records),
+                occurrence_index=keys.occurrence_index().to_bytes(),
+                total_spent_cents=stats.spent_cents,
+                total_income_cents=stats.income_cents,
+                min_transaction_date=stats.min_date,
+                max_transaction_date=stats.max_date,
+                category_count=len(stats.category_totals),
+                category_totals=stats.category_totals,
+            )
+        )
+
+        # Built from the inserted parameters and returned IDs, so the rows
+        # are not read back
+        return Upload(
+            id=claimed.id,
+            created_at=claimed.created_at,
+            transaction_count=len(inserted),
+            transactions=inserted,
+            file_hash=file_hash,
+            duplicate_transaction_count=len(records) - len(inserted),
+            row_ids=await self._row_ids(records, ids),
+        )
+
+    @staticmethod
+    def _rollup_records(transactions: Iterable[Transaction]) -> List[dict]:
+        """
+        Total transactions per (transaction_date, category, type).
+
+        Args:
+            transactions: Stored transactions
+
+        Returns:
+            daily_rollups parameter dictionaries, in key order
+        """
+        totals: Dict[Tuple[date, str, str], List[int]] = {}
+        for transaction in transactions:
+            key = (transaction.transaction_date, transaction.category, transaction.type)
+            total = totals.setdefault(key, [0, 0, 0])
+            total[0] += 1
+            if transaction.amount_cents < 0:
+                total[1] -= transaction.amount_cents
+            else:
+                total[2] += transaction.amount_cents
+        return [
+            {
+                "transaction_date": transaction_date,
+                "category": category,
+                "type": type_value,
+                "transaction_count": count,
+                "spent_cents": spent_cents,
+                "income_cents": income_cents,
+            }
+            for (transaction_date, category, type_value), (count, spent_cents, income_cents)
+            in sorted(totals.items())
+        ]
+
+    async def _apply_rollups(self, records: List[dict]) -> None:
+        """
+        Add totals to daily_rollups, dropping rows whose count reaches zero.
+
+        Records must be in key order: concurrent uploads then lock shared
+        rollup rows in the same order and cannot deadlock on them.
+
+        Args:
+            records: daily_rollups parameter dictionaries, negative to subtract
+        """
+        if not records:
+            return
+        target = DailyRollupDTO.__table__
+        statement = pg_insert(target)
+        result = await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[target.c.transaction_date, target.c.category, target.c.type],
+                set_={
+                    name: target.c[name] + statement.excluded[name]
+                    for name in ("transaction_count", "spent_cents", "income_cents")
+                },
+            ).returning(
+                target.c.transaction_date, target.c.category, target.c.type, target.c.transaction_count
+            ),
+            records,
+        )
+        emptied = [
+            (row.transaction_date, row.category, row.type)
+            for row in result
+            if row.transaction_count == 0
+        ]
+        if emptied:
+            await self.session.execute(
+                delete(target).where(
+                    tuple_(target.c.transaction_date, target.c.category, target.c.type).in_(emptied)
+                )
+            )
+
+    @staticmethod
+    def _upload_stats(
+        transactions: Union[List[TransactionCreate], TransactionBatch],
+        inserted: List[Transaction],
+        record_count: int,
+    ) -> SummaryAccumulator:
+        """
+        Summarize the rows an upload stored.
+
+        A batch's summary was accumulated while it was parsed; it is reused
+        as-is when every row was stored, which is the common case. Otherwise
+        only the inserted rows are summarized.
+
+        Args:
+            transactions: Rows given to create_upload()
+            inserted: Rows actually stored
+            record_count: Number of rows given
+
+        Returns:
+            SummaryAccumulator over the stored rows
+        """
+        if isinstance(transactions, TransactionBatch) and len(inserted) == record_count:
+            return transactions.summary
+        stats = SummaryAccumulator()
+        for transaction in inserted:
+            stats.add(
+                transaction.transaction_date.toordinal(),
+                transaction.category,
+                transaction.type,
+                transaction.amount_cents,
+            )
+        return stats
+
+    async def _claim_upload(
+        self,
+        transaction_count: int,
+        file_hash: Optional[str],
+        file_size: Optional[int] = None,
+    ) -> Optional[Row]:
+        """
+        Insert the uploads row, unless its file hash is already taken.
+
+        Args:
+            transaction_count: Number of transactions in the upload
+            file_hash: SHA-256 hex digest of the uploaded file, if known
+            file_size: Size of the uploaded file in bytes, if known
+
+        Returns:
+            Row with the new upload's id and created_at, or None if the
+            file hash already exists
+        """
+        statement = pg_insert(UploadDTO).values(
+            transaction_count=transaction_count, file_hash=file_hash, file_size=file_size
+        )
+        if file_hash is not None:
+            statement = statement.on_conflict_do_nothing(index_elements=[UploadDTO.file_hash])
+        result = await self.session.execute(
+            statement.returning(UploadDTO.id, UploadDTO.created_at)
+        )
+        return result.one_or_none()
+
+    @staticmethod
+    def _transaction_records(
+        upload_id: int,
+        transactions: List[TransactionCreate],
+        keys: NaturalKeyBuilder,
+    ) -> List[dict]:
         """
-        # Create UploadDTO
-        upload_dto = UploadDTO(transaction_count=len(transactions))
+        Build INSERT parameter dictionaries from TransactionCreate schemas.
+
+        Args:
+            upload_id: ID of the upload the rows belong to
+            transactions: Validated transactions in file order
+            keys: Natural key builder for the upload
 
-        # Create TransactionDTOs
+        Returns:
+            List of column-name to value dictionaries, with natural keys
+        """
+        records = []
         for transaction_data in transactions:
-            transaction_dto = TransactionDTO(
-                transaction_date=transaction_data.transaction_date,
-                post_date=transaction_data.post_date,
-                description=transaction_data.description,
-                category=transaction_data.category,
-                type=transaction_data.type,
-                amount=transaction_data.amount,
-                memo=transaction_data.memo,
+            transaction_date = parse_date(transaction_data.transaction_date)
+            post_date = parse_date(transaction_data.post_date)
+            amount_cents = decimal_to_cents(transaction_data.amount)
+            records.append({
+                "upload_id": upload_id,
+                "transaction_date": transaction_date,
+                "post_date": post_date,
+                "description": transaction_data.description,
+                "category": transaction_data.category,
+                "type": transaction_data.type,
+                "amount_cents": amount_cents,
+                "memo": transaction_data.memo,
+                "natural_key": keys.key(
+                    transaction_date, post_date, transaction_data.description, amount_cents
+                ),
+            })
+        return records
+
+    async def _insert_records(self, records: List[dict]) -> List[Row]:
+        """
+        Bulk insert transactions, skipping rows whose natural key exists.
+
+        Runs as one executemany, which SQLAlchemy batches into multi-row
+        INSERT ... RETURNING statements (insertmanyvalues).
+
+        Args:
+            records: Column-name to value dictionaries
+
+        Returns:
+            Rows with the id and natural_key of each inserted record
+        """
+        if not records:
+            return []
+        target = TransactionDTO.__table__
+        result = await self.session.execute(
+            pg_insert(target)
+            .on_conflict_do_nothing(index_elements=[target.c.natural_key])
+            .returning(target.c.id, target.c.natural_key),
+            records,
+        )
+        return list(result)
+
+    async def _copy_records(
+        self, records: List[dict], progress: Optional[UploadProgress] = None
+    ) -> List[Row]:
+        """
+        Bulk load transactions with COPY, skipping rows whose natural key exists.
+
+        The rows are streamed with binary COPY into a temporary staging
+        table, then moved into transactions with
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING, one chunk at a time so
+        progress can be reported. Everything runs on the session's
+        connection, inside the same transaction as the uploads row, and the
+        staging table is dropped on commit.
+
+        Args:
+            records: Column-name to value dictionaries
+            progress: Upload progress to count persisted rows in, per chunk
+
+        Returns:
+            Rows with the id and natural_key of each inserted record
+        """
+        await self.session.execute(text(f"DROP TABLE IF EXISTS {_STAGING_TABLE}"))
+        await self.session.execute(text(
+            f"CREATE TEMPORARY TABLE {_STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT 0::bigint AS seq, {', '.join(_COPY_COLUMNS)} FROM transactions WITH NO DATA"
+        ))
+
+        staging = table(_STAGING_TABLE, column("seq"), *(column(name) for name in _COPY_COLUMNS))
+        target = TransactionDTO.__table__
+        merge = (
+            pg_insert(target)
+            .from_select(
+                list(_COPY_COLUMNS),
+                # Keep IDs in file order
+                select(*(staging.c[name] for name in _COPY_COLUMNS)).order_by(staging.c.seq),
+            )
+            .on_conflict_do_nothing(index_elements=[target.c.natural_key])
+            .returning(target.c.id, target.c.natural_key)
+        )
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        returned: List[Row] = []
+        for start in range(0, len(records), _COPY_CHUNK_ROWS):
+            chunk = records[start:start + _COPY_CHUNK_ROWS]
+            await raw_connection.driver_connection.copy_records_to_table(
+                _STAGING_TABLE,
+                records=(
+                    (seq, *(record[name] for name in _COPY_COLUMNS))
+                    for seq, record in enumerate(chunk)
+                ),
+                columns=("seq", *_COPY_COLUMNS),
             )
-            upload_dto.transactions.append(transaction_dto)
+            returned.extend(await self.session.execute(merge))
+            await self.session.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
+            if progress is not None:
+                progress.rows_persisted = start + len(chunk)
+        return returned
+
+    @staticmethod
+    def _inserted_transactions(records: List[dict], ids: Dict[bytes, int]) -> List[Transaction]:
+        """
+        Pair returned IDs with the records they came from.
+
+        Natural keys are unique within an upload, so this does not depend
+        on the order RETURNING produces rows in.
 
-        # Save to database
-        self.session.add(upload_dto)
-        await self.session.flush()  # Flush to get IDs assigned
+        Args:
+            records: Column-name to value dictionaries that were inserted
+            ids: ID of each inserted record by natural key
+
+        Returns:
+            Read-only Transactions actually inserted, in record order
+        """
+        return [
+            Transaction.from_record(ids[record["natural_key"]], record)
+            for record in records
+            if record["natural_key"] in ids
+        ]
+
+    async def _row_ids(self, records: List[dict], ids: Dict[bytes, int]) -> List[Optional[int]]:
+        """
+        Get the ID of the stored row behind each record.
+
+        Records skipped as already stored are looked up by natural key.
+
+        Args:
+            records: Column-name to value dictionaries, with natural keys
+            ids: IDs already known by natural key, e.g. of inserted records
 
-        # Eagerly load relationships before converting to domain model
-        await self.session.refresh(
-            upload_dto,
-            attribute_names=["transactions"]
+        Returns:
+            Row IDs in record order; None for a row deleted meanwhile
+        """
+        missing = [record["natural_key"] for record in records if record["natural_key"] not in ids]
+        if missing:
+            result = await self.session.execute(
+                select(TransactionDTO.natural_key, TransactionDTO.id).where(
+                    TransactionDTO.natural_key == any_(bindparam("keys", missing, type_=ARRAY(LargeBinary)))
+                )
+            )
+            ids = {**ids, **dict(result.all())}
+        return [ids.get(record["natural_key"]) for record in records]
+
+    async def get_delta_candidates(
+        self, file_size: int, limit: int = 16
+    ) -> List[UploadFingerprint]:
+        """
+        Get the largest earlier uploads that a file of a given size could extend.
+
+        Args:
+            file_size: Size of the new file in bytes
+            limit: Maximum number of candidates
+
+        Returns:
+            Upload fingerprints, largest file first
+        """
+        result = await self.session.execute(
+            select(UploadDTO.id, UploadDTO.file_hash, UploadDTO.file_size, UploadDTO.row_count)
+            .where(
+                UploadDTO.file_size < file_size,
+                UploadDTO.file_hash.is_not(None),
+                UploadDTO.row_count.is_not(None),
+            )
+            .order_by(UploadDTO.file_size.desc())
+            .limit(limit)
         )
+        return [
+            UploadFingerprint(id=row.id, file_hash=row.file_hash, file_size=row.file_size, row_count=row.row_count)
+            for row in result
+        ]
 
-        # Convert to read-only model BEFORE session closes
-        upload = Upload.from_dto(upload_dto)
+    async def get_upload_by_hash(self, file_hash: str) -> Optional[Upload]:
+        """
+        Get an upload by the hash of its file, without its transactions.
 
-        return upload
+        Args:
+            file_hash: SHA-256 hex digest of the uploaded file
+
+        Returns:
+            Read-only Upload instance with no transactions, or None if not found
+        """
+        row = (await self.session.execute(
+            select(UploadDTO.id, UploadDTO.created_at, UploadDTO.transaction_count)
+            .where(UploadDTO.file_hash == file_hash)
+        )).one_or_none()
+
+        if row is None:
+            return None
+
+        return Upload(
+            id=row.id,
+            created_at=row.created_at,
+            transaction_count=row.transaction_count,
+            transactions=[],
+            file_hash=file_hash,
+        )
 
     async def get_upload(self, upload_id: int) -> Optional[Upload]:
         """
@@ -131,23 +594,272 @@ class UploadsContextManager:
 
         return upload
 
-    async def get_all_uploads(self) -> List[Upload]:
+    async def get_all_uploads(self) -> List[UploadSummary]:
         """
-        Get all uploads with their transactions.
+        Get all uploads, newest first, without their transactions.
 
         Returns:
-            List of read-only Upload instances
+            List of read-only UploadSummary instances
         """
-        # Query database with eager loading of transactions
-        result = await self.session.execute(
-            select(UploadDTO).options(selectinload(UploadDTO.transactions))
+        result = await self.session.execute(select(UploadDTO).order_by(UploadDTO.id.desc()))
+        return [UploadSummary.from_dto(dto) for dto in result.scalars()]
+
+    async def list_upload_summaries(self, limit: int, cursor: Optional[str] = None) -> UploadSummaryPage:
+        """
+        Get one page of uploads, newest first, without their transactions.
+
+        Summaries are read from the statistics stored on each upload at
+        ingest. Transactions of an upload are listed page by page with
+        TransactionsContextManager.list_transactions() and its upload filter.
+
+        Args:
+            limit: Maximum number of uploads in the page
+            cursor: next_cursor of the previous page, None for the first page
+
+        Returns:
+            Read-only UploadSummaryPage
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        # One extra upload tells whether another page follows
+        query = select(UploadDTO).order_by(UploadDTO.id.desc()).limit(limit + 1)
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, (int,))
+            if last_id > INT4_MAX:
+                raise InvalidCursorError("Invalid pagination cursor")
+            query = query.where(UploadDTO.id < last_id)
+
+        result = await self.session.execute(query)
+        summaries = [UploadSummary.from_dto(dto) for dto in result.scalars()]
+
+        next_cursor = encode_cursor((summaries[limit - 1].id,)) if len(summaries) > limit else None
+        return UploadSummaryPage(uploads=summaries[:limit], next_cursor=next_cursor)
+
+    async def get_upload_summary(self, upload_id: int) -> Optional[UploadSummary]:
+        """
+        Get an upload by ID without its transactions.
+
+        Args:
+            upload_id: Upload ID
+
+        Returns:
+            Read-only UploadSummary instance or None if not found
+        """
+        dto = await self.session.get(UploadDTO, upload_id)
+        return UploadSummary.from_dto(dto) if dto is not None else None
+
+    async def delete_upload(self, upload_id: int) -> bool:
+        """
+        Delete an upload and its transactions.
+
+        Rows that later overlapping uploads skipped as duplicates of this
+        upload's rows are moved to the newest of those uploads instead of
+        being deleted, so each upload keeps every transaction of its file;
+        the statistics of uploads receiving rows are recomputed. The daily
+        rollups are reduced by the rows actually deleted, in the same
+        transaction. Ingest jobs that produced the upload are kept, without
+        their link to it.
+
+        Args:
+            upload_id: Upload ID
+
+        Returns:
+            True if the upload was deleted, False if it does not exist
+        """
+        # Serializes concurrent deletes of the same upload
+        locked = await self.session.scalar(
+            select(UploadDTO.id).where(UploadDTO.id == upload_id).with_for_update()
         )
-        upload_dtos = result.scalars().all()
+        if locked is None:
+            return False
 
-        # Convert to read-only models BEFORE session closes
-        uploads = [Upload.from_dto(dto) for dto in upload_dtos]
+        await self._rehome_shared_transactions(upload_id)
 
-        return uploads
+        removed = await self.session.execute(
+            select(
+                TransactionDTO.transaction_date,
+                TransactionDTO.category,
+                TransactionDTO.type,
+                func.count(),
+                func.coalesce(func.sum(-TransactionDTO.amount_cents).filter(TransactionDTO.amount_cents < 0), 0),
+                func.coalesce(func.sum(TransactionDTO.amount_cents).filter(TransactionDTO.amount_cents >= 0), 0),
+            )
+            .where(TransactionDTO.upload_id == upload_id)
+            .group_by(TransactionDTO.transaction_date, TransactionDTO.category, TransactionDTO.type)
+            .order_by(TransactionDTO.transaction_date, TransactionDTO.category, TransactionDTO.type)
+        )
+        await self._apply_rollups([
+            {
+                "transaction_date": transaction_date,
+                "category": category,
+                "type": type_value,
+                "transaction_count": -count,
+                "spent_cents": -spent_cents,
+                "income_cents": -income_cents,
+            }
+            for transaction_date, category, type_value, count, spent_cents, income_cents in removed
+        ])
+
+        await self.session.execute(
+            update(IngestJobDTO).where(IngestJobDTO.upload_id == upload_id).values(upload_id=None)
+        )
+        await self.session.execute(delete(TransactionDTO).where(TransactionDTO.upload_id == upload_id))
+        await self.session.execute(delete(UploadDTO).where(UploadDTO.id == upload_id))
+        return True
+
+    async def _rehome_shared_transactions(self, upload_id: int) -> None:
+        """
+        Move an upload's rows to the newest other upload whose file has them.
+
+        Whether another upload's file contained a row is read from its
+        occurrence index: the row's natural key is (base hash, occurrence),
+        and the file had it if the index counts more than ``occurrence``
+        rows with that base hash. Uploads ingested before occurrence
+        indexes were stored cannot be checked and never receive rows.
+
+        Args:
+            upload_id: ID of the upload about to be deleted
+        """
+        rows = (await self.session.execute(
+            select(
+                TransactionDTO.id,
+                TransactionDTO.transaction_date,
+                TransactionDTO.post_date,
+                TransactionDTO.description,
+                TransactionDTO.amount_cents,
+                TransactionDTO.natural_key,
+            ).where(TransactionDTO.upload_id == upload_id)
+        )).all()
+        if not rows:
+            return
+        own_index = await self.session.scalar(
+            select(UploadDTO.occurrence_index).where(UploadDTO.id == upload_id)
+        )
+        own_index = OccurrenceIndex.from_bytes(own_index) if own_index is not None else None
+
+        base_hashes = [
+            transaction_base_hash(row.transaction_date, row.post_date, row.description, row.amount_cents)
+            for row in rows
+        ]
+        stored_counts = Counter(base_hashes)
+        # (transaction ID, base hash, occurrence) of each row
+        keyed = []
+        for row, base_hash in zip(rows, base_hashes):
+            # Occurrences count the upload's file rows, or only its stored
+            # rows for keys backfilled by migration 0005
+            limit = max(stored_counts[base_hash], own_index.count(base_hash) if own_index is not None else 0)
+            occurrence = find_occurrence(
+                row.natural_key, row.transaction_date, row.post_date, row.description, row.amount_cents, limit
+            )
+            if occurrence is not None:
+                keyed.append((row.id, base_hash, occurrence))
+
+        excluded = {upload_id}
+        while True:
+            owners = await self._claiming_uploads(keyed, excluded)
+            targets = sorted(set(owners.values()))
+            if not targets:
+                return
+            # Keeps the receiving uploads from being deleted concurrently;
+            # one that already was is skipped
+            locked = set((await self.session.scalars(
+                select(UploadDTO.id).where(UploadDTO.id.in_(targets)).order_by(UploadDTO.id).with_for_update()
+            )).all())
+            if locked == set(targets):
+                break
+            excluded |= set(targets) - locked
+
+        moved: Dict[int, List[int]] = {}
+        for transaction_id, target in owners.items():
+            moved.setdefault(target, []).append(transaction_id)
+        for target, transaction_ids in sorted(moved.items()):
+            await self.session.execute(
+                update(TransactionDTO)
+                .where(TransactionDTO.id == any_(bindparam("ids", transaction_ids, type_=ARRAY(Integer))))
+                .values(upload_id=target)
+            )
+        await self._refresh_upload_stats(targets)
+
+    async def _claiming_uploads(
+        self, keyed: List[Tuple[int, int, int]], excluded: Iterable[int]
+    ) -> Dict[int, int]:
+        """
+        Find the newest upload whose file contains each row.
+
+        Args:
+            keyed: (transaction ID, base hash, occurrence) of the rows
+            excluded: IDs of uploads not to consider
+
+        Returns:
+            Upload ID by transaction ID, for rows some upload contains
+        """
+        owners: Dict[int, int] = {}
+        remaining = keyed
+        # One occurrence index in memory at a time
+        result = await self.session.stream(
+            select(UploadDTO.id, UploadDTO.occurrence_index)
+            .where(UploadDTO.occurrence_index.is_not(None), UploadDTO.id.not_in(list(excluded)))
+            .order_by(UploadDTO.id.desc())
+            .execution_options(yield_per=64)
+        )
+        try:
+            async for candidate_id, data in result:
+                index = OccurrenceIndex.from_bytes(data)
+                unclaimed = []
+                for entry in remaining:
+                    if index.count(entry[1]) > entry[2]:
+                        owners[entry[0]] = candidate_id
+                    else:
+                        unclaimed.append(entry)
+                remaining = unclaimed
+                if not remaining:
+                    break
+        finally:
+            await result.close()
+        return owners
+
+    async def _refresh_upload_stats(self, upload_ids: List[int]) -> None:
+        """
+        Recompute the stored statistics of uploads from their transactions.
+
+        Args:
+            upload_ids: Upload IDs
+        """
+        groups = await self.session.execute(
+            select(
+                TransactionDTO.upload_id,
+                TransactionDTO.category,
+                TransactionDTO.type,
+                func.min(TransactionDTO.transaction_date),
+                func.max(TransactionDTO.transaction_date),
+                func.count(),
+                func.coalesce(func.sum(-TransactionDTO.amount_cents).filter(TransactionDTO.amount_cents < 0), 0),
+                func.coalesce(func.sum(TransactionDTO.amount_cents).filter(TransactionDTO.amount_cents >= 0), 0),
+            )
+            .where(TransactionDTO.upload_id == any_(bindparam("upload_ids", upload_ids, type_=ARRAY(Integer))))
+            .group_by(TransactionDTO.upload_id, TransactionDTO.category, TransactionDTO.type)
+        )
+        stats = {upload_id: SummaryAccumulator() for upload_id in upload_ids}
+        for upload_id, category, type_value, first, last, count, spent_cents, income_cents in groups:
+            # sum() of bigint is numeric
+            stats[upload_id].add_group(
+                first.toordinal(), last.toordinal(), category, type_value, count, int(spent_cents), int(income_cents)
+            )
+        for upload_id, summary in stats.items():
+            await self.session.execute(
+                update(UploadDTO)
+                .where(UploadDTO.id == upload_id)
+                .values(
+                    transaction_count=summary.count,
+                    total_spent_cents=summary.spent_cents,
+                    total_income_cents=summary.income_cents,
+                    min_transaction_date=summary.min_date,
+                    max_transaction_date=summary.max_date,
+                    category_count=len(summary.category_totals),
+                    category_totals=summary.category_totals,
+                )
+            )
 
     async def get_transactions_by_upload(
         self, upload_id: int
@@ -161,9 +873,9 @@ class UploadsContextManager:
         Returns:
             List of read-only Transaction instances
         """
-        # Query database
+        # Query database, in the order the rows were ingested
         result = await self.session.execute(
-            select(TransactionDTO).where(TransactionDTO.upload_id == upload_id)
+            select(TransactionDTO).where(TransactionDTO.upload_id == upload_id).order_by(TransactionDTO.id)
         )
         transaction_dtos = result.scalars().all()
 
@@ -171,3 +883,289 @@ class UploadsContextManager:
         transactions = [Transaction.from_dto(dto) for dto in transaction_dtos]
 
         return transactions
+
+
+class TransactionsContextManager(SessionContextManager):
+    """
+    Async context manager for listing stored transactions.
+
+    Listings are filtered and sorted by TransactionQueryBuilder and
+    keyset-paginated: each page seeks past the last row of the previous
+    one through an index, so every page costs the same however deep it is.
+    """
+
+    async def list_transactions(
+        self,
+        query: TransactionListQuery,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        """
+        Get one page of a filtered, sorted transaction listing.
+
+        The filtered count and amount sum are only computed for the first
+        page; they do not change as the client follows the cursors.
+
+        Args:
+            query: Validated filters and sort order
+            limit: Maximum number of transactions in the page
+            cursor: next_cursor of the previous page, None for the first page
+
+        Returns:
+            Read-only TransactionPage
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another sort
+        """
+        builder = TransactionQueryBuilder(query)
+        result = await self.session.execute(builder.page(limit, cursor))
+        rows = result.all()
+
+        transactions = [Transaction.from_dto(row[0]) for row in rows[:limit]]
+        next_cursor = builder.cursor_after(rows[limit - 1][1:]) if len(rows) > limit else None
+
+        total_count = total_amount_cents = None
+        if cursor is None:
+            total_count, total_amount_cents = (await self.session.execute(builder.totals())).one()
+        return TransactionPage(
+            transactions=transactions,
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_amount_cents=total_amount_cents,
+        )
+
+
+class AnalyticsContextManager(SessionContextManager):
+    """
+    Async context manager for analytics over stored transactions.
+
+    Analytics read the daily rollups maintained by UploadsContextManager,
+    never the transactions table, so their cost depends on the number of
+    days, categories and types in range rather than on the number of rows.
+    """
+
+    async def get_summary(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> SummaryAccumulator:
+        """
+        Summarize the transactions in a date range.
+
+        Args:
+            start_date: Earliest transaction date to include, None for no bound
+            end_date: Latest transaction date to include, None for no bound
+
+        Returns:
+            SummaryAccumulator over the transactions in range
+        """
+        rollup = DailyRollupDTO
+        query = select(
+            rollup.category,
+            rollup.type,
+            func.min(rollup.transaction_date),
+            func.max(rollup.transaction_date),
+            func.sum(rollup.transaction_count),
+            func.sum(rollup.spent_cents),
+            func.sum(rollup.income_cents),
+        ).group_by(rollup.category, rollup.type)
+        if start_date is not None:
+            query = query.where(rollup.transaction_date >= start_date)
+        if end_date is not None:
+            query = query.where(rollup.transaction_date <= end_date)
+
+        summary = SummaryAccumulator()
+        for category, type_value, first, last, count, spent_cents, income_cents in await self.session.execute(query):
+            summary.add_group(
+                first.toordinal(), last.toordinal(), category, type_value,
+                int(count), int(spent_cents), int(income_cents),
+            )
+        return summary
+
+
+class IngestJobsContextManager(SessionContextManager):
+    """
+    Async context manager for IngestJob database operations.
+
+    Jobs form a durable queue in Postgres: workers claim them with
+    SELECT ... FOR UPDATE SKIP LOCKED, so concurrent workers never pick the
+    same job, and each claim is a lease that another worker may take over
+    once it expires (e.g. after a crash).
+
+    Usage:
+        async with IngestJobsContextManager() as db:
+            job = await db.create_job(filename, chunks)
+    """
+
+    async def create_job(self, filename: str, chunks: AsyncIterator[bytes]) -> IngestJob:
+        """
+        Queue an uploaded file for ingestion.
+
+        The file is streamed into a large object chunk by chunk, in the
+        same transaction as the job row, so it is never held in memory.
+
+        Args:
+            filename: Uploaded file name
+            chunks: Raw uploaded bytes
+
+        Returns:
+            Read-only IngestJob instance
+        """
+        content_oid = await self.session.scalar(select(func.lo_create(0)))
+        size = 0
+        async for chunk in chunks:
+            await self.session.execute(select(func.lo_put(content_oid, size, chunk)))
+            size += len(chunk)
+
+        job_dto = IngestJobDTO(filename=filename, file_size=size, content_oid=content_oid)
+        self.session.add(job_dto)
+        await self.session.flush()
+        return IngestJob.from_dto(job_dto)
+
+    async def claim_job(self, lease_seconds: int) -> Optional[IngestJob]:
+        """
+        Claim the oldest queued job, or a running job whose lease expired.
+
+        Args:
+            lease_seconds: How long the claim is held before others may retake it
+
+        Returns:
+            Claimed job, or None if no job is available
+        """
+        now = datetime.utcnow()
+        running = [IngestJobStatus.PARSING.value, IngestJobStatus.PERSISTING.value]
+        candidate = (
+            select(IngestJobDTO.id)
+            .where(or_(
+                IngestJobDTO.status == IngestJobStatus.QUEUED.value,
+                and_(IngestJobDTO.status.in_(running), IngestJobDTO.lease_expires_at < now),
+            ))
+            .order_by(IngestJobDTO.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(IngestJobDTO)
+            .where(IngestJobDTO.id == candidate)
+            .values(
+                status=IngestJobStatus.PARSING.value,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=IngestJobDTO.attempts + 1,
+                error=None,
+            )
+            .returning(IngestJobDTO)
+        )
+        job_dto = result.scalar_one_or_none()
+        if job_dto is None:
+            return None
+        return IngestJob.from_dto(job_dto)
+
+    async def read_job_content(self, job_id: int) -> AsyncIterator[bytes]:
+        """
+        Stream a job's stored file.
+
+        Args:
+            job_id: IngestJob ID
+
+        Yields:
+            Chunks of at most settings.ingest_job_chunk_size bytes
+        """
+        row = (await self.session.execute(
+            select(IngestJobDTO.content_oid, IngestJobDTO.file_size).where(IngestJobDTO.id == job_id)
+        )).one()
+        chunk_size = settings.ingest_job_chunk_size
+        for offset in range(0, row.file_size, chunk_size):
+            yield await self.session.scalar(select(func.lo_get(row.content_oid, offset, chunk_size)))
+
+    async def mark_job_persisting(self, job_id: int, rows_parsed: int, lease_seconds: int) -> None:
+        """
+        Record that a job's file was parsed, renewing its lease.
+
+        Args:
+            job_id: IngestJob ID
+            rows_parsed: Number of rows parsed from the file
+            lease_seconds: Lease extension from now
+        """
+        await self.session.execute(
+            update(IngestJobDTO)
+            .where(IngestJobDTO.id == job_id)
+            .values(
+                status=IngestJobStatus.PERSISTING.value,
+                rows_parsed=rows_parsed,
+                lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds),
+            )
+        )
+
+    async def complete_job(self, job_id: int, upload: Upload) -> None:
+        """
+        Mark a job succeeded and drop its stored file.
+
+        Args:
+            job_id: IngestJob ID
+            upload: Upload the job's file was stored as
+        """
+        await self.session.execute(
+            select(func.lo_unlink(IngestJobDTO.content_oid))
+            .where(IngestJobDTO.id == job_id, IngestJobDTO.content_oid.is_not(None))
+        )
+        await self.session.execute(
+            update(IngestJobDTO)
+            .where(IngestJobDTO.id == job_id)
+            .values(
+                status=IngestJobStatus.SUCCEEDED.value,
+                finished_at=datetime.utcnow(),
+                lease_expires_at=None,
+                rows_inserted=0 if upload.duplicate else upload.transaction_count,
+                rows_duplicate=upload.duplicate_transaction_count,
+                upload_id=upload.id,
+                content_oid=None,
+            )
+        )
+
+    async def retry_job(self, job_id: int, error: str) -> None:
+        """
+        Put a job whose attempt failed transiently back in the queue.
+
+        Args:
+            job_id: IngestJob ID
+            error: Error of the failed attempt, reported until the job finishes
+        """
+        await self.session.execute(
+            update(IngestJobDTO)
+            .where(IngestJobDTO.id == job_id)
+            .values(status=IngestJobStatus.QUEUED.value, lease_expires_at=None, error=error)
+        )
+
+    async def fail_job(self, job_id: int, error: str) -> None:
+        """
+        Mark a job failed, keeping its file for inspection.
+
+        Args:
+            job_id: IngestJob ID
+            error: Error message to report
+        """
+        await self.session.execute(
+            update(IngestJobDTO)
+            .where(IngestJobDTO.id == job_id)
+            .values(
+                status=IngestJobStatus.FAILED.value,
+                finished_at=datetime.utcnow(),
+                lease_expires_at=None,
+                error=error,
+            )
+        )
+
+    async def get_job(self, job_id: int) -> Optional[IngestJob]:
+        """
+        Get an ingest job by ID.
+
+        Args:
+            job_id: IngestJob ID
+
+        Returns:
+            Read-only IngestJob instance or None if not found
+        """
+        job_dto = await self.session.get(IngestJobDTO, job_id)
+        if not job_dto:
+            return None
+        return IngestJob.from_dto(job_dto)
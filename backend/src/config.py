@@ -2,7 +2,7 @@
 
 import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Literal
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -62,7 +62,40 @@ class Settings(BaseSettings):
     cors_origins: list[str] = ["http://localhost:3000"]
 
     # File Upload
-    max_upload_size: int = 10 * 1024 * 1024  # 10MB in bytes
+    max_upload_size: int = 10 * 1024 * 1024  # 10MB in bytes, enforced while the body streams in
+    upload_spool_threshold: int = 1024 * 1024  # Uploaded files above 1MB are spooled to disk
+    max_decompression_ratio: int = 100  # Reject compressed uploads inflating beyond 100x
+    max_decompressed_size: int = 100 * 1024 * 1024  # Reject compressed uploads inflating beyond 100MB
+    progress_event_interval: float = 0.25  # Seconds between upload progress events
+    upload_session_dir: Optional[str] = None  # Chunked uploads are received here, defaults to a temp dir; must be shared by all workers
+    upload_session_ttl_seconds: int = 3600  # Chunked uploads idle this long are discarded
+
+    # CSV Parsing
+    parallel_parse_threshold: int = 4 * 1024 * 1024  # Parse on a process pool above 4MB
+    parse_workers: Optional[int] = None  # Process pool size, defaults to CPU count
+
+    # Parse Cache
+    parse_cache_max_bytes: int = 64 * 1024 * 1024  # In-process LRU budget
+    parse_cache_dir: Optional[str] = None  # Enables the on-disk tier when set
+    parse_cache_disk_max_bytes: int = 1024 * 1024 * 1024  # 1GB on-disk budget
+
+    # Ingestion
+    copy_ingest_threshold: int = 10_000  # Load uploads with this many rows via COPY
+    max_batch_files: int = 24  # Files accepted by one batch upload
+    max_batch_upload_size: int = 50 * 1024 * 1024  # 50MB per batch request body
+    batch_ingest_concurrency: int = 4  # Files of a batch stored at once, one session each
+
+    # Pagination
+    default_page_size: int = 50  # Transactions per page when no limit is given
+    max_page_size: int = 500
+
+    # Ingest Jobs
+    ingest_worker_enabled: bool = True  # Run the job worker pool inside the API process
+    ingest_workers: int = 2  # Jobs processed concurrently per process
+    ingest_poll_interval: float = 2.0  # Seconds between queue polls when idle
+    ingest_job_lease_seconds: int = 300  # Claimed jobs are retaken after this long
+    ingest_job_max_attempts: int = 3  # Fail a job after this many claims
+    ingest_job_chunk_size: int = 1024 * 1024  # Job files are stored and read back 1MB at a time
 
 
 settings = Settings()
@@ -0,0 +1,127 @@
+"""Multipart form parsing for the upload endpoints."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import FormData, UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+from src.config import settings
+
+
+class SpoolingMultiPartParser(MultiPartParser):
+    """Multipart parser spooling uploaded files to disk above the configured threshold."""
+
+    spool_max_size = settings.upload_spool_threshold
+
+
+async def _parse_form(request: Request) -> FormData:
+    """
+    Parse a multipart request body.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Parsed form; the caller must close it
+
+    Raises:
+        HTTPException: If the body is not a valid multipart form
+    """
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Request body must be multipart/form-data")
+    parser = SpoolingMultiPartParser(request.headers, request.stream())
+    try:
+        return await parser.parse()
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+
+@asynccontextmanager
+async def _uploaded_files(request: Request, field: str) -> AsyncIterator[List[UploadFile]]:
+    """
+    Parse a multipart request body and get the files of one field.
+
+    Args:
+        request: Incoming request
+        field: Form field name
+
+    Yields:
+        Uploaded files, closed on exit
+
+    Raises:
+        RequestValidationError: If the field holds no files
+    """
+    form = await _parse_form(request)
+    try:
+        files = [value for value in form.getlist(field) if isinstance(value, UploadFile)]
+        if not files:
+            raise RequestValidationError(
+                [{"type": "missing", "loc": ("body", field), "msg": "Field required", "input": None}]
+            )
+        yield files
+    finally:
+        await form.close()
+
+
+def upload_files(field: str) -> Callable[[Request], AsyncIterator[List[UploadFile]]]:
+    """
+    Build a dependency providing the files uploaded under a form field.
+
+    The request body is parsed here rather than by FastAPI's ``File``
+    parameters so files are spooled with ``settings.upload_spool_threshold``.
+
+    Args:
+        field: Form field name
+
+    Returns:
+        Dependency yielding the uploaded files
+    """
+    async def dependency(request: Request) -> AsyncIterator[List[UploadFile]]:
+        async with _uploaded_files(request, field) as files:
+            yield files
+
+    return dependency
+
+
+def upload_file(field: str) -> Callable[[Request], AsyncIterator[UploadFile]]:
+    """
+    Build a dependency providing the file uploaded under a form field.
+
+    Args:
+        field: Form field name
+
+    Returns:
+        Dependency yielding the first uploaded file
+    """
+    async def dependency(request: Request) -> AsyncIterator[UploadFile]:
+        async with _uploaded_files(request, field) as files:
+            yield files[0]
+
+    return dependency
+
+
+def multipart_body(field: str, many: bool = False) -> dict:
+    """
+    Build the OpenAPI request body of an endpoint parsing its own upload form.
+
+    Args:
+        field: Form field name
+        many: Whether the field holds several files
+
+    Returns:
+        Value for the route's ``openapi_extra``
+    """
+    schema = {"type": "string", "format": "binary"}
+    if many:
+        schema = {"type": "array", "items": schema}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {"type": "object", "properties": {field: schema}, "required": [field]}
+                }
+            },
+        }
+    }
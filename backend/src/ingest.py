@@ -0,0 +1,227 @@
+"""Upload ingestion pipeline shared by the upload endpoint and the ingest worker."""
+
+import asyncio
+import logging
+import mmap
+import os
+from dataclasses import dataclass
+from fastapi import UploadFile
+from sqlalchemy.exc import DBAPIError
+from typing import List, Optional
+from src.api import UploadsContextManager
+from src.config import settings
+from src.models import Upload, UploadFingerprint
+from src.services.csv_parser import CSVParser
+from src.services.decompression import DecompressionBombError, is_compressed_upload, open_decompressed
+from src.services.delta import digest_with_prefixes, find_delta_base
+from src.services.parse_cache import parse_cache
+from src.services.progress import UploadProgress, UploadStage
+from src.services.transaction_batch import TransactionBatch
+
+logger = logging.getLogger(__name__)
+
+UNSUPPORTED_FILE_MESSAGE = "File must be a CSV (optionally compressed as .csv.gz, .csv.zst or .zip)"
+
+# SQLSTATE Postgres reports when it aborts a transaction to break a deadlock
+_DEADLOCK_DETECTED = "40P01"
+_STORE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class ParsedUpload:
+    """Result of parsing an uploaded file, ready to be stored."""
+
+    batch: TransactionBatch
+    digest: str  # SHA-256 of the file
+    base: Optional[UploadFingerprint] = None  # Set when only appended rows were parsed
+
+
+@dataclass(frozen=True)
+class IngestResult:
+    """Outcome of ingesting one file of a batch."""
+
+    filename: str
+    parsed: Optional[ParsedUpload] = None
+    upload: Optional[Upload] = None
+    error: Optional[str] = None
+
+
+def is_supported_upload(filename: str) -> bool:
+    """
+    Check whether a file name has an accepted upload suffix.
+
+    Args:
+        filename: Uploaded file name
+
+    Returns:
+        True for .csv files and supported compressed CSVs
+    """
+    filename = filename.lower()
+    return filename.endswith(".csv") or is_compressed_upload(filename)
+
+
+async def parse_upload(
+    file: UploadFile, progress: Optional[UploadProgress] = None, pooled: bool = False
+) -> ParsedUpload:
+    """
+    Parse an uploaded file into columns.
+
+    Identical re-uploads (e.g. browser retries) are served from the parse
+    cache at the cost of hashing the bytes. Plain CSVs that extend the
+    file of an earlier upload only have their appended rows parsed.
+
+    Args:
+        file: Uploaded file, spooled by the multipart parser
+        progress: Upload progress to report parsing in
+        pooled: Parse plain CSVs on the process pool whatever their size,
+            so files parsed at the same time use separate cores
+
+    Returns:
+        ParsedUpload
+
+    Raises:
+        CSVParseError: If the CSV is invalid
+        UploadFormatError: If a compressed upload cannot be read
+    """
+    filename = file.filename.lower()
+    progress = progress if progress is not None else UploadProgress()
+    progress.stage = UploadStage.PARSING
+
+    # Plain CSVs may be a re-export of an earlier upload with rows appended
+    candidates = []
+    if file.size and not is_compressed_upload(filename):
+        async with UploadsContextManager() as db:
+            candidates = await db.get_delta_candidates(file.size)
+
+    # The same pass hashes the prefixes matching the candidates' sizes
+    digest, prefixes = await asyncio.to_thread(
+        digest_with_prefixes, file.file, [c.file_size for c in candidates]
+    )
+    batch = await parse_cache.get(digest)
+    if batch is not None:
+        parsed = ParsedUpload(batch=batch, digest=digest)
+    else:
+        base = await asyncio.to_thread(find_delta_base, file.file, candidates, prefixes)
+        if base is not None:
+            # Only the appended rows are parsed; they are not cached as they
+            # are not the parse of the whole file
+            batch = await asyncio.to_thread(_parse_delta, file, base)
+            parsed = ParsedUpload(batch=batch, digest=digest, base=base)
+        else:
+            batch = await _parse_file(file, filename, progress, pooled)
+            await parse_cache.put(digest, batch)
+            parsed = ParsedUpload(batch=batch, digest=digest)
+
+    progress.rows_parsed = progress.rows_total = len(parsed.batch)
+    return parsed
+
+
+async def store_upload(
+    file: UploadFile, parsed: ParsedUpload, progress: Optional[UploadProgress] = None
+) -> Upload:
+    """
+    Persist a parsed upload.
+
+    A file that was already ingested resolves to its existing upload, and
+    rows already stored from overlapping statements are skipped.
+
+    Args:
+        file: The uploaded file the batch was parsed from
+        parsed: Result of parse_upload()
+        progress: Upload progress to report persisting in
+
+    Returns:
+        Read-only Upload instance
+    """
+    if progress is not None:
+        progress.stage = UploadStage.PERSISTING
+    for attempt in range(1, _STORE_ATTEMPTS + 1):
+        try:
+            async with UploadsContextManager() as db:
+                return await db.create_upload(
+                    parsed.batch,
+                    file_hash=parsed.digest,
+                    file_size=file.size,
+                    base_upload_id=parsed.base.id if parsed.base is not None else None,
+                    progress=progress,
+                )
+        except DBAPIError as e:
+            # Concurrent uploads of overlapping statements insert the same
+            # natural keys; if Postgres aborts one to break a deadlock on
+            # the unique index, its whole transaction is simply retried
+            if getattr(e.orig, "sqlstate", None) != _DEADLOCK_DETECTED or attempt == _STORE_ATTEMPTS:
+                raise
+            logger.warning("Deadlock storing %s, retrying", file.filename)
+
+
+async def ingest_files(files: List[UploadFile]) -> List[IngestResult]:
+    """
+    Parse and store several uploaded files concurrently.
+
+    Files are parsed on the process pool, at most one per pool worker at a
+    time, and each parsed file is stored as soon as it is ready, in its own
+    session, with at most settings.batch_ingest_concurrency stored at once.
+    A file failing does not affect the others.
+
+    Args:
+        files: Uploaded files, spooled by the multipart parser
+
+    Returns:
+        One IngestResult per file, in the order given
+    """
+    parse_slots = asyncio.Semaphore(settings.parse_workers or os.cpu_count() or 1)
+    store_slots = asyncio.Semaphore(settings.batch_ingest_concurrency)
+
+    async def ingest(file: UploadFile) -> IngestResult:
+        if not is_supported_upload(file.filename):
+            return IngestResult(file.filename, error=UNSUPPORTED_FILE_MESSAGE)
+        if file.size is not None and file.size > settings.max_upload_size:
+            return IngestResult(
+                file.filename, error=f"Upload exceeds maximum size of {settings.max_upload_size} bytes"
+            )
+
+        try:
+            async with parse_slots:
+                parsed = await parse_upload(file, pooled=True)
+        except DecompressionBombError as e:
+            return IngestResult(file.filename, error=str(e))
+        except Exception as e:
+            return IngestResult(file.filename, error=f"Error parsing CSV: {str(e)}")
+
+        try:
+            async with store_slots:
+                upload = await store_upload(file, parsed)
+        except Exception as e:
+            logger.exception("Storing %s failed", file.filename)
+            return IngestResult(file.filename, parsed=parsed, error=str(e))
+        return IngestResult(file.filename, parsed=parsed, upload=upload)
+
+    return list(await asyncio.gather(*(ingest(file) for file in files)))
+
+
+async def _parse_file(
+    file: UploadFile, filename: str, progress: UploadProgress, pooled: bool = False
+) -> TransactionBatch:
+    """Parse an upload into columns, picking the strategy from its name and size."""
+    parser = CSVParser()
+    # Compressed uploads are decompressed as they stream into the parser
+    if is_compressed_upload(filename):
+        return await parser.parse_stream_columnar(open_decompressed(filename, file.file), progress=progress)
+    # Large uploads are already spooled to disk: map the file instead of
+    # reading it into memory, and fan out over the process pool
+    if file.size is not None and file.size > settings.parallel_parse_threshold:
+        with mmap.mmap(file.file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return await parser.parse_parallel(content, progress=progress)
+    # Pooled small files go to the process pool as a single range
+    if pooled and file.size:
+        with mmap.mmap(file.file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return await parser.parse_parallel(content, workers=1, threshold=0, progress=progress)
+    # Everything else is parsed incrementally from the upload stream
+    return await parser.parse_stream_columnar(file, progress=progress)
+
+
+def _parse_delta(file: UploadFile, base: UploadFingerprint) -> TransactionBatch:
+    """Parse only the rows an upload appends to the file of an earlier upload."""
+    with mmap.mmap(file.file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        # Row numbers in errors count the header and the base file's rows
+        return CSVParser().parse_suffix(content, base.file_size, base.row_count + 2)
@@ -1,14 +1,84 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Path, Query, Request, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from src.services.csv_parser import CSVParser
+from fastapi.responses import StreamingResponse
+from src.api import (
+    AnalyticsContextManager,
+    IngestJobsContextManager,
+    TransactionsContextManager,
+    UploadsContextManager,
+)
+from src.config import settings
+from src.forms import multipart_body, upload_file, upload_files
+from src.ingest import (
+    UNSUPPORTED_FILE_MESSAGE,
+    ParsedUpload,
+    ingest_files,
+    is_supported_upload,
+    parse_upload,
+    store_upload,
+)
+from src.middleware import UploadProgressMiddleware, UploadSizeLimitMiddleware
+from src.models import Transaction, Upload, UploadSummary
+from src.schemas import AnalyticsQuery, TransactionPageQuery, UploadSessionCreate
+from src.services.csv_parser import CSVParseError
+from src.services.decompression import DecompressionBombError
+from src.services.money import cents_to_float
+from src.services.pagination import INT4_MAX, InvalidCursorError
+from src.services.parse_cache import parse_cache
+from src.services.progress import UploadProgress, progress_registry
+from src.services.summary import SummaryAccumulator
+from src.services.upload_sessions import (
+    UploadOffsetError,
+    UploadSession,
+    UploadSessionError,
+    UploadSessionNotFoundError,
+    UploadSessionTooLargeError,
+    parse_content_range,
+    upload_sessions,
+)
+from src.worker import ingest_worker
+from typing import Annotated, AsyncIterator, List, Optional
 import io
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the ingest job worker pool alongside the API."""
+    if settings.ingest_worker_enabled:
+        ingest_worker.start()
+    yield
+    await ingest_worker.stop()
+
+
 app = FastAPI(
     title="clariFi API",
     description="Personal finance application for analyzing credit card spending patterns",
     version="0.1.0",
+    lifespan=lifespan,
+)
+
+# Count upload bytes as they arrive, for clients following progress events
+app.add_middleware(
+    UploadProgressMiddleware,
+    registry=progress_registry,
+    paths=["/api/transactions/upload"],
+)
+
+# Enforce the upload size limit while the body streams in (added first so
+# CORS headers still wrap its 413 responses)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.max_upload_size,
+    paths=["/api/transactions/upload", "/api/ingest-jobs"],
+)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.max_batch_upload_size,
+    paths=["/api/transactions/upload/batch"],
 )
 
 # Configure CORS
@@ -37,73 +107,438 @@ async def health_check():
     return {"status": "healthy"}
 
 
-@app.post("/api/transactions/upload")
-async def upload_transactions(file: UploadFile = File(...)):
-    """Upload and parse CSV transactions."""
-    if not file.filename.lower().endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV")
+@app.post("/api/transactions/upload", openapi_extra=multipart_body("file"))
+async def upload_transactions(
+    file: UploadFile = Depends(upload_file("file")),
+    progress_id: Optional[str] = Query(None, alias="progressId"),
+):
+    """
+    Upload and parse CSV transactions.
+
+    Clients wanting progress pass a unique ``progressId`` and follow
+    /api/transactions/upload/progress/{progressId} while the request runs.
+    """
+    progress = progress_registry.start(progress_id) if progress_id else UploadProgress()
+    
+    if not is_supported_upload(file.filename):
+        progress.finish(error=UNSUPPORTED_FILE_MESSAGE)
+        raise HTTPException(status_code=400, detail=UNSUPPORTED_FILE_MESSAGE)
     
     try:
-        # Read file content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Parse CSV
-        parser = CSVParser()
-        transactions = parser.parse(csv_content)
-        
-        # Calculate summary
-        total_spent = sum(abs(float(t.amount)) for t in transactions if float(t.amount) < 0)
-        total_income = sum(float(t.amount) for t in transactions if float(t.amount) > 0)
-        net_amount = total_income - total_spent
-        transaction_count = len(transactions)
-        avg_transaction = (total_income + total_spent) / transaction_count if transaction_count > 0 else 0
-        
-        summary = {
-            "totalSpent": total_spent,
-            "totalIncome": total_income,
-            "netAmount": net_amount,
-            "transactionCount": transaction_count,
-            "avgTransactionAmount": avg_transaction
+        parsed = await parse_upload(file, progress)
+    except DecompressionBombError as e:
+        progress.finish(error=str(e))
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        progress.finish(error=f"Error parsing CSV: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Error parsing CSV: {str(e)}")
+    
+    try:
+        upload = await store_upload(file, parsed, progress)
+    except Exception as e:
+        progress.finish(error=str(e))
+        raise
+    progress.finish()
+    return _upload_response(upload, parsed)
+
+
+def _upload_response(upload: Upload, parsed: ParsedUpload) -> dict:
+    """Build the response of an upload from its stored Upload and parse result."""
+    batch, base = parsed.batch, parsed.base
+    
+    # Summary was accumulated while the rows were parsed
+    summary = batch.summary.to_response()
+    
+    # Convert transactions to dict format
+    # IDs of the stored rows, whether this upload or an earlier one stored them
+    transactions_data = [
+        {
+            "id": str(row_id) if row_id is not None else None,
+            "date": t.transaction_date,  # Use transaction_date field
+            "description": t.description,
+            "amount": cents_to_float(t.amount_cents),
+            "category": t.category,
+            "type": "debit" if t.amount_cents < 0 else "credit"
         }
-        
-        # Convert transactions to dict format
-        transactions_data = [
-            {
-                "id": str(hash(f"{t.transaction_date}{t.description}{t.amount}")),  # Generate ID from data
-                "date": t.transaction_date,  # Use transaction_date field
-                "description": t.description,
-                "amount": float(t.amount),
-                "category": t.category,
-                "type": "debit" if float(t.amount) < 0 else "credit"
-            }
-            for t in transactions
-        ]
-        
-        return {
+        for t, row_id in zip(batch.iter_rows(), upload.row_ids, strict=True)
+    ]
+    
+    message = f"Successfully parsed {len(batch)} transactions"
+    if upload.duplicate:
+        message += " (file was already uploaded)"
+    elif base is not None:
+        message += f" appended since upload {base.id}"
+    
+    return {
+        "success": True,
+        "message": message,
+        **_upload_counts(upload, parsed),
+        "transactions": transactions_data,
+        "summary": summary
+    }
+
+
+def _upload_counts(upload: Upload, parsed: ParsedUpload) -> dict:
+    """Build the outcome fields shared by single and batch upload responses."""
+    base = parsed.base
+    return {
+        "uploadId": upload.id,
+        "duplicate": upload.duplicate,
+        "newCount": 0 if upload.duplicate else upload.transaction_count,
+        "duplicateCount": upload.duplicate_transaction_count,
+        # Set when only the rows appended to an earlier upload's file were parsed
+        "delta": {"baseUploadId": base.id, "skippedRows": base.row_count} if base is not None else None,
+    }
+
+
+@app.post("/api/transactions/upload/batch", openapi_extra=multipart_body("files", many=True))
+async def upload_transactions_batch(files: List[UploadFile] = Depends(upload_files("files"))):
+    """
+    Upload and parse several CSV files at once.
+
+    Files are parsed and stored concurrently; each gets its own result,
+    and one failing file does not fail the others. The combined summary
+    covers the rows the batch stored, so rows shared by overlapping
+    statements are counted once.
+    """
+    if len(files) > settings.max_batch_files:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.max_batch_files} files can be uploaded at once"
+        )
+    
+    results = await ingest_files(files)
+    
+    summary = SummaryAccumulator()
+    file_results = []
+    for result in results:
+        if result.error is not None:
+            file_results.append({"filename": result.filename, "success": False, "error": result.error})
+            continue
+        # Rows skipped as duplicates of another file are counted once, by
+        # the upload that stored them
+        if not result.upload.duplicate:
+            for transaction in result.upload.transactions:
+                summary.add(
+                    transaction.transaction_date.toordinal(),
+                    transaction.category,
+                    transaction.type,
+                    transaction.amount_cents,
+                )
+        file_results.append({
+            "filename": result.filename,
             "success": True,
-            "message": f"Successfully parsed {len(transactions)} transactions",
-            "transactions": transactions_data,
-            "summary": summary
-        }
-        
-    except Exception as e:
+            **_upload_counts(result.upload, result.parsed),
+            "transactionCount": len(result.parsed.batch),
+            "summary": result.parsed.batch.summary.to_response(),
+        })
+    
+    succeeded = sum(1 for result in file_results if result["success"])
+    return {
+        "success": succeeded == len(file_results),
+        "message": f"Successfully ingested {succeeded} of {len(file_results)} files",
+        "newCount": sum(result.get("newCount", 0) for result in file_results),
+        "duplicateCount": sum(result.get("duplicateCount", 0) for result in file_results),
+        "files": file_results,
+        "summary": summary.to_response(),
+    }
+
+
+@app.post("/api/transactions/upload/sessions", status_code=201)
+async def create_upload_session(request: UploadSessionCreate):
+    """
+    Start a resumable upload.
+
+    The file is then sent as byte ranges with PUT, each parsed as it
+    arrives, and ingested by POSTing to the session's finalize URL.
+    """
+    if not is_supported_upload(request.filename):
+        raise HTTPException(status_code=400, detail=UNSUPPORTED_FILE_MESSAGE)
+    try:
+        session = await upload_sessions.create(request.filename, request.size)
+    except UploadSessionTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    return {
+        "sessionId": session.id,
+        "offset": session.offset,
+        "uploadUrl": f"/api/transactions/upload/sessions/{session.id}",
+    }
+
+
+@app.get("/api/transactions/upload/sessions/{session_id}")
+async def get_upload_session(session_id: str):
+    """Get how much of a resumable upload was received, to resume it."""
+    session = await _get_upload_session(session_id)
+    try:
+        # Ranges may have been received by another worker
+        await session.refresh()
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except CSVParseError:
+        pass  # Recorded as the session's error
+    return _upload_session_response(session)
+
+
+@app.put("/api/transactions/upload/sessions/{session_id}")
+async def put_upload_session_range(session_id: str, request: Request):
+    """
+    Receive a byte range of a resumable upload.
+
+    The range must start at or before the received offset (overlapping
+    bytes are skipped) and the body must be exactly as long as the range;
+    bytes of a range cut short are kept, so clients resume from the offset
+    returned by GET.
+    """
+    session = await _get_upload_session(session_id)
+    try:
+        start, end = parse_content_range(request.headers.get("content-range"))
+        content_length = request.headers.get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) != end - start + 1:
+            raise UploadSessionError(
+                f"Content-Length {content_length} does not match the {end - start + 1} bytes of Content-Range"
+            )
+        await session.write(start, end, request.stream())
+    except UploadOffsetError as e:
+        raise HTTPException(status_code=409, detail=str(e), headers={"Upload-Offset": str(e.offset)})
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except UploadSessionTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UploadSessionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except CSVParseError as e:
         raise HTTPException(status_code=400, detail=f"Error parsing CSV: {str(e)}")
+    
+    return _upload_session_response(session)
+
+
+@app.post("/api/transactions/upload/sessions/{session_id}/finalize")
+async def finalize_upload_session(session_id: str):
+    """Ingest a completely received resumable upload."""
+    session = await _get_upload_session(session_id)
+    try:
+        batch = await session.finish()
+    except UploadOffsetError as e:
+        raise HTTPException(status_code=409, detail=str(e), headers={"Upload-Offset": str(e.offset)})
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except (UploadSessionError, CSVParseError) as e:
+        raise HTTPException(status_code=400, detail=f"Error parsing CSV: {str(e)}")
+    
+    f = await asyncio.to_thread(open, session.path, "rb")
+    try:
+        file = UploadFile(file=f, size=session.offset, filename=session.filename)
+        if batch is not None:
+            # Plain CSVs were parsed as their ranges arrived
+            parsed = ParsedUpload(batch=batch, digest=session.digest)
+            await parse_cache.put(parsed.digest, batch)
+        else:
+            try:
+                parsed = await parse_upload(file)
+            except DecompressionBombError as e:
+                raise HTTPException(status_code=413, detail=str(e))
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Error parsing CSV: {str(e)}")
+        upload = await store_upload(file, parsed)
+    finally:
+        await asyncio.to_thread(f.close)
+    
+    await upload_sessions.discard(session.id)
+    return _upload_response(upload, parsed)
+
+
+@app.delete("/api/transactions/upload/sessions/{session_id}", status_code=204)
+async def delete_upload_session(session_id: str):
+    """Abandon a resumable upload and drop its received bytes."""
+    await _get_upload_session(session_id)
+    await upload_sessions.discard(session_id)
+
+
+async def _get_upload_session(session_id: str) -> UploadSession:
+    """Get an upload session, or fail the request with 404."""
+    try:
+        return await upload_sessions.get(session_id)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def _upload_session_response(session: UploadSession) -> dict:
+    """Build the status response of an upload session."""
+    return {
+        "sessionId": session.id,
+        "filename": session.filename,
+        "offset": session.offset,
+        "size": session.size,
+        "rowsParsed": session.rows_parsed,
+        "error": session.error,
+    }
+
+
+@app.get("/api/transactions/upload/progress/{progress_id}")
+async def stream_upload_progress(progress_id: str):
+    """Stream the progress of an upload as Server-Sent Events."""
+    return StreamingResponse(
+        progress_registry.events(progress_id, settings.progress_event_interval),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/ingest-jobs", status_code=202, openapi_extra=multipart_body("file"))
+async def create_ingest_job(file: UploadFile = Depends(upload_file("file"))):
+    """Queue an uploaded CSV for background ingestion."""
+    if not is_supported_upload(file.filename):
+        raise HTTPException(status_code=400, detail=UNSUPPORTED_FILE_MESSAGE)
+    
+    async with IngestJobsContextManager() as db:
+        job = await db.create_job(file.filename, _read_chunks(file, settings.ingest_job_chunk_size))
+    ingest_worker.notify()
+    
+    return {
+        "jobId": job.id,
+        "status": job.status.value,
+        "statusUrl": f"/api/ingest-jobs/{job.id}",
+    }
+
+
+async def _read_chunks(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    """Read a spooled upload in chunks."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+@app.get("/api/ingest-jobs/{job_id}")
+async def get_ingest_job(job_id: Annotated[int, Path(le=INT4_MAX)]):
+    """Get the status and outcome of an ingest job."""
+    async with IngestJobsContextManager() as db:
+        job = await db.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    
+    return {
+        "jobId": job.id,
+        "status": job.status.value,
+        "filename": job.filename,
+        "fileSize": job.file_size,
+        "attempts": job.attempts,
+        "createdAt": job.created_at,
+        "startedAt": job.started_at,
+        "finishedAt": job.finished_at,
+        "rowsParsed": job.rows_parsed,
+        "newCount": job.rows_inserted,
+        "duplicateCount": job.rows_duplicate,
+        "uploadId": job.upload_id,
+        "error": job.error,
+    }
 
 
 @app.get("/api/transactions")
-async def get_transactions():
-    """Get all transactions (placeholder for now)."""
-    return {"transactions": [], "total": 0}
+async def get_transactions(query: Annotated[TransactionPageQuery, Query()]):
+    """
+    List stored transactions, filtered and sorted, one page at a time.
 
+    Pass the returned ``nextCursor`` as ``cursor``, with the same filters
+    and sort, to get the next page; it is null on the last page. The
+    filtered count and amount sum are returned with the first page only.
+    """
+    try:
+        async with TransactionsContextManager() as db:
+            page = await db.list_transactions(query, query.limit, cursor=query.cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "transactions": [_transaction_response(t) for t in page.transactions],
+        "nextCursor": page.next_cursor,
+        "totalCount": page.total_count,
+        "totalAmount": cents_to_float(page.total_amount_cents) if page.total_amount_cents is not None else None,
+    }
 
-@app.get("/api/analytics/summary")
-async def get_analytics_summary():
-    """Get analytics summary (placeholder for now)."""
+
+def _transaction_response(transaction: Transaction) -> dict:
+    """Build the API representation of a stored transaction."""
+    return {
+        "id": transaction.id,
+        "uploadId": transaction.upload_id,
+        "transactionDate": transaction.transaction_date.isoformat(),
+        "postDate": transaction.post_date.isoformat(),
+        "description": transaction.description,
+        "category": transaction.category,
+        "type": transaction.type,
+        "amount": cents_to_float(transaction.amount_cents),
+        "memo": transaction.memo,
+    }
+
+
+@app.get("/api/uploads")
+async def list_uploads(
+    limit: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size),
+    cursor: Optional[str] = Query(None),
+):
+    """
+    List uploads, newest first, with per-upload totals but no transactions.
+
+    Each upload's transactions are paged through its ``transactionsUrl``.
+    """
+    try:
+        async with UploadsContextManager() as db:
+            page = await db.list_upload_summaries(limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "uploads": [_upload_summary_response(summary) for summary in page.uploads],
+        "nextCursor": page.next_cursor,
+    }
+
+
+@app.get("/api/uploads/{upload_id}")
+async def get_upload_summary(upload_id: Annotated[int, Path(le=INT4_MAX)]):
+    """Get an upload's totals, without its transactions."""
+    async with UploadsContextManager() as db:
+        summary = await db.get_upload_summary(upload_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return _upload_summary_response(summary)
+
+
+@app.delete("/api/uploads/{upload_id}", status_code=204)
+async def delete_upload(upload_id: Annotated[int, Path(le=INT4_MAX)]):
+    """Delete an upload and its transactions."""
+    async with UploadsContextManager() as db:
+        deleted = await db.delete_upload(upload_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+
+def _upload_summary_response(summary: UploadSummary) -> dict:
+    """Build the API representation of an upload summary."""
     return {
-        "totalSpent": 0,
-        "totalIncome": 0,
-        "netAmount": 0,
-        "transactionCount": 0,
-        "avgTransactionAmount": 0
+        "id": summary.id,
+        "createdAt": summary.created_at,
+        "transactionCount": summary.transaction_count,
+        "totalSpent": cents_to_float(summary.total_spent_cents),
+        "totalIncome": cents_to_float(summary.total_income_cents),
+        "minDate": summary.min_transaction_date.isoformat() if summary.min_transaction_date else None,
+        "maxDate": summary.max_transaction_date.isoformat() if summary.max_transaction_date else None,
+        "categoryCount": summary.category_count,
+        "categoryTotals": {
+            category: cents_to_float(cents) for category, cents in summary.category_totals.items()
+        },
+        # Transactions are an explicit, paginated request
+        "transactionsUrl": f"/api/transactions?uploadId={summary.id}",
     }
+
+
+@app.get("/api/parse-cache/stats")
+async def get_parse_cache_stats():
+    """Get hit, miss and eviction counters of the upload parse cache."""
+    return parse_cache.stats_dict()
+
+
+@app.get("/api/analytics/summary")
+async def get_analytics_summary(query: Annotated[AnalyticsQuery, Query()]):
+    """Get spending metrics over all stored transactions in a date range."""
+    async with AnalyticsContextManager() as db:
+        summary = await db.get_summary(query.start_date, query.end_date)
+    return summary.to_response()
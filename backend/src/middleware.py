@@ -0,0 +1,108 @@
+"""ASGI middleware for the FastAPI application."""
+
+from typing import Iterable
+from urllib.parse import parse_qs
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.services.progress import ProgressRegistry
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject request bodies larger than a limit before they are fully received.
+
+    Requests declaring a Content-Length above the limit are answered with
+    413 without reading the body. Otherwise the body is counted as it
+    streams in, and the request is aborted with 413 as soon as the running
+    total passes the limit, so oversized uploads never reach the multipart
+    parser's spool file in full.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int, paths: Iterable[str]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_body_size: Maximum request body size in bytes
+            paths: Request paths the limit applies to
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Upload exceeds maximum size of {self.max_body_size} bytes"
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_body_size:
+                response = JSONResponse({"detail": detail}, status_code=413)
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # Raised while the route parses the body; FastAPI passes
+                    # HTTPExceptions through to the exception handlers
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+class UploadProgressMiddleware:
+    """
+    Record how much of an upload's body has been received.
+
+    The multipart body is received in full before the route runs, so the
+    receiving stage can only be observed here. Requests opt in with a
+    ``progressId`` query parameter naming their entry in the registry.
+    """
+
+    def __init__(self, app: ASGIApp, registry: ProgressRegistry, paths: Iterable[str]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            registry: Registry holding upload progress
+            paths: Request paths progress is tracked for
+        """
+        self.app = app
+        self.registry = registry
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        progress_ids = parse_qs(scope["query_string"].decode("latin-1")).get("progressId")
+        if not progress_ids:
+            await self.app(scope, receive, send)
+            return
+
+        progress = self.registry.start(progress_ids[0])
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit():
+            progress.bytes_total = int(content_length)
+
+        async def counting_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                progress.bytes_received += len(message.get("body", b""))
+            return message
+
+        await self.app(scope, counting_receive, send)
@@ -1,11 +1,21 @@
 """Domain models: DTOs for database operations and read-only domain classes."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from enum import Enum
+from datetime import date, datetime
 from decimal import Decimal
-from sqlalchemy import String, DateTime, Numeric, ForeignKey, Integer
+from sqlalchemy import BigInteger, Date, String, DateTime, ForeignKey, Index, Integer, LargeBinary, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, OID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from typing import List
+from typing import Dict, List, Optional
+from src.services.money import cents_to_decimal
+
+
+# Lengths of the transaction text columns, enforced when rows are parsed
+DESCRIPTION_MAX_LENGTH = 255
+CATEGORY_MAX_LENGTH = 100
+TYPE_MAX_LENGTH = 50
+MEMO_MAX_LENGTH = 255
 
 
 # ============================================================================
@@ -13,6 +23,7 @@ from typing import List
 # ============================================================================
 
 
+
 class Base(DeclarativeBase):
     """Base class for all DTO models."""
 
@@ -27,10 +38,29 @@ class UploadDTO(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     transaction_count: Mapped[int] = mapped_column(Integer, default=0)
+    # SHA-256 of the uploaded file; the unique index rejects re-ingestion
+    file_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, unique=True, index=True)
+    # Size of the uploaded file and number of data rows in it, including rows
+    # that were already stored; used to detect later files extending this one
+    file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True, index=True)
+    row_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Serialized OccurrenceIndex of the file's rows (8 bytes per row)
+    occurrence_index: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    # Statistics of the rows stored by this upload, computed at ingest so
+    # upload listings never scan transactions
+    total_spent_cents: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    total_income_cents: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    min_transaction_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    max_transaction_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    category_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Net cents per category, e.g. {"Groceries": -12345}
+    category_totals: Mapped[Dict[str, int]] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
 
-    # Relationship to transactions
+    # Relationship to transactions, in the order they were ingested
     transactions: Mapped[List["TransactionDTO"]] = relationship(
-        "TransactionDTO", back_populates="upload", cascade="all, delete-orphan"
+        "TransactionDTO", back_populates="upload", cascade="all, delete-orphan", order_by="TransactionDTO.id"
     )
 
 
@@ -38,23 +68,119 @@ class TransactionDTO(Base):
     """DTO for Transaction - used for database read/write operations."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Keyset pagination seeks on (transaction_date, id) in either
+        # direction; also serves plain transaction_date lookups
+        Index("ix_transactions_date_id", "transaction_date", "id"),
+        # The same listing within one upload; also serves upload_id lookups
+        Index("ix_transactions_upload_date_id", "upload_id", "transaction_date", "id"),
+        # Category filter and sort, keyset on (category, transaction_date, id)
+        Index("ix_transactions_category_date_id", "category", "transaction_date", "id"),
+        # Amount range filter and sort, keyset on (amount_cents, id)
+        Index("ix_transactions_amount_id", "amount_cents", "id"),
+        # Spending-only listings by date skip income rows entirely
+        Index(
+            "ix_transactions_debit_date_id",
+            "transaction_date",
+            "id",
+            postgresql_where=text("amount_cents < 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     upload_id: Mapped[int] = mapped_column(ForeignKey("uploads.id"), nullable=False)
 
     # Transaction fields from Chase CSV
-    transaction_date: Mapped[str] = mapped_column(String(10), nullable=False)
-    post_date: Mapped[str] = mapped_column(String(10), nullable=False)
-    description: Mapped[str] = mapped_column(String(255), nullable=False)
-    category: Mapped[str] = mapped_column(String(100), nullable=False)
-    type: Mapped[str] = mapped_column(String(50), nullable=False)
-    amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    memo: Mapped[str] = mapped_column(String(255), nullable=True, default="")
+    transaction_date: Mapped[date] = mapped_column(Date, nullable=False)
+    post_date: Mapped[date] = mapped_column(Date, nullable=False)
+    description: Mapped[str] = mapped_column(String(DESCRIPTION_MAX_LENGTH), nullable=False)
+    category: Mapped[str] = mapped_column(String(CATEGORY_MAX_LENGTH), nullable=False)
+    type: Mapped[str] = mapped_column(String(TYPE_MAX_LENGTH), nullable=False)
+    amount_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    memo: Mapped[str] = mapped_column(String(MEMO_MAX_LENGTH), nullable=True, default="")
+    # SHA-256 of the normalized natural key; the unique index drops rows
+    # already ingested from an overlapping statement
+    natural_key: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True, index=True)
 
     # Relationship to upload
     upload: Mapped["UploadDTO"] = relationship("UploadDTO", back_populates="transactions")
 
 
+# Merchant prefix search and sort, keyset on (lower(description), id). The
+# C collation makes a prefix an index range, whatever the database locale.
+Index(
+    "ix_transactions_merchant_id",
+    func.lower(TransactionDTO.description).collate("C"),
+    TransactionDTO.id,
+    # Reflection drops the COLLATE clause, so autogenerate cannot compare it
+    info={"manual_migration": True},
+)
+
+
+class DailyRollupDTO(Base):
+    """
+    DTO for DailyRollup - stored transaction totals per day, category and type.
+
+    Kept up to date by the same database transaction that stores or
+    deletes an upload's rows, so analytics aggregate a few rollup rows per
+    day instead of scanning transactions. Rows are removed when their
+    count drops to zero.
+    """
+
+    __tablename__ = "daily_rollups"
+
+    transaction_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    category: Mapped[str] = mapped_column(String(100), primary_key=True)
+    type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    transaction_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Spending and income are kept apart; their sum alone loses both totals
+    spent_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    income_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class IngestJobStatus(str, Enum):
+    """Lifecycle of an ingest job."""
+
+    QUEUED = "queued"
+    PARSING = "parsing"
+    PERSISTING = "persisting"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestJobDTO(Base):
+    """DTO for IngestJob - an uploaded file waiting to be parsed and stored."""
+
+    __tablename__ = "ingest_jobs"
+    __table_args__ = (
+        # Workers only scan jobs that are not finished
+        Index(
+            "ix_ingest_jobs_unfinished",
+            "id",
+            postgresql_where=text("status NOT IN ('succeeded', 'failed')"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default=IngestJobStatus.QUEUED.value)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Large object holding the raw uploaded bytes, streamed in and out in
+    # chunks; unlinked once the job succeeds
+    content_oid: Mapped[Optional[int]] = mapped_column(OID, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # A worker owns the job until its lease expires; expired jobs are reclaimed
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_parsed: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    rows_inserted: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    rows_duplicate: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    upload_id: Mapped[Optional[int]] = mapped_column(ForeignKey("uploads.id"), nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
 # ============================================================================
 # Read-only Domain Models - Created from DTOs after database session closes
 # ============================================================================
@@ -66,12 +192,13 @@ class Transaction:
 
     id: int
     upload_id: int
-    transaction_date: str
-    post_date: str
+    transaction_date: date
+    post_date: date
     description: str
     category: str
     type: str
     amount: Decimal
+    amount_cents: int
     memo: str
 
     @classmethod
@@ -93,10 +220,58 @@ class Transaction:
             description=dto.description,
             category=dto.category,
             type=dto.type,
-            amount=dto.amount,
+            amount=cents_to_decimal(dto.amount_cents),
+            amount_cents=dto.amount_cents,
             memo=dto.memo,
         )
 
+    @classmethod
+    def from_record(cls, transaction_id: int, record: dict) -> "Transaction":
+        """
+        Create a read-only Transaction from an inserted parameter dictionary.
+
+        Args:
+            transaction_id: ID returned by the INSERT
+            record: Column-name to value dictionary that was inserted
+
+        Returns:
+            Read-only Transaction instance
+        """
+        return cls(
+            id=transaction_id,
+            upload_id=record["upload_id"],
+            transaction_date=record["transaction_date"],
+            post_date=record["post_date"],
+            description=record["description"],
+            category=record["category"],
+            type=record["type"],
+            amount=cents_to_decimal(record["amount_cents"]),
+            amount_cents=record["amount_cents"],
+            memo=record["memo"],
+        )
+
+
+@dataclass(frozen=True)
+class TransactionPage:
+    """Read-only page of transactions from a keyset-paginated listing."""
+
+    transactions: List[Transaction]
+    next_cursor: Optional[str] = None  # None on the last page
+    # Rows matching the listing's filters and the sum of their amounts;
+    # only computed for the first page
+    total_count: Optional[int] = None
+    total_amount_cents: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class UploadFingerprint:
+    """Read-only identity of a stored upload's file, for delta detection."""
+
+    id: int
+    file_hash: str
+    file_size: int
+    row_count: int
+
 
 @dataclass(frozen=True)
 class Upload:
@@ -106,6 +281,10 @@ class Upload:
     created_at: datetime
     transaction_count: int
     transactions: List[Transaction]
+    file_hash: Optional[str] = None
+    duplicate: bool = False  # True when an identical file had already been ingested
+    duplicate_transaction_count: int = 0  # Rows skipped as already stored
+    row_ids: List[Optional[int]] = field(default_factory=list)  # Stored row ID of each given row, in order
 
     @classmethod
     def from_dto(cls, dto: UploadDTO) -> "Upload":
@@ -124,4 +303,97 @@ class Upload:
             created_at=dto.created_at,
             transaction_count=dto.transaction_count,
             transactions=transactions,
+            file_hash=dto.file_hash,
+        )
+
+
+@dataclass(frozen=True)
+class UploadSummary:
+    """Read-only Upload with aggregates of its stored transactions, without the rows."""
+
+    id: int
+    created_at: datetime
+    transaction_count: int
+    total_spent_cents: int = 0
+    total_income_cents: int = 0
+    min_transaction_date: Optional[date] = None
+    max_transaction_date: Optional[date] = None
+    category_count: int = 0
+    category_totals: Dict[str, int] = field(default_factory=dict)  # Net cents per category
+
+    @classmethod
+    def from_dto(cls, dto: UploadDTO) -> "UploadSummary":
+        """
+        Create a read-only UploadSummary from an UploadDTO's stored statistics.
+
+        Args:
+            dto: UploadDTO instance from database
+
+        Returns:
+            Read-only UploadSummary instance
+        """
+        return cls(
+            id=dto.id,
+            created_at=dto.created_at,
+            transaction_count=dto.transaction_count,
+            total_spent_cents=dto.total_spent_cents,
+            total_income_cents=dto.total_income_cents,
+            min_transaction_date=dto.min_transaction_date,
+            max_transaction_date=dto.max_transaction_date,
+            category_count=dto.category_count,
+            category_totals=dict(dto.category_totals),
+        )
+
+
+@dataclass(frozen=True)
+class UploadSummaryPage:
+    """Read-only page of upload summaries, newest first."""
+
+    uploads: List[UploadSummary]
+    next_cursor: Optional[str] = None  # None on the last page
+
+
+@dataclass(frozen=True)
+class IngestJob:
+    """Read-only IngestJob domain model (without the file contents)."""
+
+    id: int
+    status: IngestJobStatus
+    filename: str
+    file_size: int
+    created_at: datetime
+    attempts: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    rows_parsed: Optional[int] = None
+    rows_inserted: Optional[int] = None
+    rows_duplicate: Optional[int] = None
+    upload_id: Optional[int] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_dto(cls, dto: IngestJobDTO) -> "IngestJob":
+        """
+        Create a read-only IngestJob from an IngestJobDTO.
+
+        Args:
+            dto: IngestJobDTO instance from database
+
+        Returns:
+            Read-only IngestJob instance
+        """
+        return cls(
+            id=dto.id,
+            status=IngestJobStatus(dto.status),
+            filename=dto.filename,
+            file_size=dto.file_size,
+            created_at=dto.created_at,
+            attempts=dto.attempts,
+            started_at=dto.started_at,
+            finished_at=dto.finished_at,
+            rows_parsed=dto.rows_parsed,
+            rows_inserted=dto.rows_inserted,
+            rows_duplicate=dto.rows_duplicate,
+            upload_id=dto.upload_id,
+            error=dto.error,
         )
@@ -1,9 +1,14 @@
 """Pydantic schemas for request/response validation."""
 
-from datetime import datetime
-from decimal import Decimal
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import List, Optional
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, Literal, Optional
+from src.config import settings
+from src.models import CATEGORY_MAX_LENGTH, DESCRIPTION_MAX_LENGTH, MEMO_MAX_LENGTH, TYPE_MAX_LENGTH
+from src.services.date_codec import parse_date
+from src.services.pagination import INT4_MAX, INT8_MAX, INT8_MIN
 
 
 class TransactionBase(BaseModel):
@@ -11,35 +16,19 @@ class TransactionBase(BaseModel):
 
     transaction_date: str = Field(..., description="Transaction date (MM/DD/YYYY)")
     post_date: str = Field(..., description="Post date (MM/DD/YYYY)")
-    description: str = Field(..., description="Merchant/transaction description")
-    category: str = Field(..., description="Transaction category")
-    type: str = Field(..., description="Transaction type (e.g., Sale, Payment)")
+    description: str = Field(
+        ..., max_length=DESCRIPTION_MAX_LENGTH, description="Merchant/transaction description"
+    )
+    category: str = Field(..., max_length=CATEGORY_MAX_LENGTH, description="Transaction category")
+    type: str = Field(..., max_length=TYPE_MAX_LENGTH, description="Transaction type (e.g., Sale, Payment)")
     amount: Decimal = Field(..., description="Transaction amount")
-    memo: Optional[str] = Field(default="", description="Additional memo/notes")
+    memo: Optional[str] = Field(default="", max_length=MEMO_MAX_LENGTH, description="Additional memo/notes")
 
     @field_validator("transaction_date", "post_date")
     @classmethod
     def validate_date_format(cls, v: str) -> str:
-        """Validate date is in MM/DD/YYYY format."""
-        if not v:
-            raise ValueError("Date cannot be empty")
-
-        parts = v.split("/")
-        if len(parts) != 3:
-            raise ValueError(f"Date must be in MM/DD/YYYY format, got: {v}")
-
-        month, day, year = parts
-        if not (month.isdigit() and day.isdigit() and year.isdigit()):
-            raise ValueError(f"Date components must be numeric, got: {v}")
-
-        month_int, day_int, year_int = int(month), int(day), int(year)
-        if not (1 <= month_int <= 12):
-            raise ValueError(f"Month must be between 1 and 12, got: {month_int}")
-        if not (1 <= day_int <= 31):
-            raise ValueError(f"Day must be between 1 and 31, got: {day_int}")
-        if year_int < 1900 or year_int > 2100:
-            raise ValueError(f"Year must be between 1900 and 2100, got: {year_int}")
-
+        """Validate date is an existing calendar date in MM/DD/YYYY format."""
+        parse_date(v)
         return v
 
     @field_validator("description", "category", "type")
@@ -85,3 +74,105 @@ class UploadSummary(BaseModel):
     id: int
     created_at: datetime
     transaction_count: int
+
+
+class UploadSessionCreate(BaseModel):
+    """Schema for starting a resumable upload."""
+
+    filename: str = Field(..., min_length=1, description="Name of the file being uploaded")
+    size: Optional[int] = Field(default=None, ge=0, description="Total file size in bytes, if known")
+
+
+class TransactionSort(str, Enum):
+    """Columns the transaction listing can be sorted on."""
+
+    DATE = "date"
+    AMOUNT = "amount"
+    MERCHANT = "merchant"
+    CATEGORY = "category"
+
+
+class SortOrder(str, Enum):
+    """Sort direction."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class TransactionListQuery(BaseModel):
+    """Schema for the filters and sort of the transaction listing."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    date_from: Optional[date] = Field(default=None, alias="dateFrom", description="Earliest transaction date")
+    date_to: Optional[date] = Field(default=None, alias="dateTo", description="Latest transaction date")
+    merchant: Optional[str] = Field(
+        default=None, max_length=255, description="Case-insensitive prefix of the description"
+    )
+    category: List[str] = Field(default_factory=list, description="Categories to include (any of)")
+    amount_min: Optional[Decimal] = Field(default=None, alias="amountMin", description="Smallest amount")
+    amount_max: Optional[Decimal] = Field(default=None, alias="amountMax", description="Largest amount")
+    kind: Optional[Literal["debit", "credit"]] = Field(
+        default=None, description="Only spending (debit) or only income (credit)"
+    )
+    upload_id: Optional[int] = Field(
+        default=None, alias="uploadId", le=INT4_MAX, description="Only this upload's rows"
+    )
+    sort: TransactionSort = Field(default=TransactionSort.DATE, description="Column to sort on")
+    order: SortOrder = Field(default=SortOrder.DESC, description="Sort direction")
+
+    @field_validator("merchant")
+    @classmethod
+    def validate_merchant(cls, v: Optional[str]) -> Optional[str]:
+        """Treat a blank merchant search as no filter."""
+        if v is None or not v.strip():
+            return None
+        return v.strip()
+
+    @field_validator("amount_min", "amount_max")
+    @classmethod
+    def validate_amount(cls, v: Optional[Decimal]) -> Optional[Decimal]:
+        """Validate amounts are finite, within the stored cents range, with at most two decimal places."""
+        if v is None:
+            return v
+        if not v.is_finite() or not INT8_MIN <= v * 100 <= INT8_MAX:
+            raise ValueError("Amount is out of range")
+        try:
+            exact = v == v.quantize(Decimal("0.01"))
+        except InvalidOperation:
+            exact = False
+        if not exact:
+            raise ValueError("Amount must have at most two decimal places")
+        return v
+
+    @model_validator(mode="after")
+    def validate_ranges(self) -> "TransactionListQuery":
+        """Validate range bounds are in order."""
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("dateFrom must not be after dateTo")
+        if self.amount_min is not None and self.amount_max is not None and self.amount_min > self.amount_max:
+            raise ValueError("amountMin must not be greater than amountMax")
+        return self
+
+
+class TransactionPageQuery(TransactionListQuery):
+    """Schema for one page of the transaction listing."""
+
+    limit: int = Field(
+        default=settings.default_page_size, ge=1, le=settings.max_page_size, description="Page size"
+    )
+    cursor: Optional[str] = Field(default=None, description="nextCursor of the previous page")
+
+
+class AnalyticsQuery(BaseModel):
+    """Schema for the date range of analytics endpoints."""
+
+    start_date: Optional[date] = Field(default=None, description="Earliest transaction date")
+    end_date: Optional[date] = Field(default=None, description="Latest transaction date")
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "AnalyticsQuery":
+        """Validate the range bounds are in order."""
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValueError("start_date must not be after end_date")
+        return self
@@ -0,0 +1,241 @@
+"""Bank CSV layouts: header signatures and compiled index-based row mappers."""
+
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+# Canonical field order produced by every row mapper:
+# (transaction_date, post_date, description, category, type, amount, memo)
+RawFields = Tuple[str, str, str, str, str, str, str]
+Extractor = Callable[[Sequence[str]], RawFields]
+
+
+@dataclass(frozen=True)
+class RowMapper:
+    """Row mapper compiled for one header: pulls canonical fields by index."""
+
+    layout: str
+    width: int
+    extract: Extractor
+
+    def __call__(self, row: Sequence[str]) -> RawFields:
+        """
+        Map a csv.reader row to canonical raw field values.
+
+        Rows shorter than the header are padded with empty strings, like
+        csv.DictReader does for missing trailing fields.
+
+        Args:
+            row: Row as returned by csv.reader
+
+        Returns:
+            Tuple of raw (unstripped) field values in canonical order
+        """
+        try:
+            return self.extract(row)
+        except IndexError:
+            return self.extract(list(row) + [""] * (self.width - len(row)))
+
+
+@dataclass(frozen=True)
+class BankLayout:
+    """
+    CSV layout of a bank's transaction export.
+
+    A layout is recognised by its header signature (the set of columns it
+    requires). Once matched, ``build_extractor`` is called once with the
+    header positions and returns the per-row extraction function, so no
+    per-row cost is paid for format detection.
+    """
+
+    name: str
+    required_columns: FrozenSet[str]
+    build_extractor: Callable[[Dict[str, int]], Extractor]
+
+    def matches(self, fieldnames: Sequence[str]) -> bool:
+        """Check whether a header contains every column of this layout."""
+        return self.required_columns.issubset(fieldnames)
+
+    def compile(self, fieldnames: Sequence[str]) -> RowMapper:
+        """
+        Compile a row mapper for a header matching this layout.
+
+        Args:
+            fieldnames: Column names from the header row
+
+        Returns:
+            RowMapper resolving columns by position
+        """
+        positions = {name: index for index, name in enumerate(fieldnames)}
+        return RowMapper(
+            layout=self.name,
+            width=len(fieldnames),
+            extract=self.build_extractor(positions),
+        )
+
+
+def _negate(amount: str) -> str:
+    """Flip the sign of a numeric string without parsing it."""
+    amount = amount.strip()
+    if amount.startswith("-"):
+        return amount[1:]
+    if amount.startswith("+"):
+        return "-" + amount[1:]
+    return "-" + amount if amount else amount
+
+
+def _iso_to_us_date(value: str) -> str:
+    """Convert YYYY-MM-DD to MM/DD/YYYY, leaving other values untouched."""
+    value = value.strip()
+    parts = value.split("-")
+    if len(parts) == 3 and len(parts[0]) == 4:
+        year, month, day = parts
+        return f"{month}/{day}/{year}"
+    return value
+
+
+def _optional(positions: Dict[str, int], column: str) -> Callable[[Sequence[str]], str]:
+    """Getter for a column that may be absent from the header."""
+    if column in positions:
+        return itemgetter(positions[column])
+    return lambda row: ""
+
+
+def _chase_extractor(positions: Dict[str, int]) -> Extractor:
+    """Chase: columns map one-to-one onto the canonical fields."""
+    return itemgetter(
+        positions["Transaction Date"],
+        positions["Post Date"],
+        positions["Description"],
+        positions["Category"],
+        positions["Type"],
+        positions["Amount"],
+        positions["Memo"],
+    )
+
+
+def _amex_extractor(positions: Dict[str, int]) -> Extractor:
+    """Amex: single date, charges are positive amounts."""
+    date_index = positions["Date"]
+    description_index = positions["Description"]
+    amount_index = positions["Amount"]
+    category = _optional(positions, "Category")
+
+    def extract(row: Sequence[str]) -> RawFields:
+        amount = _negate(row[amount_index])
+        return (
+            row[date_index],
+            row[date_index],
+            row[description_index],
+            category(row),
+            "Sale" if amount.startswith("-") else "Payment",
+            amount,
+            "",
+        )
+
+    return extract
+
+
+def _citi_extractor(positions: Dict[str, int]) -> Extractor:
+    """Citi: separate Debit (positive) and Credit (negative) columns."""
+    date_index = positions["Date"]
+    description_index = positions["Description"]
+    debit_index = positions["Debit"]
+    credit_index = positions["Credit"]
+    category = _optional(positions, "Category")
+
+    def extract(row: Sequence[str]) -> RawFields:
+        debit = row[debit_index].strip()
+        return (
+            row[date_index],
+            row[date_index],
+            row[description_index],
+            category(row),
+            "Sale" if debit else "Payment",
+            _negate(debit or row[credit_index]),
+            "",
+        )
+
+    return extract
+
+
+def _capital_one_extractor(positions: Dict[str, int]) -> Extractor:
+    """Capital One: ISO dates, separate positive Debit and Credit columns."""
+    transaction_date_index = positions["Transaction Date"]
+    posted_date_index = positions["Posted Date"]
+    description_index = positions["Description"]
+    category_index = positions["Category"]
+    debit_index = positions["Debit"]
+    credit_index = positions["Credit"]
+
+    def extract(row: Sequence[str]) -> RawFields:
+        debit = row[debit_index].strip()
+        return (
+            _iso_to_us_date(row[transaction_date_index]),
+            _iso_to_us_date(row[posted_date_index]),
+            row[description_index],
+            row[category_index],
+            "Sale" if debit else "Payment",
+            _negate(debit) if debit else row[credit_index],
+            "",
+        )
+
+    return extract
+
+
+CHASE = BankLayout(
+    name="chase",
+    required_columns=frozenset(
+        {"Transaction Date", "Post Date", "Description", "Category", "Type", "Amount", "Memo"}
+    ),
+    build_extractor=_chase_extractor,
+)
+
+CAPITAL_ONE = BankLayout(
+    name="capital_one",
+    required_columns=frozenset(
+        {"Transaction Date", "Posted Date", "Card No.", "Description", "Category", "Debit", "Credit"}
+    ),
+    build_extractor=_capital_one_extractor,
+)
+
+CITI = BankLayout(
+    name="citi",
+    required_columns=frozenset({"Status", "Date", "Description", "Debit", "Credit"}),
+    build_extractor=_citi_extractor,
+)
+
+AMEX = BankLayout(
+    name="amex",
+    required_columns=frozenset({"Date", "Description", "Amount"}),
+    build_extractor=_amex_extractor,
+)
+
+# Checked in order; more specific signatures must come first
+LAYOUTS: List[BankLayout] = [CHASE, CAPITAL_ONE, CITI, AMEX]
+
+
+def register_layout(layout: BankLayout) -> None:
+    """
+    Register an additional bank layout ahead of the built-in ones.
+
+    Args:
+        layout: BankLayout to register
+    """
+    LAYOUTS.insert(0, layout)
+
+
+def detect_layout(fieldnames: Sequence[str]) -> Optional[BankLayout]:
+    """
+    Find the layout whose header signature matches.
+
+    Args:
+        fieldnames: Column names from the header row
+
+    Returns:
+        Matching BankLayout or None if no layout matches
+    """
+    for layout in LAYOUTS:
+        if layout.matches(fieldnames):
+            return layout
+    return None
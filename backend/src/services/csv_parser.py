@@ -1,12 +1,33 @@
 """CSV parser service for processing transaction CSV files."""
 
+import asyncio
+import codecs
 import csv
 import html
+import mmap
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal, InvalidOperation
 from io import StringIO
-from typing import List
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Protocol, Tuple, Union
 from pydantic import ValidationError
+from src.config import settings
+from src.models import CATEGORY_MAX_LENGTH, DESCRIPTION_MAX_LENGTH, MEMO_MAX_LENGTH, TYPE_MAX_LENGTH
 from src.schemas import TransactionCreate
+from src.services.bank_layouts import CHASE, RawFields, RowMapper, detect_layout
+from src.services.date_codec import parse_date
+from src.services.progress import UploadProgress
+from src.services.money import parse_cents
+from src.services.transaction_batch import TransactionBatch
+
+
+# Byte patterns usable on both bytes and mmap objects
+_NON_WHITESPACE_RE = re.compile(rb"\S")
+_LEADING_NEWLINES_RE = re.compile(rb"[\r\n]*")
+
+_process_pool: Optional[ProcessPoolExecutor] = None
 
 
 class CSVParseError(Exception):
@@ -15,18 +36,288 @@ class CSVParseError(Exception):
     pass
 
 
+class _RangeRowError(Exception):
+    """Row failure inside a parallel parse range, numbered within the range."""
+
+    def __init__(self, row_index: int, message: str):
+        super().__init__(row_index, message)
+        self.row_index = row_index
+        self.message = message
+
+
+class AsyncReadable(Protocol):
+    """Anything with an async ``read(size)`` returning bytes (e.g. UploadFile)."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+class CSVRecordSplitter:
+    """
+    Incrementally split decoded CSV text into complete records.
+
+    Text can be fed in arbitrary pieces. A record is only emitted once its
+    terminating newline has been seen outside of a quoted field, so quoted
+    fields containing newlines (or split across chunk boundaries) are kept
+    intact. Quote state is tracked by parity, which also holds for escaped
+    quotes ("") since they always come in pairs.
+    """
+
+    _LINE_RE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)")
+
+    def __init__(self):
+        """Initialize an empty splitter."""
+        self._partial = ""
+        self._pending: List[str] = []
+        self._in_quotes = False
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Feed a piece of decoded text.
+
+        Args:
+            text: Next piece of CSV text
+
+        Returns:
+            List of complete records (each including its line terminator)
+        """
+        data = self._partial + text
+        # Hold back a trailing "\r" as it may be the first half of "\r\n"
+        end = max(data.rfind("\n"), data.rfind("\r", 0, len(data) - 1)) + 1
+        self._partial = data[end:]
+
+        records = []
+        for line in self._LINE_RE.findall(data, 0, end):
+            self._pending.append(line)
+            if line.count('"') % 2:
+                self._in_quotes = not self._in_quotes
+            if not self._in_quotes:
+                records.append("".join(self._pending))
+                self._pending = []
+        return records
+
+    def flush(self) -> List[str]:
+        """
+        Signal end of input and return whatever is left as a final record.
+
+        Returns:
+            List with the final record, or an empty list if nothing is left
+        """
+        remainder = "".join(self._pending) + self._partial
+        self._pending = []
+        self._partial = ""
+        self._in_quotes = False
+        return [remainder] if remainder else []
+
+
+class CSVRowDecoder:
+    """
+    Push-style decoding of CSV bytes into numbered, canonical rows.
+
+    Bytes can be fed in arbitrary chunks (split UTF-8 sequences and quoted
+    newlines included); the header row compiles the row mapper and every
+    following non-empty record is yielded with its row number.
+    """
+
+    def __init__(self, compile_mapper: Callable[[List[str]], RowMapper]):
+        """
+        Initialize the decoder before the header row.
+
+        Args:
+            compile_mapper: Builds the row mapper from the header row
+        """
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._splitter = CSVRecordSplitter()
+        self._compile_mapper = compile_mapper
+        self._mapper: Optional[RowMapper] = None
+        self.row_num = 1  # Header is row 1
+
+    def feed(self, chunk: bytes, final: bool = False) -> Iterator[Tuple[int, RawFields]]:
+        """
+        Feed the next chunk of bytes.
+
+        Args:
+            chunk: Next bytes of the file
+            final: True for the last call, flushing any unterminated record
+
+        Yields:
+            Tuples of (row number, canonical raw fields)
+
+        Raises:
+            CSVParseError: If the content, header or CSV syntax is invalid
+        """
+        try:
+            text = self._decoder.decode(chunk, final=final)
+        except UnicodeDecodeError as e:
+            raise CSVParseError(f"CSV must be UTF-8 encoded: {str(e)}") from e
+
+        records = self._splitter.feed(text)
+        if final:
+            records += self._splitter.flush()
+
+        try:
+            rows = csv.reader(records)
+            if self._mapper is None:
+                # Skip leading blank lines until the header row
+                for header in rows:
+                    if "".join(header).strip():
+                        self._mapper = self._compile_mapper(header)
+                        break
+
+            for row in rows:
+                if not row:
+                    continue
+                self.row_num += 1
+                yield self.row_num, self._mapper(row)
+        except csv.Error as e:
+            raise CSVParseError(f"Invalid CSV format: {str(e)}") from e
+
+    def check_complete(self) -> None:
+        """
+        Check the input held a header and at least one data row.
+
+        Raises:
+            CSVParseError: If the content was empty or header-only
+        """
+        if self._mapper is None:
+            raise CSVParseError("CSV content is empty")
+        if self.row_num == 1:
+            raise CSVParseError("CSV contains no transaction data")
+
+
+def find_record_end(content: bytes, start: int = 0, min_end: int = 0) -> int:
+    """
+    Find the first record boundary at or after ``min_end``.
+
+    Scans forward from ``start``, which must itself be a record boundary,
+    for a newline preceded by an even number of quotes. Quote parity is
+    counted with bytes.count, so the scan runs at C speed and quoted
+    fields containing newlines are never cut.
+
+    Args:
+        content: Raw CSV bytes or a memory-mapped CSV file
+        start: Record boundary at which to start scanning
+        min_end: Offset before which no boundary is returned
+
+    Returns:
+        Offset just past the record's terminating newline, or len(content)
+    """
+    quotes = 0
+    pos = start
+    while True:
+        newline = content.find(b"\n", max(pos, min_end))
+        if newline == -1:
+            return len(content)
+        # Slice before counting: mmap objects have find() but no count()
+        quotes += content[pos:newline].count(b'"')
+        pos = newline + 1
+        if quotes % 2 == 0:
+            return pos
+
+
+def split_record_ranges(content: bytes, start: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split ``content[start:]`` into roughly equal ranges of whole records.
+
+    Args:
+        content: Raw CSV bytes or a memory-mapped CSV file
+        start: Offset of the first data record (after the header)
+        parts: Desired number of ranges
+
+    Returns:
+        List of (start, end) offsets covering ``content[start:]`` in order
+    """
+    ranges = []
+    target = max(1, (len(content) - start) // max(parts, 1))
+    range_start = start
+    while range_start < len(content):
+        range_end = find_record_end(content, range_start, range_start + target)
+        ranges.append((range_start, range_end))
+        range_start = range_end
+    return ranges
+
+
+def _check_length(field: str, value: str, max_length: int) -> str:
+    """
+    Validate a text field fits its database column.
+
+    Args:
+        field: Field name, for the error message
+        value: Cleaned field value
+        max_length: Column length in characters
+
+    Returns:
+        The value unchanged
+
+    Raises:
+        ValueError: If the value is longer than the column
+    """
+    if len(value) > max_length:
+        raise ValueError(f"{field} must be at most {max_length} characters")
+    return value
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool used for parallel parsing, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.parse_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def _parse_range_columnar(content: bytes, fieldnames: List[str]) -> TransactionBatch:
+    """
+    Parse one record-aligned byte range into a batch (process pool worker).
+
+    Args:
+        content: Raw CSV bytes of complete data records
+        fieldnames: Column names from the file's header row
+
+    Returns:
+        TransactionBatch for the range
+
+    Raises:
+        _RangeRowError: If a row is invalid, numbered from 0 within the range
+        CSVParseError: If the range is not valid UTF-8 or CSV
+    """
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise CSVParseError(f"CSV must be UTF-8 encoded: {str(e)}") from e
+
+    parser = CSVParser()
+    mapper = parser._compile_mapper(fieldnames)
+    batch = TransactionBatch()
+    row_index = 0
+    try:
+        for row in csv.reader(StringIO(text)):
+            if not row:
+                continue
+            try:
+                parser._append_row(batch, mapper(row))
+            except (ValueError, InvalidOperation) as e:
+                raise _RangeRowError(row_index, str(e)) from e
+            row_index += 1
+    except csv.Error as e:
+        raise CSVParseError(f"Invalid CSV format: {str(e)}") from e
+    return batch
+
+
 class CSVParser:
-    """Parser for Chase CSV transaction files."""
-
-    REQUIRED_COLUMNS = {
-        "Transaction Date",
-        "Post Date",
-        "Description",
-        "Category",
-        "Type",
-        "Amount",
-        "Memo",
-    }
+    """
+    Parser for bank CSV transaction files.
+
+    Chase exports are the reference format; other bank layouts registered
+    in src.services.bank_layouts are detected from their header row.
+    """
+
+    CHUNK_SIZE = 64 * 1024  # Bytes read from the upload per await
+    PARALLEL_RANGE_SIZE = 8 * 1024 * 1024  # Largest byte range handed to one worker
+    PROGRESS_ROWS = 1024  # Rows between progress updates while streaming
+
+    REQUIRED_COLUMNS = set(CHASE.required_columns)
 
     def parse(self, csv_content: str) -> List[TransactionCreate]:
         """
@@ -41,49 +332,398 @@ class CSVParser:
         Raises:
             CSVParseError: If CSV parsing fails
         """
+        return [
+            self._parse_numbered_row(fields, row_num)
+            for row_num, fields in self._iter_rows(csv_content)
+        ]
+
+    def parse_columnar(self, csv_content: str) -> TransactionBatch:
+        """
+        Parse CSV content into a columnar TransactionBatch.
+
+        Rows are validated with the same rules as parse() but appended
+        straight into columns, without building a TransactionCreate per row.
+
+        Args:
+            csv_content: CSV file content as string
+
+        Returns:
+            TransactionBatch holding every parsed row
+
+        Raises:
+            CSVParseError: If CSV parsing fails
+        """
+        batch = TransactionBatch()
+        for row_num, fields in self._iter_rows(csv_content):
+            self._append_numbered_row(batch, fields, row_num)
+        return batch
+
+    async def parse_parallel(
+        self,
+        content: Union[bytes, mmap.mmap],
+        workers: Optional[int] = None,
+        threshold: Optional[int] = None,
+        progress: Optional[UploadProgress] = None,
+    ) -> TransactionBatch:
+        """
+        Parse raw CSV bytes into a batch, using a process pool for large inputs.
+
+        Inputs above ``threshold`` bytes are split into byte ranges aligned
+        to record boundaries, each parsed on the shared process pool. The
+        resulting batches are merged in file order and row errors are
+        reported with their original row numbers. Smaller inputs are parsed
+        in-process with parse_columnar().
+
+        ``content`` may be a memory-mapped file. Ranges are then copied out
+        of the mapping only when a worker is free to take them, so at most
+        ``workers`` ranges of raw bytes are resident at a time.
+
+        Args:
+            content: Raw CSV file bytes (UTF-8) or a read-only mmap of them
+            workers: Number of ranges parsed concurrently (defaults to pool size)
+            threshold: Size in bytes above which to parallelize (defaults to
+                settings.parallel_parse_threshold)
+            progress: Upload progress to count parsed rows in, per range
+
+        Returns:
+            TransactionBatch holding every parsed row
+
+        Raises:
+            CSVParseError: If CSV parsing fails
+        """
+        if threshold is None:
+            threshold = settings.parallel_parse_threshold
+
+        if len(content) <= threshold:
+            try:
+                csv_content = content[:].decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise CSVParseError(f"CSV must be UTF-8 encoded: {str(e)}") from e
+            batch = self.parse_columnar(csv_content)
+            if progress is not None:
+                progress.rows_parsed = len(batch)
+            return batch
+
+        # Parse and validate the header in-process
+        fieldnames, header_end = self._parse_header(content)
+
+        workers = workers or settings.parse_workers or os.cpu_count() or 1
+        parts = max(workers, -(-(len(content) - header_end) // self.PARALLEL_RANGE_SIZE))
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        in_flight = asyncio.Semaphore(workers)
+
+        async def parse_range(start: int, end: int) -> TransactionBatch:
+            async with in_flight:
+                result = await loop.run_in_executor(
+                    pool, _parse_range_columnar, content[start:end], fieldnames
+                )
+            if progress is not None and isinstance(result, TransactionBatch):
+                progress.rows_parsed += len(result)
+            return result
+
+        results = await asyncio.gather(
+            *(parse_range(start, end) for start, end in split_record_ranges(content, header_end, parts)),
+            return_exceptions=True,
+        )
+
+        # Merge in file order; the first failing range determines the error
+        batch = TransactionBatch()
+        for result in results:
+            if isinstance(result, _RangeRowError):
+                row_num = len(batch) + result.row_index + 2  # Header is row 1
+                raise CSVParseError(f"Error parsing row {row_num}: {result.message}")
+            if isinstance(result, BaseException):
+                raise result
+            batch.extend(result)
+
+        if not len(batch):
+            raise CSVParseError("CSV contains no transaction data")
+
+        return batch
+
+    def parse_suffix(
+        self,
+        content: Union[bytes, mmap.mmap],
+        start: int,
+        first_row_num: int,
+    ) -> TransactionBatch:
+        """
+        Parse only the records from byte offset ``start`` onwards.
+
+        The header is still read from the start of ``content``, so the
+        suffix is mapped with the file's own layout. Used when the bytes
+        before ``start`` are known to be an already ingested file.
+
+        Args:
+            content: Raw CSV file bytes (UTF-8) or a read-only mmap of them
+            start: Record boundary at which parsing starts
+            first_row_num: Row number of the first record at ``start``
+
+        Returns:
+            TransactionBatch holding the rows from ``start`` onwards
+
+        Raises:
+            CSVParseError: If CSV parsing fails
+        """
+        fieldnames, _ = self._parse_header(content)
+        try:
+            return _parse_range_columnar(content[start:], fieldnames)
+        except _RangeRowError as e:
+            raise CSVParseError(
+                f"Error parsing row {first_row_num + e.row_index}: {e.message}"
+            ) from e
+
+    async def parse_stream(
+        self,
+        file: AsyncReadable,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[TransactionCreate]:
+        """
+        Parse a CSV upload incrementally, yielding transactions as they are read.
+
+        The file is consumed in ``chunk_size`` byte chunks and decoded
+        incrementally, so only the current chunk plus any unfinished record
+        is held in memory regardless of the file size.
+
+        Args:
+            file: Async readable source (e.g. FastAPI UploadFile)
+            chunk_size: Number of bytes to read per chunk
+
+        Yields:
+            TransactionCreate objects in file order
+
+        Raises:
+            CSVParseError: If CSV parsing fails
+        """
+        async for row_num, fields in self._iter_stream_rows(file, chunk_size):
+            yield self._parse_numbered_row(fields, row_num)
+
+    async def parse_stream_columnar(
+        self,
+        file: AsyncReadable,
+        chunk_size: Optional[int] = None,
+        progress: Optional[UploadProgress] = None,
+    ) -> TransactionBatch:
+        """
+        Parse a CSV upload incrementally into a columnar TransactionBatch.
+
+        Args:
+            file: Async readable source (e.g. FastAPI UploadFile)
+            chunk_size: Number of bytes to read per chunk
+            progress: Upload progress to count parsed rows in
+
+        Returns:
+            TransactionBatch holding every parsed row
+
+        Raises:
+            CSVParseError: If CSV parsing fails
+        """
+        batch = TransactionBatch()
+        async for row_num, fields in self._iter_stream_rows(file, chunk_size):
+            self._append_numbered_row(batch, fields, row_num)
+            if progress is not None and not row_num % self.PROGRESS_ROWS:
+                progress.rows_parsed = len(batch)
+        if progress is not None:
+            progress.rows_parsed = len(batch)
+        return batch
+
+    def _iter_rows(self, csv_content: str) -> Iterator[Tuple[int, RawFields]]:
+        """
+        Iterate over the data rows of in-memory CSV content.
+
+        Args:
+            csv_content: CSV file content as string
+
+        Yields:
+            Tuples of (row number, canonical raw fields); the header is row 1
+
+        Raises:
+            CSVParseError: If the content, header or CSV syntax is invalid
+        """
         if not csv_content or not csv_content.strip():
             raise CSVParseError("CSV content is empty")
 
         try:
             # Parse CSV
             csv_file = StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
+            reader = csv.reader(csv_file)
 
-            # Validate header
-            if not reader.fieldnames:
-                raise CSVParseError("CSV file is missing header row")
+            # Resolve header positions once
+            mapper = self._compile_mapper(next(reader, None))
 
-            missing_columns = self.REQUIRED_COLUMNS - set(reader.fieldnames)
-            if missing_columns:
-                raise CSVParseError(
-                    f"CSV is missing required columns: {', '.join(missing_columns)}"
-                )
+            row_num = 1
+            for row in reader:
+                if not row:  # Skip blank lines like csv.DictReader
+                    continue
+                row_num += 1
+                yield row_num, mapper(row)
 
-            # Parse transactions
-            transactions = []
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
-                try:
-                    transaction = self._parse_row(row)
-                    transactions.append(transaction)
-                except (ValidationError, ValueError, InvalidOperation) as e:
-                    raise CSVParseError(
-                        f"Error parsing row {row_num}: {str(e)}"
-                    ) from e
-
-            if not transactions:
+            if row_num == 1:
                 raise CSVParseError("CSV contains no transaction data")
 
-            return transactions
+        except csv.Error as e:
+            raise CSVParseError(f"Invalid CSV format: {str(e)}") from e
+
+    async def _iter_stream_rows(
+        self,
+        file: AsyncReadable,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, RawFields]]:
+        """
+        Iterate over the data rows of a CSV upload read in chunks.
+
+        Args:
+            file: Async readable source (e.g. FastAPI UploadFile)
+            chunk_size: Number of bytes to read per chunk
+
+        Yields:
+            Tuples of (row number, canonical raw fields); the header is row 1
+
+        Raises:
+            CSVParseError: If the content, header or CSV syntax is invalid
+        """
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        decoder = CSVRowDecoder(self._compile_mapper)
+
+        while True:
+            chunk = await file.read(chunk_size)
+            for row in decoder.feed(chunk, final=not chunk):
+                yield row
+            if not chunk:
+                break
+
+        decoder.check_complete()
+
+    def _parse_header(self, content: Union[bytes, mmap.mmap]) -> Tuple[List[str], int]:
+        """
+        Parse and validate the header row of raw CSV bytes.
+
+        Args:
+            content: Raw CSV file bytes (UTF-8) or a read-only mmap of them
+
+        Returns:
+            Tuple of (column names, offset just past the header record)
+
+        Raises:
+            CSVParseError: If the content is empty or the header is invalid
+        """
+        if _NON_WHITESPACE_RE.search(content) is None:
+            raise CSVParseError("CSV content is empty")
 
+        header_start = _LEADING_NEWLINES_RE.match(content).end()
+        header_end = find_record_end(content, header_start)
+        try:
+            header = content[header_start:header_end].decode("utf-8")
+            fieldnames = next(csv.reader([header]), None)
+        except UnicodeDecodeError as e:
+            raise CSVParseError(f"CSV must be UTF-8 encoded: {str(e)}") from e
         except csv.Error as e:
             raise CSVParseError(f"Invalid CSV format: {str(e)}") from e
+        self._compile_mapper(fieldnames)
+        return fieldnames, header_end
+
+    def _compile_mapper(self, fieldnames: Optional[List[str]]) -> RowMapper:
+        """
+        Detect the bank layout from the header and compile its row mapper.
+
+        Args:
+            fieldnames: Column names from the header row
+
+        Returns:
+            RowMapper that extracts canonical fields by column index
+
+        Raises:
+            CSVParseError: If the header is missing or matches no known layout
+        """
+        if not fieldnames:
+            raise CSVParseError("CSV file is missing header row")
+
+        layout = detect_layout(fieldnames)
+        if layout is None:
+            missing_columns = self.REQUIRED_COLUMNS - set(fieldnames)
+            raise CSVParseError(
+                f"CSV is missing required columns: {', '.join(missing_columns)}"
+            )
+
+        return layout.compile(fieldnames)
+
+    def _parse_numbered_row(self, fields: RawFields, row_num: int) -> TransactionCreate:
+        """
+        Parse a row, reporting failures against its row number.
+
+        Args:
+            fields: Canonical raw field values of a CSV row
+            row_num: 1-based row number in the file (header is row 1)
+
+        Returns:
+            TransactionCreate object
+
+        Raises:
+            CSVParseError: If the row is invalid
+        """
+        try:
+            return self._parse_row(fields)
+        except (ValidationError, ValueError, InvalidOperation) as e:
+            raise CSVParseError(f"Error parsing row {row_num}: {str(e)}") from e
+
+    def _append_numbered_row(
+        self, batch: TransactionBatch, fields: RawFields, row_num: int
+    ) -> None:
+        """
+        Append a row to a batch, reporting failures against its row number.
+
+        Args:
+            batch: TransactionBatch to append to
+            fields: Canonical raw field values of a CSV row
+            row_num: 1-based row number in the file (header is row 1)
+
+        Raises:
+            CSVParseError: If the row is invalid
+        """
+        try:
+            self._append_row(batch, fields)
+        except (ValueError, InvalidOperation) as e:
+            raise CSVParseError(f"Error parsing row {row_num}: {str(e)}") from e
+
+    def _append_row(self, batch: TransactionBatch, fields: RawFields) -> None:
+        """
+        Validate a single CSV row and append it to a columnar batch.
+
+        Applies the same rules as TransactionCreate without constructing
+        a model instance.
+
+        Args:
+            batch: TransactionBatch to append to
+            fields: Canonical raw field values of a CSV row
+
+        Raises:
+            ValueError: If row data is invalid
+        """
+        transaction_date, post_date, description, category, type_value, amount, memo = fields
+
+        batch.append(
+            transaction_date=parse_date(transaction_date.strip()),
+            post_date=parse_date(post_date.strip()),
+            description=_check_length(
+                "description",
+                TransactionCreate.validate_not_empty(html.unescape(description.strip())),
+                DESCRIPTION_MAX_LENGTH,
+            ),
+            category=_check_length("category", category.strip() or "Uncategorized", CATEGORY_MAX_LENGTH),
+            type=_check_length(
+                "type", TransactionCreate.validate_not_empty(type_value.strip()), TYPE_MAX_LENGTH
+            ),
+            amount_cents=parse_cents(amount.strip()),
+            memo=_check_length("memo", memo.strip(), MEMO_MAX_LENGTH),
+        )
 
-    def _parse_row(self, row: dict) -> TransactionCreate:
+    def _parse_row(self, fields: RawFields) -> TransactionCreate:
         """
         Parse a single CSV row into a TransactionCreate object.
 
         Args:
-            row: Dictionary representing a CSV row
+            fields: Canonical raw field values of a CSV row
 
         Returns:
             TransactionCreate object
@@ -92,27 +732,86 @@ class CSVParser:
             ValidationError: If row data is invalid
             ValueError: If amount conversion fails
         """
-        # Decode HTML entities and strip whitespace
-        description = html.unescape(row["Description"].strip())
-        category = row["Category"].strip() or "Uncategorized"  # Default for empty categories
-        type_value = row["Type"].strip()
-        memo = row["Memo"].strip() if row["Memo"] else ""
+        # Create transaction object (this will validate dates and required fields)
+        return TransactionCreate(**self._row_values(fields))
+
+    def _row_values(self, fields: RawFields) -> dict:
+        """
+        Extract cleaned TransactionCreate field values from a CSV row.
+
+        Args:
+            fields: Canonical raw field values of a CSV row
+
+        Returns:
+            Dictionary of TransactionCreate field names to values
+
+        Raises:
+            ValueError: If amount conversion fails
+        """
+        transaction_date, post_date, description, category, type_value, amount, memo = fields
 
         # Parse amount
         try:
-            amount = Decimal(row["Amount"].strip())
+            amount_value = Decimal(amount.strip())
         except (InvalidOperation, ValueError) as e:
-            raise ValueError(f"Invalid amount value: {row['Amount']}") from e
+            raise ValueError(f"Invalid amount value: {amount}") from e
 
-        # Create transaction object (this will validate dates and required fields)
-        transaction = TransactionCreate(
-            transaction_date=row["Transaction Date"].strip(),
-            post_date=row["Post Date"].strip(),
-            description=description,
-            category=category,
-            type=type_value,
-            amount=amount,
-            memo=memo,
-        )
+        # Decode HTML entities and strip whitespace
+        return {
+            "transaction_date": transaction_date.strip(),
+            "post_date": post_date.strip(),
+            "description": html.unescape(description.strip()),
+            "category": category.strip() or "Uncategorized",  # Default for empty categories
+            "type": type_value.strip(),
+            "amount": amount_value,
+            "memo": memo.strip(),
+        }
+
+
+class IncrementalCSVParser:
+    """
+    Parse a CSV pushed in chunks into a columnar TransactionBatch.
+
+    Used when the file arrives over several requests: each chunk is parsed
+    as soon as it is received, with decoder, record and header state
+    carried over to the next one.
+    """
+
+    def __init__(self, parser: Optional[CSVParser] = None):
+        """
+        Initialize with no bytes received.
 
-        return transaction
+        Args:
+            parser: Parser providing header validation and row conversion
+        """
+        self._parser = parser or CSVParser()
+        self._rows = CSVRowDecoder(self._parser._compile_mapper)
+        self.batch = TransactionBatch()
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Parse the next chunk of the file.
+
+        Args:
+            chunk: Next bytes of the file
+
+        Raises:
+            CSVParseError: If the chunk contains invalid CSV or rows
+        """
+        for row_num, fields in self._rows.feed(chunk):
+            self._parser._append_numbered_row(self.batch, fields, row_num)
+
+    def close(self) -> TransactionBatch:
+        """
+        Parse whatever is left after the last chunk.
+
+        Returns:
+            TransactionBatch holding every parsed row
+
+        Raises:
+            CSVParseError: If the file is invalid, empty or header-only
+        """
+        for row_num, fields in self._rows.feed(b"", final=True):
+            self._parser._append_numbered_row(self.batch, fields, row_num)
+        self._rows.check_complete()
+        return self.batch
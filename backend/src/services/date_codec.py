@@ -0,0 +1,107 @@
+"""Date codec for MM/DD/YYYY statement dates with bounded memoization."""
+
+import re
+from datetime import date
+from functools import lru_cache
+
+# Statements repeat the same few hundred dates, so a small cache covers
+# years of history while keeping memory bounded.
+DATE_CACHE_SIZE = 4096
+
+# Common case in a single C-level match; anything that does not match
+# falls through to the detailed checks and messages.
+_VALID_DATE_RE = re.compile(
+    r"(0?[1-9]|1[0-2])/(0?[1-9]|[12][0-9]|3[01])/(19[0-9]{2}|20[0-9]{2}|2100)"
+)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: str) -> date:
+    """
+    Parse an MM/DD/YYYY string into a calendar-correct date.
+
+    Args:
+        value: Date string
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If the date is malformed, out of range or does not
+            exist (e.g. 02/31/2025)
+    """
+    match = _VALID_DATE_RE.fullmatch(value)
+    if match:
+        month_int, day_int, year_int = (int(part) for part in match.groups())
+    else:
+        month_int, day_int, year_int = _check_date_parts(value)
+
+    try:
+        return date(year_int, month_int, day_int)
+    except ValueError:
+        raise ValueError(f"Date does not exist: {value}") from None
+
+
+def _check_date_parts(value: str) -> tuple:
+    """Validate date components one by one, with a specific error for each."""
+    if not value:
+        raise ValueError("Date cannot be empty")
+
+    parts = value.split("/")
+    if len(parts) != 3:
+        raise ValueError(f"Date must be in MM/DD/YYYY format, got: {value}")
+
+    month, day, year = parts
+    if not (month.isdigit() and day.isdigit() and year.isdigit()):
+        raise ValueError(f"Date components must be numeric, got: {value}")
+
+    month_int, day_int, year_int = int(month), int(day), int(year)
+    if not (1 <= month_int <= 12):
+        raise ValueError(f"Month must be between 1 and 12, got: {month_int}")
+    if not (1 <= day_int <= 31):
+        raise ValueError(f"Day must be between 1 and 31, got: {day_int}")
+    if year_int < 1900 or year_int > 2100:
+        raise ValueError(f"Year must be between 1900 and 2100, got: {year_int}")
+
+    return month_int, day_int, year_int
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def from_ordinal(ordinal: int) -> date:
+    """
+    Convert a day ordinal back to a date.
+
+    Args:
+        ordinal: Proleptic Gregorian day ordinal (date.toordinal())
+
+    Returns:
+        Corresponding date
+    """
+    return date.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def format_ordinal(ordinal: int) -> str:
+    """
+    Format a day ordinal as an MM/DD/YYYY string.
+
+    Args:
+        ordinal: Proleptic Gregorian day ordinal (date.toordinal())
+
+    Returns:
+        Date string in MM/DD/YYYY format
+    """
+    return date.fromordinal(ordinal).strftime("%m/%d/%Y")
+
+
+def format_date(value: date) -> str:
+    """
+    Format a date as an MM/DD/YYYY string.
+
+    Args:
+        value: Date to format
+
+    Returns:
+        Date string in MM/DD/YYYY format
+    """
+    return format_ordinal(value.toordinal())
@@ -0,0 +1,176 @@
+"""Streaming decompression of compressed CSV uploads (.csv.gz, .csv.zst, .zip)."""
+
+import asyncio
+import gzip
+import os
+import zipfile
+import zlib
+from typing import BinaryIO, Optional, Tuple
+import zstandard
+from src.config import settings
+
+# Upper bound on bytes returned by a single read, whatever size is asked
+MAX_READ_SIZE = 1024 * 1024
+
+COMPRESSED_SUFFIXES = (".csv.gz", ".csv.zst", ".zip")
+
+
+class UploadFormatError(Exception):
+    """Exception raised when a compressed upload cannot be decompressed."""
+
+    pass
+
+
+class DecompressionBombError(UploadFormatError):
+    """Exception raised when an upload inflates beyond the allowed ratio."""
+
+    pass
+
+
+def is_compressed_upload(filename: str) -> bool:
+    """
+    Check whether a filename has a supported compressed CSV suffix.
+
+    Args:
+        filename: Uploaded file name
+
+    Returns:
+        True for .csv.gz, .csv.zst and .zip files
+    """
+    return filename.lower().endswith(COMPRESSED_SUFFIXES)
+
+
+class DecompressedStream:
+    """
+    Async reader over a decompressing file object.
+
+    Reads are run in a worker thread and capped at MAX_READ_SIZE, so at
+    most one bounded chunk of decompressed data is held at a time. The
+    running output size is checked against a limit derived from the
+    compressed size, which stops decompression bombs before they inflate,
+    and against an absolute cap, which bounds the memory the parsed rows
+    take.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        compressed_size: int,
+        max_ratio: Optional[int] = None,
+        max_decompressed_size: Optional[int] = None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            stream: Decompressing file object (gzip, zstd or zip entry)
+            compressed_size: Size of the compressed upload in bytes
+            max_ratio: Maximum decompressed/compressed size ratio
+            max_decompressed_size: Maximum decompressed size in bytes
+        """
+        self.max_ratio = max_ratio or settings.max_decompression_ratio
+        max_decompressed_size = max_decompressed_size or settings.max_decompressed_size
+        # Tiny files compress extremely well, so always allow at least
+        # as much as an uncompressed upload could contain
+        ratio_limit = max(compressed_size * self.max_ratio, settings.max_upload_size)
+        if ratio_limit <= max_decompressed_size:
+            self.max_size = ratio_limit
+            self.limit_message = f"Decompressed upload exceeds {self.max_ratio}x its compressed size"
+        else:
+            self.max_size = max_decompressed_size
+            self.limit_message = f"Decompressed upload exceeds maximum size of {max_decompressed_size} bytes"
+        self.bytes_read = 0
+        self._stream = stream
+
+    async def read(self, size: int = -1) -> bytes:
+        """
+        Read the next chunk of decompressed bytes.
+
+        Args:
+            size: Maximum number of bytes to return (capped at MAX_READ_SIZE)
+
+        Returns:
+            Decompressed bytes; empty bytes at end of stream
+
+        Raises:
+            DecompressionBombError: If the output exceeds the allowed ratio or size
+            UploadFormatError: If the compressed data is corrupt
+        """
+        if size < 0 or size > MAX_READ_SIZE:
+            size = MAX_READ_SIZE
+
+        try:
+            chunk = await asyncio.to_thread(self._stream.read, size)
+        except (OSError, EOFError, zlib.error, zipfile.BadZipFile, zstandard.ZstdError) as e:
+            raise UploadFormatError(f"Corrupt compressed upload: {str(e)}") from e
+
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self.max_size:
+            raise DecompressionBombError(self.limit_message)
+        return chunk
+
+
+def open_decompressed(
+    filename: str,
+    fileobj: BinaryIO,
+    max_ratio: Optional[int] = None,
+    max_decompressed_size: Optional[int] = None,
+) -> DecompressedStream:
+    """
+    Open a compressed upload for streaming decompression.
+
+    Args:
+        filename: Uploaded file name, used to pick the format
+        fileobj: Seekable binary file holding the compressed upload
+        max_ratio: Maximum decompressed/compressed size ratio
+        max_decompressed_size: Maximum decompressed size in bytes
+
+    Returns:
+        DecompressedStream yielding the CSV bytes
+
+    Raises:
+        UploadFormatError: If the format is unsupported or the archive is invalid
+        DecompressionBombError: If a zip entry declares an oversized payload
+    """
+    compressed_size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    name = filename.lower()
+    declared_size = 0
+
+    if name.endswith(".csv.gz"):
+        stream = gzip.GzipFile(fileobj=fileobj, mode="rb")
+    elif name.endswith(".csv.zst"):
+        stream = zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True)
+    elif name.endswith(".zip"):
+        info, stream = _open_zip_entry(fileobj)
+        declared_size = info.file_size
+    else:
+        raise UploadFormatError(f"Unsupported compressed upload: {filename}")
+
+    result = DecompressedStream(stream, compressed_size, max_ratio, max_decompressed_size)
+    if declared_size > result.max_size:
+        raise DecompressionBombError(result.limit_message)
+    return result
+
+
+def _open_zip_entry(fileobj: BinaryIO) -> Tuple[zipfile.ZipInfo, BinaryIO]:
+    """Open the single CSV entry of a zip archive, returning its info and stream."""
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile as e:
+        raise UploadFormatError(f"Invalid ZIP archive: {str(e)}") from e
+
+    # Ignore directories and the resource forks macOS adds to archives
+    entries = [
+        info for info in archive.infolist()
+        if not info.is_dir() and not info.filename.startswith("__MACOSX/")
+    ]
+    if len(entries) != 1:
+        raise UploadFormatError("ZIP archive must contain exactly one CSV file")
+    if not entries[0].filename.lower().endswith(".csv"):
+        raise UploadFormatError("ZIP archive must contain a CSV file")
+
+    try:
+        return entries[0], archive.open(entries[0])
+    except (RuntimeError, NotImplementedError, zipfile.BadZipFile) as e:
+        raise UploadFormatError(f"Cannot read ZIP entry: {str(e)}") from e
@@ -0,0 +1,80 @@
+"""Delta ingestion: detect uploads that extend an already ingested file."""
+
+import hashlib
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+from src.models import UploadFingerprint
+
+# Bytes hashed per read
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def digest_with_prefixes(
+    fileobj: BinaryIO, prefix_sizes: Iterable[int]
+) -> Tuple[str, Dict[int, str]]:
+    """
+    Hash a file, also recording the digest of each requested prefix.
+
+    The SHA-256 state is copied whenever the running length reaches one of
+    ``prefix_sizes``, so every prefix digest comes out of the same single
+    pass that produces the full-file digest. The file is rewound afterwards.
+
+    Args:
+        fileobj: Seekable binary file
+        prefix_sizes: Prefix lengths in bytes to record digests for
+
+    Returns:
+        Tuple of (full-file hex digest, prefix length -> hex digest)
+    """
+    fileobj.seek(0)
+    digest = hashlib.sha256()
+    prefixes: Dict[int, str] = {}
+    position = 0
+
+    for size in sorted(set(prefix_sizes)):
+        while position < size:
+            chunk = fileobj.read(min(HASH_CHUNK_SIZE, size - position))
+            if not chunk:
+                break
+            digest.update(chunk)
+            position += len(chunk)
+        if position == size:
+            prefixes[size] = digest.copy().hexdigest()
+
+    while chunk := fileobj.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+
+    fileobj.seek(0)
+    return digest.hexdigest(), prefixes
+
+
+def find_delta_base(
+    fileobj: BinaryIO,
+    candidates: List[UploadFingerprint],
+    prefixes: Dict[int, str],
+) -> Optional[UploadFingerprint]:
+    """
+    Find the largest earlier upload that the file starts with.
+
+    A candidate matches when the digest of the file's first ``file_size``
+    bytes equals the candidate's file hash and that offset is a record
+    boundary, i.e. the earlier file's last row is complete in this one.
+
+    Args:
+        fileobj: Seekable binary file being uploaded
+        candidates: Earlier uploads smaller than the file
+        prefixes: Prefix digests from digest_with_prefixes()
+
+    Returns:
+        Matching upload fingerprint or None
+    """
+    for candidate in sorted(candidates, key=lambda c: c.file_size, reverse=True):
+        if prefixes.get(candidate.file_size) != candidate.file_hash:
+            continue
+        fileobj.seek(candidate.file_size - 1)
+        boundary = fileobj.read(2)
+        fileobj.seek(0)
+        # Either the earlier file ended with a newline, or this file
+        # terminates its last row right where the earlier file stopped
+        if boundary[:1] == b"\n" or boundary[1:2] in (b"\r", b"\n"):
+            return candidate
+    return None
@@ -0,0 +1,87 @@
+"""Integer-cents money kernel: parsing and conversion."""
+
+import re
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+from src.services.pagination import INT8_MAX, INT8_MIN
+
+# Plain amounts with at most two decimal places, parsed without Decimal
+_AMOUNT_RE = re.compile(r"([+-]?)([0-9]+)(?:\.([0-9]{0,2}))?")
+
+
+def parse_cents(value: str) -> int:
+    """
+    Parse a decimal amount string into integer cents.
+
+    Amounts with more than two decimal places are rounded half-to-even,
+    matching how a NUMERIC(10, 2) column would store them.
+
+    Args:
+        value: Amount string (e.g. "-45.74")
+
+    Returns:
+        Amount in cents (e.g. -4574)
+
+    Raises:
+        ValueError: If the value is not a finite number, or its cents do
+            not fit the BIGINT amount column
+    """
+    match = _AMOUNT_RE.fullmatch(value)
+    if match:
+        sign, whole, fraction = match.groups()
+        cents = int(whole) * 100 + int((fraction or "").ljust(2, "0"))
+        cents = -cents if sign == "-" else cents
+        if not INT8_MIN <= cents <= INT8_MAX:
+            raise ValueError(f"Amount is out of range: {value}")
+        return cents
+
+    try:
+        amount = Decimal(value)
+    except (InvalidOperation, ValueError) as e:
+        raise ValueError(f"Invalid amount value: {value}") from e
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount value: {value}")
+    # Checked before rounding, which would expand huge exponents to every
+    # digit; amounts of 10**18 or more cannot fit, whatever their cents
+    if amount.adjusted() >= 18 or not INT8_MIN <= amount.scaleb(2) <= INT8_MAX:
+        raise ValueError(f"Amount is out of range: {value}")
+    return decimal_to_cents(amount)
+
+
+def decimal_to_cents(amount: Decimal) -> int:
+    """
+    Convert a Decimal amount to integer cents.
+
+    Args:
+        amount: Decimal amount
+
+    Returns:
+        Amount in cents, rounded half-to-even
+    """
+    return int(amount.scaleb(2).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """
+    Convert integer cents to a two-place Decimal amount.
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Decimal amount (e.g. -4574 -> Decimal("-45.74"))
+    """
+    return Decimal(cents).scaleb(-2)
+
+
+def cents_to_float(cents: int) -> float:
+    """
+    Convert integer cents to a float for JSON responses.
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Amount in currency units
+    """
+    return cents / 100
+
@@ -0,0 +1,247 @@
+"""Natural keys identifying a transaction across overlapping statements."""
+
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Optional
+
+# Descriptions repeat heavily (same merchants every month)
+DESCRIPTION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DESCRIPTION_CACHE_SIZE)
+def normalize_description(description: str) -> str:
+    """
+    Normalize a description for key comparison.
+
+    Collapses runs of whitespace, trims and upper-cases, so cosmetic
+    differences between exports of the same charge do not matter. Unicode
+    aware, so keys are only ever computed in Python (migration 0005 also
+    backfills with this function).
+
+    Args:
+        description: Raw transaction description
+
+    Returns:
+        Normalized description
+    """
+    return " ".join(description.split()).upper()
+
+
+def natural_key_hash(
+    transaction_date: date,
+    post_date: date,
+    description: str,
+    amount_cents: int,
+    occurrence: int,
+) -> bytes:
+    """
+    Hash the natural key of a transaction.
+
+    Args:
+        transaction_date: Transaction date
+        post_date: Post date
+        description: Normalized description
+        amount_cents: Amount in cents
+        occurrence: Index among identical transactions in the same upload
+
+    Returns:
+        32-byte SHA-256 digest
+    """
+    base = _base_string(transaction_date, post_date, description, amount_cents)
+    return hashlib.sha256(f"{base}|{occurrence}".encode("utf-8")).digest()
+
+
+def transaction_base_hash(
+    transaction_date: date,
+    post_date: date,
+    description: str,
+    amount_cents: int,
+) -> int:
+    """
+    Get the 64-bit base hash of a transaction, as stored in occurrence indexes.
+
+    Args:
+        transaction_date: Transaction date
+        post_date: Post date
+        description: Raw transaction description
+        amount_cents: Amount in cents
+
+    Returns:
+        Base hash shared by every occurrence of the transaction
+    """
+    return _base_hash(_base_string(transaction_date, post_date, normalize_description(description), amount_cents))
+
+
+def find_occurrence(
+    natural_key: bytes,
+    transaction_date: date,
+    post_date: date,
+    description: str,
+    amount_cents: int,
+    limit: int,
+) -> Optional[int]:
+    """
+    Find the occurrence a stored natural key was built with.
+
+    Args:
+        natural_key: Stored natural key hash
+        transaction_date: Transaction date
+        post_date: Post date
+        description: Raw transaction description
+        amount_cents: Amount in cents
+        limit: Number of occurrences to try, from 0
+
+    Returns:
+        Occurrence index, or None if none below the limit matches
+    """
+    base = _base_string(transaction_date, post_date, normalize_description(description), amount_cents)
+    for occurrence in range(limit):
+        if hashlib.sha256(f"{base}|{occurrence}".encode("utf-8")).digest() == natural_key:
+            return occurrence
+    return None
+
+
+def _base_string(transaction_date: date, post_date: date, description: str, amount_cents: int) -> str:
+    """Key material shared by every occurrence of the same transaction."""
+    return f"{transaction_date.isoformat()}|{post_date.isoformat()}|{description}|{amount_cents}"
+
+
+def _base_hash(base: str) -> int:
+    """64-bit hash identifying a transaction regardless of its occurrence."""
+    return int.from_bytes(hashlib.blake2b(base.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class OccurrenceIndex:
+    """
+    Sorted multiset of the 64-bit base hashes of an upload's rows.
+
+    Stored with each upload so a later file extending it can number its
+    new rows' occurrences as if the whole file had been keyed, without
+    re-reading the rows it shares with the earlier upload.
+    """
+
+    def __init__(self, hashes: Optional[Iterable[int]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            hashes: Base hashes, in any order
+        """
+        self._hashes = array("Q", sorted(hashes or ()))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "OccurrenceIndex":
+        """
+        Load an index serialized with to_bytes().
+
+        Args:
+            data: Serialized index
+
+        Returns:
+            OccurrenceIndex
+        """
+        index = cls()
+        index._hashes.frombytes(data)
+        return index
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index (8 bytes per row)."""
+        return self._hashes.tobytes()
+
+    def count(self, base_hash: int) -> int:
+        """
+        Count the rows with a given base hash.
+
+        Args:
+            base_hash: 64-bit base hash
+
+        Returns:
+            Number of occurrences in the index
+        """
+        return bisect_right(self._hashes, base_hash) - bisect_left(self._hashes, base_hash)
+
+    def merged(self, hashes: Iterable[int]) -> "OccurrenceIndex":
+        """
+        Build a new index containing this index's rows plus more.
+
+        Args:
+            hashes: Base hashes of the additional rows
+
+        Returns:
+            New OccurrenceIndex
+        """
+        return OccurrenceIndex(chain(self._hashes, hashes))
+
+    def __len__(self) -> int:
+        """Number of rows in the index."""
+        return len(self._hashes)
+
+
+class NaturalKeyBuilder:
+    """
+    Builds natural keys for the transactions of one upload, in file order.
+
+    Legitimate repeats (two identical coffees on the same day) get
+    increasing occurrence indexes, so they keep distinct keys while the
+    same pair appearing again in an overlapping statement maps onto the
+    keys already stored.
+
+    When the rows are the suffix of a file whose prefix was already
+    ingested, the prefix's OccurrenceIndex is passed as ``prior`` and
+    occurrences continue from the prefix's counts.
+    """
+
+    def __init__(self, prior: Optional[OccurrenceIndex] = None):
+        """
+        Initialize with no transactions seen.
+
+        Args:
+            prior: Occurrence index of rows preceding these in the same file
+        """
+        self.prior = prior
+        self.base_hashes = array("Q")
+        self._occurrences: Dict[str, int] = {}
+
+    def key(
+        self,
+        transaction_date: date,
+        post_date: date,
+        description: str,
+        amount_cents: int,
+    ) -> bytes:
+        """
+        Get the natural key of the next transaction.
+
+        Args:
+            transaction_date: Transaction date
+            post_date: Post date
+            description: Raw transaction description
+            amount_cents: Amount in cents
+
+        Returns:
+            32-byte natural key hash
+        """
+        base = _base_string(transaction_date, post_date, normalize_description(description), amount_cents)
+        base_hash = _base_hash(base)
+        self.base_hashes.append(base_hash)
+
+        occurrence = self._occurrences.get(base)
+        if occurrence is None:
+            occurrence = self.prior.count(base_hash) if self.prior is not None else 0
+        self._occurrences[base] = occurrence + 1
+        return hashlib.sha256(f"{base}|{occurrence}".encode("utf-8")).digest()
+
+    def occurrence_index(self) -> OccurrenceIndex:
+        """
+        Get the occurrence index of the prior rows plus every row keyed so far.
+
+        Returns:
+            OccurrenceIndex to store with the upload
+        """
+        if self.prior is not None:
+            return self.prior.merged(self.base_hashes)
+        return OccurrenceIndex(self.base_hashes)
@@ -0,0 +1,65 @@
+"""Opaque cursors for keyset (seek) pagination."""
+
+import base64
+import binascii
+import json
+from typing import Sequence, Tuple, Union
+
+CursorValue = Union[int, str]
+
+# Bounds of the Postgres integer columns cursor values are compared with
+INT4_MAX = 2**31 - 1
+INT8_MIN = -(2**63)
+INT8_MAX = 2**63 - 1
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+def encode_cursor(values: Sequence[CursorValue]) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    Args:
+        values: Sort key values of the row, ending with its ID
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[CursorValue, ...]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string from a previous page
+        types: Expected type of each sort key value
+
+    Returns:
+        Tuple of sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, does not match the
+            types or holds an integer outside the bigint range
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursorError("Invalid pagination cursor")
+    for value, expected in zip(values, types):
+        # bool is an int subclass, but never a valid key
+        if type(value) is not expected:
+            raise InvalidCursorError("Invalid pagination cursor")
+        if expected is int and not INT8_MIN <= value <= INT8_MAX:
+            raise InvalidCursorError("Invalid pagination cursor")
+    return tuple(values)
@@ -0,0 +1,191 @@
+"""Content-addressed cache of parsed uploads, keyed by SHA-256 of the raw bytes."""
+
+import asyncio
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+from src.config import settings
+from src.services.transaction_batch import TransactionBatch
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters of a ParseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    disk_writes: int = 0
+    disk_evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class ParseCache:
+    """
+    Two-tier cache of parsed TransactionBatches keyed by content digest.
+
+    The memory tier is an LRU bounded by the approximate size of the
+    cached batches. When a directory is configured, batches are also
+    written to disk (TransactionBatch.to_bytes(), which cannot run code
+    when loaded), so entries evicted from memory (or lost on restart) can
+    be reloaded without re-parsing; the disk tier is bounded by total file
+    size, oldest files first. Disk reads and writes run in worker threads.
+
+    Cached batches are shared between requests and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget of the in-process tier (0 disables it)
+            disk_dir: Directory for the on-disk tier, or None to disable it
+            disk_max_bytes: Size budget of the on-disk tier
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, TransactionBatch]" = OrderedDict()
+        self._sizes: dict = {}
+
+        if self.disk_dir is not None:
+            # Entries are only readable by this service's user
+            self.disk_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    async def get(self, key: str) -> Optional[TransactionBatch]:
+        """
+        Look up a parsed batch, falling back to the disk tier.
+
+        Args:
+            key: Content digest of the upload
+
+        Returns:
+            Cached TransactionBatch or None on a miss
+        """
+        batch = self._entries.get(key)
+        if batch is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return batch
+
+        batch = await asyncio.to_thread(self._read_disk, key) if self.disk_dir is not None else None
+        if batch is not None:
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._store(key, batch)
+            return batch
+
+        self.stats.misses += 1
+        return None
+
+    async def put(self, key: str, batch: TransactionBatch) -> None:
+        """
+        Cache a parsed batch in both tiers.
+
+        The disk write (serialization and eviction) runs in a worker
+        thread, off the event loop.
+
+        Args:
+            key: Content digest of the upload
+            batch: Parsed batch for that content
+        """
+        self._store(key, batch)
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, batch)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk tier is left untouched)."""
+        self._entries.clear()
+        self._sizes.clear()
+        self.stats.entries = 0
+        self.stats.bytes = 0
+
+    def _store(self, key: str, batch: TransactionBatch) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        size = batch.nbytes()
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self.stats.bytes -= self._sizes[key]
+        self._entries[key] = batch
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self.stats.bytes += size
+
+        while self.stats.bytes > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)
+            self.stats.bytes -= self._sizes.pop(evicted)
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
+
+    def _disk_path(self, key: str) -> Path:
+        """Path of a key's file in the disk tier."""
+        return self.disk_dir / f"{key}.batch"
+
+    def _read_disk(self, key: str) -> Optional[TransactionBatch]:
+        """Load a batch from the disk tier, if present."""
+        try:
+            return TransactionBatch.from_bytes(self._disk_path(key).read_bytes())
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable entries are misses, rewritten on put
+            return None
+
+    def _write_disk(self, key: str, batch: TransactionBatch) -> None:
+        """Atomically write a batch to the disk tier and enforce its budget."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(batch.to_bytes())
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+        self.stats.disk_writes += 1
+
+        files = []
+        for path in self.disk_dir.glob("*.batch"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process sharing the directory
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.disk_max_bytes:
+                break
+            total -= size
+            path.unlink(missing_ok=True)
+            self.stats.disk_evictions += 1
+
+    def stats_dict(self) -> dict:
+        """
+        Get cache counters for the stats endpoint.
+
+        Returns:
+            Dictionary of counter name to value
+        """
+        return asdict(self.stats)
+
+
+parse_cache = ParseCache(
+    max_bytes=settings.parse_cache_max_bytes,
+    disk_dir=settings.parse_cache_dir,
+    disk_max_bytes=settings.parse_cache_disk_max_bytes,
+)
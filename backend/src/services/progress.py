@@ -0,0 +1,192 @@
+"""Progress of in-flight uploads, sampled for Server-Sent Events."""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import AsyncIterator, Dict, Optional
+
+
+class UploadStage(str, Enum):
+    """Stages an upload goes through, in order."""
+
+    RECEIVING = "receiving"
+    PARSING = "parsing"
+    PERSISTING = "persisting"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class UploadProgress:
+    """
+    Counters of one upload, written by the code doing the work.
+
+    Producers only assign plain attributes, at chunk or range granularity,
+    so updating progress costs next to nothing; subscribers sample the
+    counters at their own throttled rate. Validation happens as rows are
+    parsed, so ``rows_parsed`` counts rows that passed validation.
+    """
+
+    stage: UploadStage = UploadStage.RECEIVING
+    bytes_received: int = 0
+    bytes_total: Optional[int] = None
+    rows_parsed: int = 0
+    rows_total: Optional[int] = None
+    rows_persisted: int = 0
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """True once the upload succeeded or failed."""
+        return self.stage in (UploadStage.DONE, UploadStage.FAILED)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """
+        Mark the upload done, or failed with an error message.
+
+        Args:
+            error: Error message if the upload failed
+        """
+        self.error = error
+        self.stage = UploadStage.FAILED if error else UploadStage.DONE
+        self.finished_at = time.monotonic()
+
+    def to_response(self) -> dict:
+        """
+        Get the progress as an API response dictionary.
+
+        Returns:
+            Dictionary with camelCase keys
+        """
+        return {
+            "stage": self.stage.value,
+            "bytesReceived": self.bytes_received,
+            "bytesTotal": self.bytes_total,
+            "rowsParsed": self.rows_parsed,
+            "rowsTotal": self.rows_total,
+            "rowsPersisted": self.rows_persisted,
+            "error": self.error,
+        }
+
+
+class ProgressRegistry:
+    """
+    Process-local registry of upload progress, keyed by a client-chosen ID.
+
+    Only uploads create entries. The event stream may arrive first, so it
+    waits a short grace period for the upload to register, and never
+    creates an entry itself. Entries are pruned a while after they
+    finish, or if they never finish, and the oldest is dropped when the
+    registry is full.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 600.0,
+        finished_ttl_seconds: float = 60.0,
+        register_grace_seconds: float = 10.0,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize an empty registry.
+
+        Args:
+            ttl_seconds: Age after which unfinished entries are dropped
+            finished_ttl_seconds: Time finished entries stay readable
+            register_grace_seconds: Time a stream waits for its upload to start
+            max_entries: Maximum number of entries kept
+        """
+        self.ttl_seconds = ttl_seconds
+        self.finished_ttl_seconds = finished_ttl_seconds
+        self.register_grace_seconds = register_grace_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, UploadProgress] = {}
+
+    def get(self, progress_id: str) -> Optional[UploadProgress]:
+        """
+        Get the progress of an upload.
+
+        Args:
+            progress_id: Client-chosen upload ID
+
+        Returns:
+            UploadProgress, or None if no upload registered the ID
+        """
+        self._prune()
+        return self._entries.get(progress_id)
+
+    def start(self, progress_id: str) -> UploadProgress:
+        """
+        Register the progress entry of a new upload.
+
+        An unfinished entry with the same ID is reused; a finished one left
+        over from an earlier upload is replaced.
+
+        Args:
+            progress_id: Client-chosen upload ID
+
+        Returns:
+            UploadProgress for the upload
+        """
+        progress = self.get(progress_id)
+        if progress is None or progress.finished:
+            self._entries.pop(progress_id, None)
+            if len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so this is the oldest entry
+                del self._entries[next(iter(self._entries))]
+            progress = self._entries[progress_id] = UploadProgress()
+        return progress
+
+    async def events(self, progress_id: str, interval: float) -> AsyncIterator[str]:
+        """
+        Stream an upload's progress as Server-Sent Events.
+
+        The counters are sampled every ``interval`` seconds and an event is
+        sent only when they changed. The stream ends after the final state,
+        when the upload has not finished within the registry's TTL, or
+        without events when no upload registers the ID within the grace
+        period.
+
+        Args:
+            progress_id: Client-chosen upload ID
+            interval: Seconds between samples
+
+        Yields:
+            ``progress`` events with the JSON-encoded counters
+        """
+        deadline = time.monotonic() + self.register_grace_seconds
+        while (progress := self.get(progress_id)) is None:
+            if time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(interval)
+
+        last = None
+        while True:
+            # Read before sampling, so the last event carries the final state
+            finished = progress.finished
+            snapshot = progress.to_response()
+            if snapshot != last:
+                yield f"event: progress\ndata: {json.dumps(snapshot)}\n\n"
+                last = snapshot
+            if finished or time.monotonic() - progress.created_at > self.ttl_seconds:
+                return
+            await asyncio.sleep(interval)
+
+    def _prune(self) -> None:
+        """Drop expired entries."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, progress in self._entries.items()
+            if now - progress.created_at > self.ttl_seconds
+            or (progress.finished_at is not None and now - progress.finished_at > self.finished_ttl_seconds)
+        ]
+        for key in expired:
+            del self._entries[key]
+
+
+progress_registry = ProgressRegistry()
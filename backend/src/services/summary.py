@@ -0,0 +1,177 @@
+"""Single-pass, mergeable transaction summary accumulator."""
+
+from datetime import date
+from typing import Dict, Optional
+from src.services.date_codec import from_ordinal
+from src.services.money import cents_to_float
+
+
+class SummaryAccumulator:
+    """
+    Running summary of transactions, fed one row at a time.
+
+    Tracks spending, income, row count, date span, net totals per
+    category and counts per type in one pass. Accumulators built over
+    separate parts of a file (e.g. parallel parse ranges) can be combined
+    with merge().
+    """
+
+    def __init__(self):
+        """Initialize an empty summary."""
+        self.spent_cents = 0
+        self.income_cents = 0
+        self.count = 0
+        self.min_date_ordinal: Optional[int] = None
+        self.max_date_ordinal: Optional[int] = None
+        self.category_totals: Dict[str, int] = {}
+        self.type_counts: Dict[str, int] = {}
+
+    def add(self, date_ordinal: int, category: str, type: str, amount_cents: int) -> None:
+        """
+        Add a single transaction.
+
+        Args:
+            date_ordinal: Transaction date as a day ordinal
+            category: Transaction category
+            type: Transaction type (e.g., Sale, Payment)
+            amount_cents: Transaction amount in cents (negative for spending)
+        """
+        if amount_cents < 0:
+            self.spent_cents -= amount_cents
+        else:
+            self.income_cents += amount_cents
+        self.count += 1
+
+        if self.min_date_ordinal is None or date_ordinal < self.min_date_ordinal:
+            self.min_date_ordinal = date_ordinal
+        if self.max_date_ordinal is None or date_ordinal > self.max_date_ordinal:
+            self.max_date_ordinal = date_ordinal
+
+        self.category_totals[category] = self.category_totals.get(category, 0) + amount_cents
+        self.type_counts[type] = self.type_counts.get(type, 0) + 1
+
+    def add_group(
+        self,
+        first_ordinal: int,
+        last_ordinal: int,
+        category: str,
+        type: str,
+        count: int,
+        spent_cents: int,
+        income_cents: int,
+    ) -> None:
+        """
+        Add a group of transactions sharing a category and type.
+
+        Args:
+            first_ordinal: Earliest transaction date in the group as a day ordinal
+            last_ordinal: Latest transaction date in the group as a day ordinal
+            category: Transaction category
+            type: Transaction type (e.g., Sale, Payment)
+            count: Number of transactions in the group
+            spent_cents: Total spending in the group, as a positive amount
+            income_cents: Total income in the group
+        """
+        self.spent_cents += spent_cents
+        self.income_cents += income_cents
+        self.count += count
+
+        if self.min_date_ordinal is None or first_ordinal < self.min_date_ordinal:
+            self.min_date_ordinal = first_ordinal
+        if self.max_date_ordinal is None or last_ordinal > self.max_date_ordinal:
+            self.max_date_ordinal = last_ordinal
+
+        self.category_totals[category] = self.category_totals.get(category, 0) + income_cents - spent_cents
+        self.type_counts[type] = self.type_counts.get(type, 0) + count
+
+    def merge(self, other: "SummaryAccumulator") -> None:
+        """
+        Fold another accumulator into this one.
+
+        Args:
+            other: Accumulator to merge in
+        """
+        self.spent_cents += other.spent_cents
+        self.income_cents += other.income_cents
+        self.count += other.count
+
+        for ordinal in (other.min_date_ordinal, other.max_date_ordinal):
+            if ordinal is None:
+                continue
+            if self.min_date_ordinal is None or ordinal < self.min_date_ordinal:
+                self.min_date_ordinal = ordinal
+            if self.max_date_ordinal is None or ordinal > self.max_date_ordinal:
+                self.max_date_ordinal = ordinal
+
+        for category, cents in other.category_totals.items():
+            self.category_totals[category] = self.category_totals.get(category, 0) + cents
+        for type_value, count in other.type_counts.items():
+            self.type_counts[type_value] = self.type_counts.get(type_value, 0) + count
+
+    def to_dict(self) -> dict:
+        """
+        Get the accumulator's state as JSON-serializable values.
+
+        Returns:
+            Dictionary accepted by from_dict()
+        """
+        return {
+            "spent_cents": self.spent_cents,
+            "income_cents": self.income_cents,
+            "count": self.count,
+            "min_date_ordinal": self.min_date_ordinal,
+            "max_date_ordinal": self.max_date_ordinal,
+            "category_totals": self.category_totals,
+            "type_counts": self.type_counts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SummaryAccumulator":
+        """
+        Restore an accumulator saved with to_dict().
+
+        Args:
+            data: Saved state
+
+        Returns:
+            SummaryAccumulator
+        """
+        summary = cls()
+        summary.spent_cents = data["spent_cents"]
+        summary.income_cents = data["income_cents"]
+        summary.count = data["count"]
+        summary.min_date_ordinal = data["min_date_ordinal"]
+        summary.max_date_ordinal = data["max_date_ordinal"]
+        summary.category_totals = data["category_totals"]
+        summary.type_counts = data["type_counts"]
+        return summary
+
+    @property
+    def min_date(self) -> Optional[date]:
+        """Earliest transaction date, or None if empty."""
+        return from_ordinal(self.min_date_ordinal) if self.min_date_ordinal is not None else None
+
+    @property
+    def max_date(self) -> Optional[date]:
+        """Latest transaction date, or None if empty."""
+        return from_ordinal(self.max_date_ordinal) if self.max_date_ordinal is not None else None
+
+    def to_response(self) -> dict:
+        """
+        Build the summary payload returned by the upload and analytics endpoints.
+
+        Returns:
+            Dictionary with totalSpent, totalIncome, netAmount,
+            transactionCount and avgTransactionAmount
+        """
+        return {
+            "totalSpent": cents_to_float(self.spent_cents),
+            "totalIncome": cents_to_float(self.income_cents),
+            "netAmount": cents_to_float(self.income_cents - self.spent_cents),
+            "transactionCount": self.count,
+            "avgTransactionAmount": (
+                cents_to_float(self.income_cents + self.spent_cents) / self.count
+                if self.count > 0
+                else 0
+            ),
+        }
@@ -0,0 +1,304 @@
+"""Columnar transaction storage for bulk parsing, summaries and ingestion."""
+
+import json
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Dict, Iterator, List, NamedTuple, Optional
+from src.services.date_codec import format_ordinal, from_ordinal
+from src.services.natural_key import NaturalKeyBuilder
+from src.services.summary import SummaryAccumulator
+
+
+class StringTable:
+    """Dictionary of interned strings addressed by integer codes."""
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        """
+        Get the code for a string, adding it to the table if new.
+
+        Args:
+            value: String to encode
+
+        Returns:
+            Integer code for the string
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        """Number of distinct strings in the table."""
+        return len(self.values)
+
+
+# Serialized batch: magic, JSON header length, JSON header, column buffers
+_MAGIC = b"TXB1"
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+class TransactionRow(NamedTuple):
+    """Decoded view of a single batch row."""
+
+    transaction_date: str
+    post_date: str
+    description: str
+    category: str
+    type: str
+    amount_cents: int
+    memo: str
+
+
+class TransactionBatch:
+    """
+    Column-oriented batch of parsed transactions.
+
+    Dates are stored as int32 day ordinals, amounts as int64 cents, and
+    the repetitive string fields as int32 codes into per-column string
+    tables. A batch of N rows therefore costs a handful of machine words
+    per row instead of one pydantic model per row.
+
+    The batch keeps a SummaryAccumulator up to date as rows are appended,
+    so the summary is available without a second pass over the columns.
+    """
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.transaction_dates = array("i")
+        self.post_dates = array("i")
+        self.amounts = array("q")
+        self.descriptions = array("i")
+        self.categories = array("i")
+        self.types = array("i")
+        self.memos = array("i")
+
+        self.description_table = StringTable()
+        self.category_table = StringTable()
+        self.type_table = StringTable()
+        self.memo_table = StringTable()
+
+        self.summary = SummaryAccumulator()
+
+    def append(
+        self,
+        transaction_date: date,
+        post_date: date,
+        description: str,
+        category: str,
+        type: str,
+        amount_cents: int,
+        memo: str,
+    ) -> None:
+        """
+        Append a validated transaction to the batch.
+
+        Args:
+            transaction_date: Transaction date
+            post_date: Post date
+            description: Merchant/transaction description
+            category: Transaction category
+            type: Transaction type (e.g., Sale, Payment)
+            amount_cents: Transaction amount in cents
+            memo: Additional memo/notes
+        """
+        date_ordinal = transaction_date.toordinal()
+        self.transaction_dates.append(date_ordinal)
+        self.post_dates.append(post_date.toordinal())
+        self.amounts.append(amount_cents)
+        self.descriptions.append(self.description_table.encode(description))
+        self.categories.append(self.category_table.encode(category))
+        self.types.append(self.type_table.encode(type))
+        self.memos.append(self.memo_table.encode(memo))
+        self.summary.add(date_ordinal, category, type, amount_cents)
+
+    def extend(self, other: "TransactionBatch") -> None:
+        """
+        Append all rows of another batch, re-encoding its string codes.
+
+        Args:
+            other: Batch whose rows are appended after this batch's rows
+        """
+        self.transaction_dates.extend(other.transaction_dates)
+        self.post_dates.extend(other.post_dates)
+        self.amounts.extend(other.amounts)
+        for table, codes, other_table, other_codes in (
+            (self.description_table, self.descriptions, other.description_table, other.descriptions),
+            (self.category_table, self.categories, other.category_table, other.categories),
+            (self.type_table, self.types, other.type_table, other.types),
+            (self.memo_table, self.memos, other.memo_table, other.memos),
+        ):
+            remap = [table.encode(value) for value in other_table.values]
+            codes.extend(remap[code] for code in other_codes)
+        self.summary.merge(other.summary)
+
+    def __len__(self) -> int:
+        """Number of rows in the batch."""
+        return len(self.amounts)
+
+    def _columns(self) -> List[array]:
+        """Column buffers, in serialization order."""
+        return [
+            self.transaction_dates, self.post_dates, self.amounts,
+            self.descriptions, self.categories, self.types, self.memos,
+        ]
+
+    def _tables(self) -> Dict[str, StringTable]:
+        """String tables by name, in serialization order."""
+        return {
+            "description": self.description_table,
+            "category": self.category_table,
+            "type": self.type_table,
+            "memo": self.memo_table,
+        }
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the batch as JSON metadata followed by the raw column buffers.
+
+        Unlike pickle, loading the result cannot run code.
+
+        Returns:
+            Serialized batch, loadable with from_bytes()
+        """
+        header = json.dumps({
+            "rows": len(self),
+            "byteorder": sys.byteorder,
+            "tables": {name: table.values for name, table in self._tables().items()},
+            "summary": self.summary.to_dict(),
+        }).encode("utf-8")
+        return b"".join(
+            [_MAGIC, _HEADER_LENGTH.pack(len(header)), header]
+            + [column.tobytes() for column in self._columns()]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TransactionBatch":
+        """
+        Load a batch serialized with to_bytes().
+
+        Args:
+            data: Serialized batch
+
+        Returns:
+            TransactionBatch
+
+        Raises:
+            ValueError: If the data is not a valid serialized batch
+        """
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a serialized transaction batch")
+        offset = len(_MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(data, len(_MAGIC))
+        header = json.loads(data[offset:offset + header_length])
+        offset += header_length
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("Transaction batch was serialized with another byte order")
+
+        batch = cls()
+        rows = header["rows"]
+        for column in batch._columns():
+            size = rows * column.itemsize
+            if offset + size > len(data):
+                raise ValueError("Transaction batch is truncated")
+            column.frombytes(data[offset:offset + size])
+            offset += size
+        if offset != len(data):
+            raise ValueError("Transaction batch has trailing data")
+
+        codes = (batch.descriptions, batch.categories, batch.types, batch.memos)
+        for (name, table), column in zip(batch._tables().items(), codes):
+            for value in header["tables"][name]:
+                table.encode(value)
+            if column and not 0 <= min(column) <= max(column) < len(table):
+                raise ValueError(f"Transaction batch has invalid {name} codes")
+        batch.summary = SummaryAccumulator.from_dict(header["summary"])
+        return batch
+
+    def nbytes(self) -> int:
+        """
+        Approximate memory footprint of the batch.
+
+        Returns:
+            Size of the column buffers plus the interned strings, in bytes
+        """
+        return sum(len(column) * column.itemsize for column in self._columns()) + sum(
+            sys.getsizeof(value) for table in self._tables().values() for value in table.values
+        )
+
+    def iter_rows(self) -> Iterator[TransactionRow]:
+        """
+        Iterate over the batch as decoded rows.
+
+        Yields:
+            TransactionRow for each row in insertion order
+        """
+        descriptions = self.description_table.values
+        categories = self.category_table.values
+        types = self.type_table.values
+        memos = self.memo_table.values
+
+        for i in range(len(self.amounts)):
+            yield TransactionRow(
+                transaction_date=format_ordinal(self.transaction_dates[i]),
+                post_date=format_ordinal(self.post_dates[i]),
+                description=descriptions[self.descriptions[i]],
+                category=categories[self.categories[i]],
+                type=types[self.types[i]],
+                amount_cents=self.amounts[i],
+                memo=memos[self.memos[i]],
+            )
+
+    def to_records(
+        self,
+        upload_id: Optional[int] = None,
+        keys: Optional[NaturalKeyBuilder] = None,
+    ) -> List[dict]:
+        """
+        Build parameter dictionaries for a bulk INSERT into transactions.
+
+        Each record carries the row's natural key, with occurrence indexes
+        assigned in batch order.
+
+        Args:
+            upload_id: Upload ID to attach to every row
+            keys: Key builder to use, e.g. one continuing from an earlier
+                upload's occurrences (defaults to a fresh builder)
+
+        Returns:
+            List of column-name to value dictionaries
+        """
+        descriptions = self.description_table.values
+        categories = self.category_table.values
+        types = self.type_table.values
+        memos = self.memo_table.values
+        if keys is None:
+            keys = NaturalKeyBuilder()
+
+        records = []
+        for i in range(len(self.amounts)):
+            transaction_date = from_ordinal(self.transaction_dates[i])
+            post_date = from_ordinal(self.post_dates[i])
+            description = descriptions[self.descriptions[i]]
+            amount_cents = self.amounts[i]
+            records.append({
+                "upload_id": upload_id,
+                "transaction_date": transaction_date,
+                "post_date": post_date,
+                "description": description,
+                "category": categories[self.categories[i]],
+                "type": types[self.types[i]],
+                "amount_cents": amount_cents,
+                "memo": memos[self.memos[i]],
+                "natural_key": keys.key(transaction_date, post_date, description, amount_cents),
+            })
+        return records
@@ -0,0 +1,416 @@
+"""Resumable chunked uploads, parsed incrementally as chunks arrive."""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Tuple
+from src.config import settings
+from src.services.csv_parser import CSVParseError, IncrementalCSVParser
+from src.services.transaction_batch import TransactionBatch
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(?:\d+|\*)")
+_SESSION_ID = re.compile(r"[0-9a-f]{32}")
+
+# Bytes read per step when catching up on a session's file
+_CATCH_UP_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadSessionError(Exception):
+    """Raised when an upload session cannot accept a request."""
+
+    pass
+
+
+class UploadSessionNotFoundError(UploadSessionError):
+    """Raised for unknown or expired upload sessions."""
+
+    pass
+
+
+class UploadOffsetError(UploadSessionError):
+    """Raised when a chunk does not continue from the received bytes."""
+
+    def __init__(self, message: str, offset: int):
+        """
+        Initialize with the offset the client must resume from.
+
+        Args:
+            message: Error message
+            offset: Number of bytes received so far
+        """
+        super().__init__(message)
+        self.offset = offset
+
+
+class UploadSessionTooLargeError(UploadSessionError):
+    """Raised when a session's bytes would exceed the upload size limit."""
+
+    pass
+
+
+def parse_content_range(value: Optional[str]) -> Tuple[int, int]:
+    """
+    Get the byte range of a ``Content-Range: bytes start-end/total`` header.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Offsets of the range's first and last byte
+
+    Raises:
+        UploadSessionError: If the header is missing or malformed
+    """
+    match = _CONTENT_RANGE.fullmatch(value.strip()) if value else None
+    if match is None:
+        raise UploadSessionError("Content-Range header must be 'bytes start-end/total'")
+    start, end = int(match.group(1)), int(match.group(2))
+    if end < start:
+        raise UploadSessionError("Content-Range end precedes its start")
+    return start, end
+
+
+class UploadSession:
+    """
+    One file being uploaded in byte ranges.
+
+    Received bytes are appended to a file on disk, hashed, and (for plain
+    CSVs) fed to an incremental parser, so finalizing only has to parse
+    the last partial record. Chunks must continue from the current offset;
+    a retransmitted range overlapping bytes already received is trimmed.
+
+    The session's metadata is kept in a JSON file next to its bytes, so
+    any process sharing the directory (another worker, or this one after
+    a restart) can continue it: before each request the session catches
+    up on bytes appended to the file elsewhere, hashing and parsing them.
+    The lock only orders requests within one process, so clients must
+    send a session's ranges one at a time.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        filename: str,
+        path: Path,
+        max_size: int,
+        size: Optional[int] = None,
+        error: Optional[str] = None,
+    ):
+        """
+        Initialize a session; its files are created by UploadSessionStore.
+
+        Args:
+            session_id: Session ID
+            filename: Name of the file being uploaded
+            path: File the received bytes are written to
+            max_size: Maximum total size in bytes
+            size: Declared total size, if known
+            error: Error that failed the session, if any
+        """
+        self.id = session_id
+        self.filename = filename
+        self.path = path
+        self.max_size = max_size
+        self.size = size
+        # Bytes hashed and parsed by this process
+        self.offset = 0
+        self.error = error
+        self.lock = asyncio.Lock()
+        self._digest = hashlib.sha256()
+        # Compressed uploads are stored as-is and parsed when finalized
+        self._parser = IncrementalCSVParser() if filename.lower().endswith(".csv") else None
+
+    @property
+    def metadata_path(self) -> Path:
+        """JSON file holding the session's metadata."""
+        return self.path.with_suffix(".json")
+
+    @property
+    def rows_parsed(self) -> int:
+        """Number of rows parsed from the bytes received so far."""
+        return len(self._parser.batch) if self._parser is not None else 0
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 hex digest of the bytes received so far."""
+        return self._digest.hexdigest()
+
+    async def refresh(self) -> None:
+        """
+        Catch up on bytes and failures recorded by other processes.
+
+        Raises:
+            UploadSessionNotFoundError: If the session was discarded elsewhere
+            CSVParseError: If the bytes received elsewhere are not a valid CSV
+        """
+        async with self.lock:
+            await asyncio.to_thread(self._catch_up)
+
+    async def write(self, start: int, end: int, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Append a byte range to the upload.
+
+        Bytes are kept as they stream in, so a range cut short by a dropped
+        connection still advances the offset by what arrived. A body longer
+        than the range is rejected before the excess is stored.
+
+        Args:
+            start: Offset of the range's first byte in the file
+            end: Offset of the range's last byte in the file
+            chunks: Body of the range
+
+        Returns:
+            Number of bytes received so far
+
+        Raises:
+            UploadOffsetError: If the range starts after the received bytes
+            UploadSessionTooLargeError: If the file would exceed the limit
+            UploadSessionNotFoundError: If the session was discarded elsewhere
+            UploadSessionError: If the session already failed or the body
+                does not match the range's length
+            CSVParseError: If the received bytes are not a valid CSV
+        """
+        async with self.lock:
+            await asyncio.to_thread(self._catch_up)
+            if self.error is not None:
+                raise UploadSessionError(self.error)
+            if start > self.offset:
+                raise UploadOffsetError(
+                    f"Range starts at byte {start} but only {self.offset} bytes were received",
+                    self.offset,
+                )
+
+            length = end - start + 1
+            received = 0
+            skip = self.offset - start
+            f = await asyncio.to_thread(open, self.path, "ab")
+            try:
+                async for data in chunks:
+                    received += len(data)
+                    if received > length:
+                        raise UploadSessionError(
+                            f"Body is longer than the {length} bytes of its Content-Range"
+                        )
+                    if skip:
+                        trimmed = min(skip, len(data))
+                        data, skip = data[trimmed:], skip - trimmed
+                        if not data:
+                            continue
+                    if self.offset + len(data) > self.max_size:
+                        raise UploadSessionTooLargeError(
+                            f"Upload exceeds maximum size of {self.max_size} bytes"
+                        )
+                    await asyncio.to_thread(self._consume, f, data)
+            finally:
+                await asyncio.to_thread(f.close)
+            if received < length:
+                raise UploadSessionError(
+                    f"Body is {received} bytes but its Content-Range covers {length} bytes"
+                )
+            return self.offset
+
+    def _consume(self, f, data: bytes) -> None:
+        """Store, hash and parse received bytes."""
+        f.write(data)
+        f.flush()
+        self._ingest(data)
+
+    def _ingest(self, data: bytes) -> None:
+        """Hash and parse bytes stored in the session's file."""
+        self.offset += len(data)
+        self._digest.update(data)
+        if self._parser is not None:
+            try:
+                self._parser.feed(data)
+            except CSVParseError as e:
+                self.error = str(e)
+                self.save_metadata()
+                raise
+
+    def _catch_up(self) -> None:
+        """Hash and parse bytes appended to the file by other processes."""
+        try:
+            metadata = json.loads(self.metadata_path.read_text())
+        except FileNotFoundError as e:
+            raise UploadSessionNotFoundError("Upload session not found") from e
+        if self.error is None:
+            self.error = metadata["error"]
+        if self.error is not None:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while data := f.read(_CATCH_UP_CHUNK_SIZE):
+                self._ingest(data)
+
+    def save_metadata(self) -> None:
+        """Write the session's metadata file, replacing it atomically."""
+        tmp_path = self.metadata_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps({"filename": self.filename, "size": self.size, "error": self.error}))
+        os.replace(tmp_path, self.metadata_path)
+
+    async def finish(self) -> Optional[TransactionBatch]:
+        """
+        Complete the upload.
+
+        Returns:
+            Parsed batch for plain CSVs, or None if the file still needs parsing
+
+        Raises:
+            UploadOffsetError: If fewer bytes than declared were received
+            UploadSessionNotFoundError: If the session was discarded elsewhere
+            UploadSessionError: If the session already failed
+            CSVParseError: If the file is not a valid CSV
+        """
+        async with self.lock:
+            await asyncio.to_thread(self._catch_up)
+            if self.error is not None:
+                raise UploadSessionError(self.error)
+            if self.size is not None and self.offset != self.size:
+                raise UploadOffsetError(
+                    f"Upload incomplete: received {self.offset} of {self.size} bytes",
+                    self.offset,
+                )
+            if self._parser is None:
+                return None
+            try:
+                return await asyncio.to_thread(self._parser.close)
+            except CSVParseError as e:
+                self.error = str(e)
+                await asyncio.to_thread(self.save_metadata)
+                raise
+
+
+class UploadSessionStore:
+    """
+    Registry of upload sessions kept in a directory.
+
+    Each session is a ``.part`` file of received bytes plus a ``.json``
+    metadata file, so sessions survive restarts and can be continued by
+    any process sharing the directory. Sessions whose files were not
+    modified for longer than the TTL are dropped whenever a new session
+    is created.
+    """
+
+    def __init__(self, directory: Optional[str], max_size: int, ttl_seconds: float):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory for received bytes (a temp dir if None)
+            max_size: Maximum size of one upload in bytes
+            ttl_seconds: Inactivity after which a session expires
+        """
+        self.directory = Path(directory or Path(tempfile.gettempdir()) / "upload-sessions")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._sessions: Dict[str, UploadSession] = {}
+
+    async def create(self, filename: str, size: Optional[int] = None) -> UploadSession:
+        """
+        Start a new upload session.
+
+        Args:
+            filename: Name of the file being uploaded
+            size: Declared total size, if known
+
+        Returns:
+            New UploadSession
+
+        Raises:
+            UploadSessionTooLargeError: If the declared size exceeds the limit
+        """
+        if size is not None and size > self.max_size:
+            raise UploadSessionTooLargeError(f"Upload exceeds maximum size of {self.max_size} bytes")
+        session_id = uuid.uuid4().hex
+        session = UploadSession(
+            session_id, filename, self.directory / f"{session_id}.part", self.max_size, size
+        )
+        await asyncio.to_thread(self._create_files, session)
+        self._sessions[session_id] = session
+        return session
+
+    async def get(self, session_id: str) -> UploadSession:
+        """
+        Get an active session, loading it from the directory if needed.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            UploadSession
+
+        Raises:
+            UploadSessionNotFoundError: If the session is unknown or expired
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            loaded = await asyncio.to_thread(self._load, session_id)
+            session = self._sessions.setdefault(session_id, loaded)
+        return session
+
+    async def discard(self, session_id: str) -> None:
+        """
+        Drop a session and its files.
+
+        Args:
+            session_id: Session ID
+        """
+        self._sessions.pop(session_id, None)
+        if _SESSION_ID.fullmatch(session_id):
+            await asyncio.to_thread(self._remove_files, self.directory / f"{session_id}.part")
+
+    def _create_files(self, session: UploadSession) -> None:
+        """Create a new session's files, pruning expired sessions first."""
+        self._prune()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        session.path.touch()
+        session.save_metadata()
+
+    def _load(self, session_id: str) -> UploadSession:
+        """Rebuild a session from its metadata file; its bytes are read on first use."""
+        # IDs come from URLs, and name files in the directory
+        if not _SESSION_ID.fullmatch(session_id):
+            raise UploadSessionNotFoundError("Upload session not found")
+        path = self.directory / f"{session_id}.part"
+        try:
+            metadata = json.loads(path.with_suffix(".json").read_text())
+        except (OSError, ValueError) as e:
+            raise UploadSessionNotFoundError("Upload session not found") from e
+        return UploadSession(
+            session_id, metadata["filename"], path, self.max_size, metadata["size"], metadata["error"]
+        )
+
+    @staticmethod
+    def _remove_files(path: Path) -> None:
+        """Delete a session's metadata and received bytes."""
+        path.with_suffix(".json").unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Drop sessions whose files were not modified for longer than the TTL."""
+        if not self.directory.exists():
+            return
+        now = time.time()
+        for metadata_path in self.directory.glob("*.json"):
+            path = metadata_path.with_suffix(".part")
+            try:
+                updated_at = max(
+                    os.stat(candidate).st_mtime for candidate in (metadata_path, path) if candidate.exists()
+                )
+            except (FileNotFoundError, ValueError):
+                # Discarded by another process mid-scan
+                continue
+            if now - updated_at > self.ttl_seconds:
+                self._sessions.pop(path.stem, None)
+                self._remove_files(path)
+
+
+upload_sessions = UploadSessionStore(
+    settings.upload_session_dir, settings.max_upload_size, settings.upload_session_ttl_seconds
+)
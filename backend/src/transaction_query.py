@@ -0,0 +1,163 @@
+"""Translate transaction listing filters and sort orders into indexed SQL."""
+
+from datetime import date
+from sqlalchemy import Select, func, literal_column, select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.models import TransactionDTO
+from src.schemas import SortOrder, TransactionListQuery, TransactionSort
+from src.services.money import decimal_to_cents
+from src.services.pagination import INT4_MAX, CursorValue, InvalidCursorError, decode_cursor, encode_cursor
+
+# Case-folded description as stored in ix_transactions_merchant_id
+MERCHANT_KEY = func.lower(TransactionDTO.description).collate("C")
+
+# Keyset of each sort, ending with the ID as tie-breaker; every keyset is
+# the column list of an index, so pages are index range scans
+_SORT_KEYS: Dict[TransactionSort, Tuple[ColumnElement, ...]] = {
+    TransactionSort.DATE: (TransactionDTO.transaction_date, TransactionDTO.id),
+    TransactionSort.AMOUNT: (TransactionDTO.amount_cents, TransactionDTO.id),
+    TransactionSort.MERCHANT: (MERCHANT_KEY, TransactionDTO.id),
+    TransactionSort.CATEGORY: (TransactionDTO.category, TransactionDTO.transaction_date, TransactionDTO.id),
+}
+
+# Value types of each keyset; dates are encoded in cursors as day ordinals
+_KEY_TYPES: Dict[TransactionSort, Tuple[type, ...]] = {
+    TransactionSort.DATE: (date, int),
+    TransactionSort.AMOUNT: (int, int),
+    TransactionSort.MERCHANT: (str, int),
+    TransactionSort.CATEGORY: (str, date, int),
+}
+
+_MAX_CODE_POINT = chr(0x10FFFF)
+
+
+class TransactionQueryBuilder:
+    """
+    Builds the SQL of one transaction listing from a validated query.
+
+    Filters map onto the transaction indexes: dates onto
+    ix_transactions_date_id, categories onto ix_transactions_category_date_id,
+    amounts onto ix_transactions_amount_id, merchant prefixes onto the
+    ix_transactions_merchant_id expression index and spending-only listings
+    onto the ix_transactions_debit_date_id partial index. Pages seek past
+    the cursor on the sort's keyset, so their cost does not grow with depth.
+    """
+
+    def __init__(self, query: TransactionListQuery):
+        """
+        Initialize the builder.
+
+        Args:
+            query: Validated filters and sort order
+        """
+        self.query = query
+        self.keys = _SORT_KEYS[query.sort]
+
+    def conditions(self) -> List[ColumnElement[bool]]:
+        """
+        Get the WHERE conditions of the filters.
+
+        Returns:
+            Conditions to AND together (empty when nothing is filtered)
+        """
+        query = self.query
+        conditions: List[ColumnElement[bool]] = []
+        if query.date_from is not None:
+            conditions.append(TransactionDTO.transaction_date >= query.date_from)
+        if query.date_to is not None:
+            conditions.append(TransactionDTO.transaction_date <= query.date_to)
+        if query.merchant is not None:
+            # A prefix is the range [prefix, prefix with its last character
+            # incremented) in the C collation, which the index can seek
+            prefix = query.merchant.lower()
+            conditions.append(MERCHANT_KEY >= prefix)
+            upper = prefix.rstrip(_MAX_CODE_POINT)
+            if upper:
+                conditions.append(MERCHANT_KEY < upper[:-1] + chr(ord(upper[-1]) + 1))
+        if query.category:
+            conditions.append(TransactionDTO.category.in_(query.category))
+        if query.amount_min is not None:
+            conditions.append(TransactionDTO.amount_cents >= decimal_to_cents(query.amount_min))
+        if query.amount_max is not None:
+            conditions.append(TransactionDTO.amount_cents <= decimal_to_cents(query.amount_max))
+        if query.kind is not None:
+            # Inlined rather than bound, so the planner can match the
+            # predicate of the partial index even with a generic plan
+            zero = literal_column("0")
+            if query.kind == "debit":
+                conditions.append(TransactionDTO.amount_cents < zero)
+            else:
+                conditions.append(TransactionDTO.amount_cents >= zero)
+        if query.upload_id is not None:
+            conditions.append(TransactionDTO.upload_id == query.upload_id)
+        return conditions
+
+    def page(self, limit: int, cursor: Optional[str] = None) -> Select:
+        """
+        Build the query of one page.
+
+        Rows are selected with their keyset values (labelled key0, key1,
+        ...), from which cursor_after() builds the next cursor. One row
+        beyond ``limit`` is fetched to tell whether another page follows.
+
+        Args:
+            limit: Page size
+            cursor: Cursor of the previous page's last row
+
+        Returns:
+            SELECT of TransactionDTO and its keyset values
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another sort
+        """
+        descending = self.query.order == SortOrder.DESC
+        statement = (
+            select(TransactionDTO, *(key.label(f"key{i}") for i, key in enumerate(self.keys)))
+            .where(*self.conditions())
+            .order_by(*(key.desc() if descending else key.asc() for key in self.keys))
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            last = tuple_(*self._decode(cursor))
+            statement = statement.where(tuple_(*self.keys) < last if descending else tuple_(*self.keys) > last)
+        return statement
+
+    def totals(self) -> Select:
+        """
+        Build the query of the filtered row count and amount sum.
+
+        Returns:
+            SELECT of (count, sum of amount_cents)
+        """
+        return select(func.count(), func.coalesce(func.sum(TransactionDTO.amount_cents), 0)).where(
+            *self.conditions()
+        )
+
+    def cursor_after(self, key_values: Sequence) -> str:
+        """
+        Build the cursor continuing after a row.
+
+        Args:
+            key_values: The row's keyset values, as selected by page()
+
+        Returns:
+            Opaque cursor string
+        """
+        values: List[CursorValue] = [self.query.sort.value, self.query.order.value]
+        values.extend(v.toordinal() if isinstance(v, date) else v for v in key_values)
+        return encode_cursor(values)
+
+    def _decode(self, cursor: str) -> Tuple:
+        """Decode a cursor into bindable keyset values, checking it matches the sort."""
+        types = _KEY_TYPES[self.query.sort]
+        sort, order, *values = decode_cursor(cursor, (str, str, *(int if t is date else t for t in types)))
+        if sort != self.query.sort.value or order != self.query.order.value:
+            raise InvalidCursorError("Cursor belongs to a different sort order")
+        # Every keyset ends with the integer transaction ID
+        if values[-1] > INT4_MAX:
+            raise InvalidCursorError("Invalid pagination cursor")
+        try:
+            return tuple(date.fromordinal(v) if t is date else v for t, v in zip(types, values))
+        except (ValueError, OverflowError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
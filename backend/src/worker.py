@@ -0,0 +1,134 @@
+"""In-process worker pool draining the ingest job queue."""
+
+import asyncio
+import logging
+import tempfile
+from fastapi import UploadFile
+from typing import List, Optional
+from src.api import IngestJobsContextManager
+from src.config import settings
+from src.ingest import parse_upload, store_upload
+from src.services.csv_parser import CSVParseError
+from src.services.decompression import UploadFormatError
+
+logger = logging.getLogger(__name__)
+
+
+class IngestWorker:
+    """
+    Pool of asyncio tasks that claim and process ingest jobs.
+
+    Workers poll the ingest_jobs table; notify() wakes them immediately
+    when a job is queued by this process. Several processes may run
+    workers against the same database, as claims use SKIP LOCKED.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        """
+        Initialize the worker pool (not started).
+
+        Args:
+            concurrency: Number of jobs processed at once
+            poll_interval: Seconds between polls when the queue is empty
+            lease_seconds: How long a claimed job is owned by its worker
+            max_attempts: Claims after which a job is failed instead of retried
+        """
+        self.concurrency = concurrency or settings.ingest_workers
+        self.poll_interval = poll_interval or settings.ingest_poll_interval
+        self.lease_seconds = lease_seconds or settings.ingest_job_lease_seconds
+        self.max_attempts = max_attempts or settings.ingest_job_max_attempts
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and wait for them to exit."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers because a job was queued."""
+        self._wakeup.set()
+
+    async def run_once(self) -> bool:
+        """
+        Claim and process one job.
+
+        Returns:
+            True if a job was processed, False if the queue was empty
+        """
+        async with IngestJobsContextManager() as db:
+            job = await db.claim_job(self.lease_seconds)
+        if job is None:
+            return False
+
+        if job.attempts > self.max_attempts:
+            async with IngestJobsContextManager() as db:
+                await db.fail_job(job.id, f"Gave up after {self.max_attempts} attempts")
+            return True
+
+        try:
+            # Rehydrate the stored bytes as an upload spooled like the
+            # multipart parser would, so the pipeline takes the same paths
+            with tempfile.SpooledTemporaryFile(max_size=settings.upload_spool_threshold) as spooled:
+                async with IngestJobsContextManager() as db:
+                    async for chunk in db.read_job_content(job.id):
+                        spooled.write(chunk)
+                spooled.seek(0)
+                file = UploadFile(file=spooled, size=job.file_size, filename=job.filename)
+
+                parsed = await parse_upload(file)
+                async with IngestJobsContextManager() as db:
+                    await db.mark_job_persisting(job.id, len(parsed.batch), self.lease_seconds)
+                upload = await store_upload(file, parsed)
+        except (CSVParseError, UploadFormatError) as e:
+            # Retrying cannot fix the file itself
+            async with IngestJobsContextManager() as db:
+                await db.fail_job(job.id, f"Error parsing CSV: {str(e)}")
+            return True
+        except Exception as e:
+            logger.exception("Ingest job %s failed", job.id)
+            async with IngestJobsContextManager() as db:
+                if job.attempts < self.max_attempts:
+                    await db.retry_job(job.id, str(e))
+                else:
+                    await db.fail_job(job.id, f"Gave up after {job.attempts} attempts: {str(e)}")
+            return True
+
+        async with IngestJobsContextManager() as db:
+            await db.complete_job(job.id, upload)
+        return True
+
+    async def _run(self) -> None:
+        """Process jobs until cancelled, sleeping while the queue is empty."""
+        while True:
+            # Cleared before claiming, so a job queued meanwhile is not missed
+            self._wakeup.clear()
+            try:
+                processed = await self.run_once()
+            except Exception:
+                # Database unavailable or similar; retry after a poll interval
+                logger.exception("Ingest worker iteration failed")
+                processed = False
+            if processed:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+ingest_worker = IngestWorker()
@@ -59,3 +59,16 @@ async def setup_test_database():
     await drop_db()
 
 
+@pytest.fixture
+async def clean_database():
+    """
+    Empty all tables before a test.
+
+    Transactions are deduplicated by natural key across uploads, so tests
+    that store the same rows must not see each other's data.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text("TRUNCATE uploads, transactions, ingest_jobs, daily_rollups RESTART IDENTITY CASCADE"))
+        # Files of the truncated ingest jobs
+        await conn.execute(text("SELECT lo_unlink(oid) FROM pg_largeobject_metadata"))
+    yield
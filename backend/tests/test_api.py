@@ -1,9 +1,18 @@
-"""Tests for UploadsContextManager."""
+"""Tests for the database context managers."""
 
+import asyncio
 import pytest
+import uuid
+from datetime import date
 from decimal import Decimal
-from src.api import UploadsContextManager
-from src.schemas import TransactionCreate
+from sqlalchemy import func, select
+from src.api import AnalyticsContextManager, TransactionsContextManager, UploadsContextManager
+from src.models import DailyRollupDTO, TransactionDTO
+from src.schemas import TransactionCreate, TransactionListQuery
+from src.services.csv_parser import CSVParser
+from src.services.pagination import InvalidCursorError, encode_cursor
+
+pytestmark = pytest.mark.usefixtures("clean_database")
 
 
 class TestUploadsContextManager:
@@ -53,6 +62,184 @@ class TestUploadsContextManager:
         assert len(upload.transactions) == 2
         assert upload.transactions[0].description == "Test Merchant"
         assert upload.transactions[1].description == "Another Merchant"
+        assert upload.transactions[0].transaction_date == date(2025, 10, 13)
+        assert upload.transactions[0].post_date == date(2025, 10, 14)
+
+    @pytest.mark.asyncio
+    async def test_create_upload_from_batch(self):
+        """Test creating upload from a columnar batch returns read-only Upload."""
+        batch = CSVParser().parse_columnar(
+            "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+            "10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00,Test\n"
+            "10/14/2025,10/15/2025,Another Merchant,Food,Sale,-50.25,\n"
+        )
+
+        async with UploadsContextManager() as db:
+            upload = await db.create_upload(batch)
+
+        assert upload.id is not None
+        assert upload.transaction_count == 2
+        assert len(upload.transactions) == 2
+        assert upload.transactions[0].description == "Test Merchant"
+        assert upload.transactions[0].memo == "Test"
+        assert upload.transactions[1].amount == Decimal("-50.25")
+        assert upload.transactions[1].amount_cents == -5025
+        assert all(t.upload_id == upload.id for t in upload.transactions)
+
+    @pytest.mark.asyncio
+    async def test_create_upload_returns_stored_rows(self):
+        """Test the Upload built from RETURNING matches reading it back."""
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        batch = CSVParser().parse_columnar(
+            header + "".join(
+                f"10/{i % 28 + 1:02d}/2025,10/{i % 28 + 1:02d}/2025,Shop {i},Shopping,Sale,-{i}.25,m{i}\n"
+                for i in range(1, 2501)
+            )
+        )
+
+        async with UploadsContextManager() as db:
+            created = await db.create_upload(batch)
+        async with UploadsContextManager() as db:
+            stored = await db.get_upload(created.id)
+
+        assert created.transaction_count == stored.transaction_count == 2500
+        assert created.created_at == stored.created_at
+        assert created.transactions == stored.transactions
+
+    @pytest.mark.asyncio
+    async def test_create_upload_via_copy(self, monkeypatch):
+        """Test the COPY path stores, dedupes and returns rows like INSERT."""
+        monkeypatch.setattr("src.api.settings.copy_ingest_threshold", 2)
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        rows = [
+            f"10/{i % 28 + 1:02d}/2025,10/{i % 28 + 1:02d}/2025,Shop {i},Shopping,Sale,-{i}.25,\n"
+            for i in range(1, 101)
+        ]
+        parser = CSVParser()
+
+        async with UploadsContextManager() as db:
+            first = await db.create_upload(parser.parse_columnar(header + "".join(rows[:60])))
+        async with UploadsContextManager() as db:
+            second = await db.create_upload(parser.parse_columnar(header + "".join(rows[40:])))
+        async with UploadsContextManager() as db:
+            stored = await db.get_upload(second.id)
+            total = await db.session.scalar(select(func.count()).select_from(TransactionDTO))
+
+        assert first.transaction_count == 60
+        assert second.transaction_count == 40
+        assert second.duplicate_transaction_count == 20
+        assert [t.description for t in second.transactions] == [f"Shop {i}" for i in range(61, 101)]
+        assert second.transactions == stored.transactions
+        assert total == 100
+
+    @pytest.mark.asyncio
+    async def test_create_upload_duplicate_file_hash(self):
+        """Test re-ingesting a file hash returns the existing upload without writing."""
+        file_hash = uuid.uuid4().hex * 2
+        batch = CSVParser().parse_columnar(
+            "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+            "10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00,\n"
+        )
+
+        async with UploadsContextManager() as db:
+            first = await db.create_upload(batch, file_hash=file_hash)
+        async with UploadsContextManager() as db:
+            second = await db.create_upload(batch, file_hash=file_hash)
+            stored = await db.session.scalar(
+                select(func.count()).select_from(TransactionDTO).where(
+                    TransactionDTO.upload_id == first.id
+                )
+            )
+
+        assert first.duplicate is False
+        assert first.file_hash == file_hash
+        assert second.duplicate is True
+        assert second.id == first.id
+        # The existing upload's rows are not read back
+        assert second.transaction_count == 1
+        assert second.transactions == []
+        assert stored == 1
+
+    @pytest.mark.asyncio
+    async def test_create_upload_concurrent_identical_files(self):
+        """Test concurrent uploads of one file ingest it exactly once."""
+        file_hash = uuid.uuid4().hex * 2
+        batch = CSVParser().parse_columnar(
+            "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+            "10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00,\n"
+        )
+
+        async def ingest():
+            async with UploadsContextManager() as db:
+                return await db.create_upload(batch, file_hash=file_hash)
+
+        uploads = await asyncio.gather(*(ingest() for _ in range(4)))
+
+        assert len({upload.id for upload in uploads}) == 1
+        assert sorted(upload.duplicate for upload in uploads) == [False, True, True, True]
+
+    @pytest.mark.asyncio
+    async def test_create_upload_skips_overlapping_rows(self):
+        """Test rows already stored from an overlapping statement are skipped."""
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        september = CSVParser().parse_columnar(
+            header
+            + "09/30/2025,10/01/2025,COFFEE SHOP,Food & Drink,Sale,-4.50,\n"
+            + "09/30/2025,10/01/2025,COFFEE SHOP,Food & Drink,Sale,-4.50,\n"
+            + "10/01/2025,10/02/2025,GROCER,Groceries,Sale,-60.00,\n"
+        )
+        october = CSVParser().parse_columnar(
+            header
+            + "09/30/2025,10/01/2025,Coffee  Shop,Food & Drink,Sale,-4.50,\n"
+            + "09/30/2025,10/01/2025,Coffee  Shop,Food & Drink,Sale,-4.50,\n"
+            + "09/30/2025,10/01/2025,Coffee  Shop,Food & Drink,Sale,-4.50,\n"
+            + "10/01/2025,10/02/2025,GROCER,Groceries,Sale,-60.00,\n"
+            + "10/05/2025,10/06/2025,BOOKSTORE,Shopping,Sale,-12.00,\n"
+        )
+
+        async with UploadsContextManager() as db:
+            first = await db.create_upload(september)
+        async with UploadsContextManager() as db:
+            second = await db.create_upload(october)
+            stored = await db.session.scalar(select(func.count()).select_from(TransactionDTO))
+
+        assert first.transaction_count == 3
+        assert first.duplicate_transaction_count == 0
+        # The third coffee is a new same-day repeat, the bookstore is new
+        assert second.transaction_count == 2
+        assert second.duplicate_transaction_count == 3
+        assert sorted(t.description for t in second.transactions) == ["BOOKSTORE", "Coffee  Shop"]
+        assert stored == 5
+
+    @pytest.mark.asyncio
+    async def test_create_upload_delta_keys_match_full_parse(self):
+        """Test rows appended to an earlier file get the keys of a full parse."""
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        coffee = "09/30/2025,10/01/2025,COFFEE SHOP,Food & Drink,Sale,-4.50,\n"
+        prefix = header + coffee + "10/01/2025,10/02/2025,GROCER,Groceries,Sale,-60.00,\n"
+        suffix = coffee + "10/05/2025,10/06/2025,BOOKSTORE,Shopping,Sale,-12.00,\n"
+        content = (prefix + suffix).encode("utf-8")
+        parser = CSVParser()
+
+        async with UploadsContextManager() as db:
+            base = await db.create_upload(
+                parser.parse_columnar(prefix), file_hash="a" * 64, file_size=len(prefix)
+            )
+        async with UploadsContextManager() as db:
+            candidates = await db.get_delta_candidates(len(content))
+            delta = await db.create_upload(
+                parser.parse_suffix(content, len(prefix), 4),
+                file_hash="b" * 64,
+                file_size=len(content),
+                base_upload_id=base.id,
+            )
+            stored = set(await db.session.scalars(select(TransactionDTO.natural_key)))
+
+        expected = {r["natural_key"] for r in parser.parse_columnar(prefix + suffix).to_records()}
+        assert [c.id for c in candidates] == [base.id]
+        assert candidates[0].row_count == 2
+        assert delta.transaction_count == 2
+        assert stored == expected
 
     @pytest.mark.asyncio
     async def test_get_upload_by_id(self):
@@ -94,7 +281,7 @@ class TestUploadsContextManager:
 
     @pytest.mark.asyncio
     async def test_get_all_uploads(self):
-        """Test getting all uploads returns list of read-only Uploads."""
+        """Test getting all uploads returns read-only summaries."""
         transactions1 = [
             TransactionCreate(
                 transaction_date="10/13/2025",
@@ -135,6 +322,139 @@ class TestUploadsContextManager:
         assert upload1.id in upload_ids
         assert upload2.id in upload_ids
 
+    @pytest.mark.asyncio
+    async def test_upload_summaries_use_ingest_statistics(self):
+        """Test summaries report statistics computed over each upload's stored rows."""
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        first_rows = (
+            "10/03/2025,10/04/2025,Summary Grocer,Groceries,Sale,-40.00,\n"
+            "10/01/2025,10/02/2025,Summary Payroll,Income,Payment,900.00,\n"
+        )
+        parser = CSVParser()
+        async with UploadsContextManager() as db:
+            first = await db.create_upload(parser.parse_columnar(header + first_rows))
+        # The overlapping grocer row belongs to the first upload only
+        async with UploadsContextManager() as db:
+            second = await db.create_upload(parser.parse_columnar(
+                header + first_rows.splitlines(keepends=True)[0]
+                + "10/09/2025,10/10/2025,Summary Cafe,Food,Sale,-5.25,\n"
+            ))
+        async with UploadsContextManager() as db:
+            empty = await db.create_upload([])
+
+        async with UploadsContextManager() as db:
+            summaries = await db.get_all_uploads()
+            single = await db.get_upload_summary(first.id)
+            missing = await db.get_upload_summary(99999)
+
+        assert [u.id for u in summaries] == [empty.id, second.id, first.id]
+        assert single == summaries[2]
+        assert single.transaction_count == 2
+        assert single.total_spent_cents == 4000
+        assert single.total_income_cents == 90000
+        assert (single.min_transaction_date, single.max_transaction_date) == (date(2025, 10, 1), date(2025, 10, 3))
+        assert single.category_count == 2
+        assert single.category_totals == {"Groceries": -4000, "Income": 90000}
+        assert summaries[1].total_spent_cents == 525
+        assert summaries[1].total_income_cents == 0
+        assert summaries[1].min_transaction_date == date(2025, 10, 9)
+        assert summaries[1].category_totals == {"Food": -525}
+        assert summaries[0].transaction_count == 0
+        assert summaries[0].min_transaction_date is None
+        assert summaries[0].category_totals == {}
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_list_upload_summaries_paginated(self):
+        """Test upload summaries page newest first with cursors."""
+        async with UploadsContextManager() as db:
+            ids = [(await db.create_upload([])).id for _ in range(5)]
+
+        pages, cursor = [], None
+        while True:
+            async with UploadsContextManager() as db:
+                page = await db.list_upload_summaries(2, cursor=cursor)
+            pages.append([u.id for u in page.uploads])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert pages == [ids[:-3:-1], ids[-3:-5:-1], ids[:1]]
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_reduces_rollups(self):
+        """Test deleting an upload removes its rows and their share of the rollups."""
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        file_hash = uuid.uuid4().hex * 2
+        parser = CSVParser()
+        async with UploadsContextManager() as db:
+            kept = await db.create_upload(parser.parse_columnar(
+                header + "10/13/2025,10/14/2025,Kept Grocer,Groceries,Sale,-10.00,\n"
+            ))
+        async with UploadsContextManager() as db:
+            deleted = await db.create_upload(parser.parse_columnar(
+                header
+                + "10/13/2025,10/14/2025,Deleted Grocer,Groceries,Sale,-4.00,\n"
+                + "10/15/2025,10/16/2025,Deleted Cafe,Food,Sale,-3.00,\n"
+            ), file_hash=file_hash)
+
+        async with UploadsContextManager() as db:
+            assert await db.delete_upload(deleted.id) is True
+        async with UploadsContextManager() as db:
+            assert await db.delete_upload(deleted.id) is False
+            rollups = (await db.session.execute(select(DailyRollupDTO))).scalars().all()
+            remaining = await db.session.scalar(select(func.count()).select_from(TransactionDTO))
+            summary = await db.get_upload_summary(deleted.id)
+
+        assert [(r.transaction_date, r.category, r.transaction_count, r.spent_cents) for r in rollups] == [
+            (date(2025, 10, 13), "Groceries", 1, 1000)
+        ]
+        assert remaining == kept.transaction_count == 1
+        assert summary is None
+
+        # The file can be ingested again once its upload is gone
+        async with UploadsContextManager() as db:
+            again = await db.create_upload(parser.parse_columnar(
+                header + "10/15/2025,10/16/2025,Deleted Cafe,Food,Sale,-3.00,\n"
+            ), file_hash=file_hash)
+        assert again.duplicate is False
+
+    @pytest.mark.asyncio
+    async def test_delete_upload_keeps_rows_of_overlapping_upload(self):
+        """Test rows a later upload skipped as duplicates move to it instead of being deleted."""
+        header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        coffee = "10/13/2025,10/14/2025,Shared Coffee,Food,Sale,-3.00,\n"
+        parser = CSVParser()
+        async with UploadsContextManager() as db:
+            first = await db.create_upload(parser.parse_columnar(
+                header + coffee + coffee + "10/12/2025,10/13/2025,Only First,Shopping,Sale,-20.00,\n"
+            ))
+        async with UploadsContextManager() as db:
+            second = await db.create_upload(parser.parse_columnar(
+                header + coffee + "10/20/2025,10/21/2025,Only Second,Groceries,Sale,-7.00,\n"
+            ))
+        assert second.transaction_count == 1
+
+        async with UploadsContextManager() as db:
+            assert await db.delete_upload(first.id) is True
+        async with UploadsContextManager() as db:
+            kept = await db.get_transactions_by_upload(second.id)
+            summary = await db.get_upload_summary(second.id)
+            rollups = (await db.session.execute(
+                select(DailyRollupDTO).order_by(DailyRollupDTO.transaction_date)
+            )).scalars().all()
+
+        # Only one of the two identical coffees was in the second file
+        assert sorted(t.description for t in kept) == ["Only Second", "Shared Coffee"]
+        assert summary.transaction_count == 2
+        assert summary.total_spent_cents == 1000
+        assert summary.min_transaction_date == date(2025, 10, 13)
+        assert summary.category_totals == {"Food": -300, "Groceries": -700}
+        assert [(r.transaction_date, r.transaction_count, r.spent_cents) for r in rollups] == [
+            (date(2025, 10, 13), 1, 300),
+            (date(2025, 10, 20), 1, 700),
+        ]
+
     @pytest.mark.asyncio
     async def test_get_transactions_by_upload(self):
         """Test getting transactions for specific upload."""
@@ -204,3 +524,196 @@ class TestUploadsContextManager:
 
         # Count should be the same as before (upload was rolled back)
         assert len(uploads_after) == count_before
+
+
+class TestTransactionsContextManager:
+    """Tests for TransactionsContextManager."""
+
+    CSV_CONTENT = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n" + "".join(
+        f"10/{i % 5 + 1:02d}/2025,10/{i % 5 + 1:02d}/2025,Page Merchant {i},Shopping,Sale,-{i}.00,\n"
+        for i in range(1, 24)
+    )
+
+    MIXED_CONTENT = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/01/2025,10/02/2025,Blue Bottle Coffee,Food & Drink,Sale,-6.50,\n"
+        "10/02/2025,10/03/2025,BLUE APRON,Groceries,Sale,-59.99,\n"
+        "10/03/2025,10/04/2025,Bluebird Books,Shopping,Sale,-24.00,\n"
+        "10/04/2025,10/05/2025,Payroll,Income,Payment,1500.00,\n"
+        "10/05/2025,10/06/2025,Whole Foods,Groceries,Sale,-82.10,\n"
+        "10/06/2025,10/07/2025,Refund Bluestone,Shopping,Return,12.00,\n"
+    )
+
+    async def _list_all(self, limit: int, **filters) -> list:
+        """Follow cursors through every page of a listing."""
+        query = TransactionListQuery(**filters)
+        pages, cursor = [], None
+        while True:
+            async with TransactionsContextManager() as db:
+                page = await db.list_transactions(query, limit, cursor=cursor)
+            pages.append(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                return pages
+
+    async def _descriptions(self, **filters) -> list:
+        """Descriptions of every row of a listing, in order."""
+        pages = await self._list_all(limit=2, **filters)
+        return [t.description for page in pages for t in page.transactions]
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_row_in_stable_order(self):
+        """Test pages seek past each other, newest first, ties broken by ID."""
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(self.CSV_CONTENT))
+
+        pages = await self._list_all(limit=5)
+        rows = [t for page in pages for t in page.transactions]
+
+        assert [len(page.transactions) for page in pages] == [5, 5, 5, 5, 3]
+        assert len({t.id for t in rows}) == 23
+        keys = [(t.transaction_date, t.id) for t in rows]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_totals_on_first_page_only(self):
+        """Test the filtered count and sum come with the first page."""
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(self.CSV_CONTENT))
+
+        pages = await self._list_all(limit=10)
+
+        assert pages[0].total_count == 23
+        assert pages[0].total_amount_cents == -sum(range(1, 24)) * 100
+        assert pages[1].total_count is None
+
+    @pytest.mark.asyncio
+    async def test_filter_by_upload(self):
+        """Test listing only the transactions of one upload."""
+        async with UploadsContextManager() as db:
+            first = await db.create_upload(CSVParser().parse_columnar(self.CSV_CONTENT))
+        other = self.CSV_CONTENT.replace("Page Merchant", "Other Merchant")
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(other))
+
+        pages = await self._list_all(limit=10, upload_id=first.id)
+        rows = [t for page in pages for t in page.transactions]
+
+        assert len(rows) == 23
+        assert {t.upload_id for t in rows} == {first.id}
+
+    @pytest.mark.asyncio
+    async def test_filters(self):
+        """Test each filter, alone and combined."""
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(self.MIXED_CONTENT))
+
+        assert await self._descriptions(merchant="blue", sort="merchant", order="asc") == [
+            "BLUE APRON", "Blue Bottle Coffee", "Bluebird Books"
+        ]
+        assert await self._descriptions(category=["Groceries", "Income"], sort="date", order="asc") == [
+            "BLUE APRON", "Payroll", "Whole Foods"
+        ]
+        assert await self._descriptions(amount_min=Decimal("-30"), amount_max=Decimal("20"), sort="amount") == [
+            "Refund Bluestone", "Blue Bottle Coffee", "Bluebird Books"
+        ]
+        assert await self._descriptions(kind="credit", sort="date") == ["Refund Bluestone", "Payroll"]
+        assert await self._descriptions(
+            kind="debit", date_from=date(2025, 10, 2), date_to=date(2025, 10, 5), sort="date", order="asc"
+        ) == ["BLUE APRON", "Bluebird Books", "Whole Foods"]
+
+    @pytest.mark.asyncio
+    async def test_sort_by_category_pages_through_ties(self):
+        """Test a sort with many equal values pages without gaps or repeats."""
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(self.MIXED_CONTENT))
+            await db.create_upload(CSVParser().parse_columnar(self.CSV_CONTENT))
+
+        pages = await self._list_all(limit=4, sort="category", order="asc")
+        rows = [t for page in pages for t in page.transactions]
+
+        assert len({t.id for t in rows}) == len(rows) == 29
+        keys = [(t.category, t.transaction_date, t.id) for t in rows]
+        assert keys == sorted(keys)
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self):
+        """Test cursors that do not decode to the sort's keyset are rejected."""
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(self.MIXED_CONTENT))
+        async with TransactionsContextManager() as db:
+            page = await db.list_transactions(TransactionListQuery(sort="amount"), 2)
+
+        with pytest.raises(InvalidCursorError):
+            async with TransactionsContextManager() as db:
+                await db.list_transactions(TransactionListQuery(sort="date"), 2, cursor=page.next_cursor)
+        with pytest.raises(InvalidCursorError):
+            async with TransactionsContextManager() as db:
+                await db.list_transactions(
+                    TransactionListQuery(), 10, cursor=encode_cursor(("date", "desc", "2025-10-01", 1))
+                )
+
+
+class TestAnalyticsContextManager:
+    """Tests for AnalyticsContextManager."""
+
+    CSV_CONTENT = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/01/2025,10/02/2025,Rollup Grocer,Groceries,Sale,-20.00,\n"
+        "10/01/2025,10/02/2025,Rollup Market,Groceries,Sale,-5.50,\n"
+        "10/05/2025,10/06/2025,Rollup Payroll,Income,Payment,1000.00,\n"
+        "10/09/2025,10/10/2025,Rollup Grocer,Groceries,Return,4.00,\n"
+    )
+
+    @pytest.mark.asyncio
+    async def test_summary_matches_stored_rows(self):
+        """Test the rollup summary equals summarizing the stored transactions."""
+        parser = CSVParser()
+        async with UploadsContextManager() as db:
+            await db.create_upload(parser.parse_columnar(self.CSV_CONTENT))
+        # Overlapping rows are stored, and rolled up, once
+        async with UploadsContextManager() as db:
+            await db.create_upload([
+                TransactionCreate(
+                    transaction_date="10/01/2025",
+                    post_date="10/02/2025",
+                    description="Rollup Grocer",
+                    category="Groceries",
+                    type="Sale",
+                    amount=Decimal("-20.00"),
+                ),
+                TransactionCreate(
+                    transaction_date="10/12/2025",
+                    post_date="10/13/2025",
+                    description="Rollup Cafe",
+                    category="Food",
+                    type="Sale",
+                    amount=Decimal("-7.25"),
+                ),
+            ])
+
+        async with AnalyticsContextManager() as db:
+            summary = await db.get_summary()
+
+        expected = parser.parse_columnar(
+            self.CSV_CONTENT + "10/12/2025,10/13/2025,Rollup Cafe,Food,Sale,-7.25,\n"
+        ).summary
+        assert summary.to_response() == expected.to_response()
+        assert (summary.min_date, summary.max_date) == (date(2025, 10, 1), date(2025, 10, 12))
+        assert summary.category_totals == expected.category_totals
+        assert summary.type_counts == expected.type_counts
+
+    @pytest.mark.asyncio
+    async def test_summary_date_range(self):
+        """Test only days within the inclusive range are summarized."""
+        async with UploadsContextManager() as db:
+            await db.create_upload(CSVParser().parse_columnar(self.CSV_CONTENT))
+
+        async with AnalyticsContextManager() as db:
+            bounded = await db.get_summary(date(2025, 10, 1), date(2025, 10, 5))
+            open_start = await db.get_summary(end_date=date(2025, 9, 30))
+            open_end = await db.get_summary(start_date=date(2025, 10, 9))
+
+        assert (bounded.count, bounded.spent_cents, bounded.income_cents) == (3, 2550, 100000)
+        assert open_start.count == 0
+        assert (open_end.count, open_end.income_cents) == (1, 400)
@@ -0,0 +1,97 @@
+"""Tests for bank CSV layouts and compiled row mappers."""
+
+from src.services.bank_layouts import (
+    AMEX,
+    CAPITAL_ONE,
+    CHASE,
+    CITI,
+    BankLayout,
+    LAYOUTS,
+    detect_layout,
+    register_layout,
+)
+
+CHASE_HEADER = ["Transaction Date", "Post Date", "Description", "Category", "Type", "Amount", "Memo"]
+
+
+class TestDetectLayout:
+    """Tests for header signature detection."""
+
+    def test_detects_chase(self):
+        """Test Chase headers are detected regardless of column order."""
+        assert detect_layout(list(reversed(CHASE_HEADER))) is CHASE
+
+    def test_detects_capital_one(self):
+        """Test Capital One headers are detected."""
+        header = ["Transaction Date", "Posted Date", "Card No.", "Description", "Category", "Debit", "Credit"]
+        assert detect_layout(header) is CAPITAL_ONE
+
+    def test_detects_citi(self):
+        """Test Citi headers are detected."""
+        assert detect_layout(["Status", "Date", "Description", "Debit", "Credit"]) is CITI
+
+    def test_detects_amex(self):
+        """Test Amex headers are detected."""
+        assert detect_layout(["Date", "Description", "Amount"]) is AMEX
+
+    def test_unknown_header(self):
+        """Test unknown headers match no layout."""
+        assert detect_layout(["Foo", "Bar"]) is None
+
+    def test_register_layout_takes_precedence(self):
+        """Test registered layouts are checked before built-in ones."""
+        custom = BankLayout(
+            name="custom",
+            required_columns=frozenset({"Date", "Description", "Amount", "Custom"}),
+            build_extractor=AMEX.build_extractor,
+        )
+        register_layout(custom)
+        try:
+            assert detect_layout(["Date", "Description", "Amount", "Custom"]) is custom
+        finally:
+            LAYOUTS.remove(custom)
+
+
+class TestRowMapper:
+    """Tests for compiled row mappers."""
+
+    def test_chase_maps_by_index(self):
+        """Test Chase columns are pulled by header position."""
+        mapper = CHASE.compile(["Memo"] + CHASE_HEADER[:-1])
+        row = ["note", "10/13/2025", "10/14/2025", "Store", "Shopping", "Sale", "-1.00"]
+
+        assert mapper(row) == ("10/13/2025", "10/14/2025", "Store", "Shopping", "Sale", "-1.00", "note")
+
+    def test_short_row_is_padded(self):
+        """Test missing trailing fields map to empty strings."""
+        mapper = CHASE.compile(CHASE_HEADER)
+        assert mapper(["10/13/2025", "10/14/2025", "Store"])[3:] == ("", "", "", "")
+
+    def test_amex_inverts_sign(self):
+        """Test Amex charges become negative Sale amounts."""
+        mapper = AMEX.compile(["Date", "Description", "Amount"])
+
+        assert mapper(["10/13/2025", "Store", "45.74"]) == (
+            "10/13/2025", "10/13/2025", "Store", "", "Sale", "-45.74", "",
+        )
+        assert mapper(["10/14/2025", "PAYMENT", "-500.00"])[4:6] == ("Payment", "500.00")
+
+    def test_citi_debit_and_credit(self):
+        """Test Citi debit/credit columns become a signed amount."""
+        mapper = CITI.compile(["Status", "Date", "Description", "Debit", "Credit"])
+
+        assert mapper(["Cleared", "10/13/2025", "Store", "45.74", ""])[4:6] == ("Sale", "-45.74")
+        assert mapper(["Cleared", "10/14/2025", "PAYMENT", "", "-500.00"])[4:6] == ("Payment", "500.00")
+
+    def test_capital_one_iso_dates(self):
+        """Test Capital One ISO dates are converted to MM/DD/YYYY."""
+        mapper = CAPITAL_ONE.compile(
+            ["Transaction Date", "Posted Date", "Card No.", "Description", "Category", "Debit", "Credit"]
+        )
+
+        assert mapper(["2025-10-13", "2025-10-14", "1234", "Store", "Dining", "12.50", ""]) == (
+            "10/13/2025", "10/14/2025", "Store", "Dining", "Sale", "-12.50", "",
+        )
+        assert mapper(["2025-10-15", "2025-10-15", "1234", "PAYMENT", "Payment", "", "100.00"])[4:6] == (
+            "Payment", "100.00",
+        )
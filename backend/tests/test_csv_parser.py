@@ -1,9 +1,18 @@
 """Tests for CSV parser service."""
 
+import mmap
 import pytest
 from decimal import Decimal
-from io import StringIO
-from src.services.csv_parser import CSVParser, CSVParseError
+from io import BytesIO, StringIO
+from src.services.csv_parser import (
+    CSVParser,
+    CSVParseError,
+    CSVRecordSplitter,
+    IncrementalCSVParser,
+    find_record_end,
+    split_record_ranges,
+)
+from src.services.progress import UploadProgress
 
 
 class TestCSVParser:
@@ -155,3 +164,404 @@ class TestCSVParser:
         assert transactions[0].category == "Shopping"
         assert transactions[0].type == "Sale"
         assert transactions[0].memo == "Note"
+
+
+class FakeUploadFile:
+    """Minimal async file that serves bytes in fixed-size reads."""
+
+    def __init__(self, content: bytes):
+        self._buffer = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+async def collect_stream(content: bytes, chunk_size: int = 8):
+    """Run parse_stream over content and collect the results."""
+    parser = CSVParser()
+    return [
+        t async for t in parser.parse_stream(FakeUploadFile(content), chunk_size=chunk_size)
+    ]
+
+
+class TestCSVParserStream:
+    """Tests for CSVParser.parse_stream."""
+
+    CSV_CONTENT = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/13/2025,10/14/2025,SQ *CLEVER BARBER,Personal,Sale,-45.74,\n"
+        '10/13/2025,10/14/2025,"FAST & FRESH, BURRITO ""DELI""",Food & Drink,Sale,-18.07,"line one\n'
+        'line two"\n'
+        "10/12/2025,10/13/2025,Spotify USA,Bills & Utilities,Sale,-19.99,"
+    )
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1024])
+    async def test_stream_matches_parse(self, chunk_size):
+        """Test streaming parse yields the same rows as parse for any chunking."""
+        expected = CSVParser().parse(self.CSV_CONTENT)
+        streamed = await collect_stream(self.CSV_CONTENT.encode("utf-8"), chunk_size)
+
+        assert streamed == expected
+        assert streamed[1].description == 'FAST & FRESH, BURRITO "DELI"'
+        assert streamed[1].memo == "line one\nline two"
+
+    async def test_stream_handles_crlf_and_multibyte_across_chunks(self):
+        """Test CRLF line endings and multi-byte characters split across reads."""
+        content = (
+            "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\r\n"
+            "10/13/2025,10/14/2025,Café Ümlaut,Food & Drink,Sale,-5.00,\r\n"
+        ).encode("utf-8")
+
+        transactions = await collect_stream(content, chunk_size=1)
+
+        assert len(transactions) == 1
+        assert transactions[0].description == "Café Ümlaut"
+
+    async def test_stream_reports_row_number(self):
+        """Test errors carry the row number of the offending record."""
+        content = b"""Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+10/13/2025,10/14/2025,Test,Shopping,Sale,-1.00,"multi
+line"
+10/13/2025,10/14/2025,Test,Shopping,Sale,not_a_number,"""
+
+        with pytest.raises(CSVParseError) as exc_info:
+            await collect_stream(content)
+        assert "row 3" in str(exc_info.value)
+
+    async def test_stream_columnar_reports_progress(self, monkeypatch):
+        """Test parsed rows are counted while streaming, not only at the end."""
+        monkeypatch.setattr(CSVParser, "PROGRESS_ROWS", 2)
+        progress = UploadProgress()
+        seen = []
+
+        class WatchedUploadFile(FakeUploadFile):
+            async def read(self, size: int = -1) -> bytes:
+                seen.append(progress.rows_parsed)
+                return await super().read(size)
+
+        await CSVParser().parse_stream_columnar(
+            WatchedUploadFile(self.CSV_CONTENT.encode("utf-8")), chunk_size=8, progress=progress
+        )
+
+        assert progress.rows_parsed == 3
+        assert 1 in seen
+
+    async def test_stream_empty(self):
+        """Test streaming an empty file raises error."""
+        with pytest.raises(CSVParseError) as exc_info:
+            await collect_stream(b"  \n")
+        assert "empty" in str(exc_info.value).lower()
+
+    async def test_stream_header_only(self):
+        """Test streaming a header-only file raises error."""
+        content = b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        with pytest.raises(CSVParseError) as exc_info:
+            await collect_stream(content)
+        assert "no transaction data" in str(exc_info.value).lower()
+
+    async def test_stream_invalid_utf8(self):
+        """Test non UTF-8 input raises a parse error."""
+        content = b"Transaction Date,Post Date,Description\n\xff\xfe\n"
+        with pytest.raises(CSVParseError) as exc_info:
+            await collect_stream(content)
+        assert "utf-8" in str(exc_info.value).lower()
+
+
+class TestIncrementalCSVParser:
+    """Tests for IncrementalCSVParser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1024])
+    def test_chunks_match_columnar(self, chunk_size):
+        """Test feeding any chunking yields the same rows as a one-shot parse."""
+        content = TestCSVParserStream.CSV_CONTENT.encode("utf-8")
+        expected = CSVParser().parse_columnar(TestCSVParserStream.CSV_CONTENT)
+        parser = IncrementalCSVParser()
+
+        for i in range(0, len(content), chunk_size):
+            parser.feed(content[i:i + chunk_size])
+        batch = parser.close()
+
+        assert list(batch.iter_rows()) == list(expected.iter_rows())
+
+    def test_rows_parsed_as_chunks_arrive(self):
+        """Test complete records are parsed before the file is closed."""
+        parser = IncrementalCSVParser()
+        parser.feed(b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n")
+        parser.feed(b"10/13/2025,10/14/2025,Early,Shopping,Sale,-1.00,\n10/14/")
+
+        assert len(parser.batch) == 1
+        parser.feed(b"2025,10/15/2025,Late,Shopping,Sale,-2.00,")
+        assert len(parser.close()) == 2
+
+    def test_invalid_row_raises_on_feed(self):
+        """Test a bad row fails the chunk containing it, with its row number."""
+        parser = IncrementalCSVParser()
+        parser.feed(b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n")
+
+        with pytest.raises(CSVParseError) as exc_info:
+            parser.feed(b"10/13/2025,10/14/2025,Test,Shopping,Sale,not_a_number,\n")
+        assert "row 2" in str(exc_info.value)
+
+    def test_header_only(self):
+        """Test closing a header-only file raises error."""
+        parser = IncrementalCSVParser()
+        parser.feed(b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n")
+        with pytest.raises(CSVParseError) as exc_info:
+            parser.close()
+        assert "no transaction data" in str(exc_info.value).lower()
+
+
+class TestCSVRecordSplitter:
+    """Tests for CSVRecordSplitter."""
+
+    def test_quoted_newline_spanning_feeds(self):
+        """Test a quoted field is only emitted once its quote closes."""
+        splitter = CSVRecordSplitter()
+
+        assert splitter.feed('a,"b\n') == []
+        assert splitter.feed('c",d\ne') == ['a,"b\nc",d\n']
+        assert splitter.flush() == ["e"]
+
+    def test_crlf_split_across_feeds(self):
+        """Test a CRLF split between feeds is kept as one terminator."""
+        splitter = CSVRecordSplitter()
+
+        assert splitter.feed("a,b\r") == []
+        assert splitter.feed("\nc,d\r\n") == ["a,b\r\n", "c,d\r\n"]
+        assert splitter.flush() == []
+
+
+class TestCSVParserColumnar:
+    """Tests for CSVParser.parse_columnar and parse_stream_columnar."""
+
+    CSV_CONTENT = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+10/13/2025,10/14/2025,SQ *CLEVER BARBER,Personal,Sale,-45.74,
+10/13/2025,10/14/2025,FAST &amp; FRESH BURRITO,,Sale,-18.07,
+10/12/2025,10/13/2025,PAYMENT - THANK YOU,Payment,Payment,500.00,Note"""
+
+    def test_columnar_matches_parse(self):
+        """Test columnar rows decode to the same values as parse."""
+        parser = CSVParser()
+        expected = parser.parse(self.CSV_CONTENT)
+        batch = parser.parse_columnar(self.CSV_CONTENT)
+
+        assert len(batch) == len(expected)
+        for row, transaction in zip(batch.iter_rows(), expected):
+            assert row.transaction_date == transaction.transaction_date
+            assert row.post_date == transaction.post_date
+            assert row.description == transaction.description
+            assert row.category == transaction.category
+            assert row.type == transaction.type
+            assert row.amount_cents == int(transaction.amount * 100)
+            assert row.memo == transaction.memo
+
+    def test_columnar_dictionary_encodes_strings(self):
+        """Test repeated strings share a single table entry."""
+        batch = CSVParser().parse_columnar(self.CSV_CONTENT)
+
+        assert list(batch.types) == [0, 0, 1]
+        assert batch.type_table.values == ["Sale", "Payment"]
+        assert batch.category_table.values == ["Personal", "Uncategorized", "Payment"]
+        assert list(batch.amounts) == [-4574, -1807, 50000]
+
+    def test_columnar_rejects_impossible_date(self):
+        """Test dates that do not exist are rejected with their row number."""
+        csv_content = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+10/13/2025,10/14/2025,Test,Shopping,Sale,-1.00,
+02/31/2025,03/01/2025,Test,Shopping,Sale,-1.00,"""
+
+        with pytest.raises(CSVParseError) as exc_info:
+            CSVParser().parse_columnar(csv_content)
+        assert "row 3" in str(exc_info.value)
+
+    def test_columnar_rejects_empty_description(self):
+        """Test empty required fields are rejected in columnar mode."""
+        csv_content = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+10/13/2025,10/14/2025,,Shopping,Sale,-100.00,"""
+
+        with pytest.raises(CSVParseError) as exc_info:
+            CSVParser().parse_columnar(csv_content)
+        assert "empty" in str(exc_info.value).lower()
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            "10/13/2025,10/14/2025,{},Shopping,Sale,-1.00,".format("D" * 256),
+            "10/13/2025,10/14/2025,Test,{},Sale,-1.00,".format("C" * 101),
+            "10/13/2025,10/14/2025,Test,Shopping,{},-1.00,".format("T" * 51),
+            "10/13/2025,10/14/2025,Test,Shopping,Sale,-1.00,{}".format("M" * 256),
+        ],
+        ids=["description", "category", "type", "memo"],
+    )
+    def test_rejects_fields_longer_than_columns(self, row):
+        """Test text longer than its database column is rejected with its row number."""
+        csv_content = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n" + row
+
+        for parse in (CSVParser().parse_columnar, CSVParser().parse):
+            with pytest.raises(CSVParseError) as exc_info:
+                parse(csv_content)
+            assert "row 2" in str(exc_info.value)
+
+    def test_rejects_out_of_range_amount(self):
+        """Test amounts that overflow the cents column are rejected with their row number."""
+        csv_content = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+10/13/2025,10/14/2025,Test,Shopping,Sale,-1.00,
+10/13/2025,10/14/2025,Test,Shopping,Sale,1e30,"""
+
+        with pytest.raises(CSVParseError) as exc_info:
+            CSVParser().parse_columnar(csv_content)
+        assert "row 3" in str(exc_info.value)
+        assert "out of range" in str(exc_info.value)
+
+    def test_accepts_fields_at_column_length(self):
+        """Test text exactly as long as its column is accepted."""
+        csv_content = (
+            "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+            f"10/13/2025,10/14/2025,{'D' * 255},{'C' * 100},{'T' * 50},-1.00,{'M' * 255}"
+        )
+
+        row = next(CSVParser().parse_columnar(csv_content).iter_rows())
+        assert (len(row.description), len(row.category), len(row.type), len(row.memo)) == (255, 100, 50, 255)
+
+    async def test_stream_columnar(self):
+        """Test streaming columnar parse matches in-memory columnar parse."""
+        parser = CSVParser()
+        expected = parser.parse_columnar(self.CSV_CONTENT)
+        batch = await parser.parse_stream_columnar(
+            FakeUploadFile(self.CSV_CONTENT.encode("utf-8")), chunk_size=5
+        )
+
+        assert list(batch.iter_rows()) == list(expected.iter_rows())
+        assert batch.summary.to_response() == expected.summary.to_response()
+
+
+class TestCSVParserParallel:
+    """Tests for CSVParser.parse_parallel and record-aligned splitting."""
+
+    CSV_CONTENT = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        + "".join(
+            f'10/{i % 28 + 1:02d}/2025,10/{i % 28 + 1:02d}/2025,"Merchant {i}",'
+            f'Shopping,Sale,-{i}.00,"memo\nline {i}"\n'
+            for i in range(1, 201)
+        )
+    ).encode("utf-8")
+
+    def test_split_ranges_respect_quoted_newlines(self):
+        """Test every range boundary falls between whole records."""
+        header_end = find_record_end(self.CSV_CONTENT)
+        ranges = split_record_ranges(self.CSV_CONTENT, header_end, 7)
+
+        assert len(ranges) > 1
+        assert ranges[0][0] == header_end
+        assert ranges[-1][1] == len(self.CSV_CONTENT)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+        for start, end in ranges:
+            chunk = self.CSV_CONTENT[start:end]
+            assert chunk.count(b'"') % 2 == 0
+            assert chunk.startswith(b"10/")
+
+    async def test_parallel_matches_columnar(self):
+        """Test parallel parsing merges ranges in file order."""
+        parser = CSVParser()
+        expected = parser.parse_columnar(self.CSV_CONTENT.decode("utf-8"))
+        batch = await parser.parse_parallel(self.CSV_CONTENT, workers=4, threshold=0)
+
+        assert len(batch) == 200
+        assert list(batch.iter_rows()) == list(expected.iter_rows())
+
+    async def test_parallel_reports_original_row_number(self):
+        """Test row errors in later ranges keep their original row number."""
+        content = self.CSV_CONTENT.replace(b"-150.00", b"not_a_number")
+
+        with pytest.raises(CSVParseError) as exc_info:
+            await CSVParser().parse_parallel(content, workers=4, threshold=0)
+        assert "row 151" in str(exc_info.value)
+        assert "amount" in str(exc_info.value).lower()
+
+    async def test_parallel_below_threshold_parses_in_process(self):
+        """Test small inputs skip the process pool."""
+        batch = await CSVParser().parse_parallel(self.CSV_CONTENT, threshold=len(self.CSV_CONTENT))
+        assert len(batch) == 200
+
+    async def test_parallel_over_mmap_with_small_ranges(self, tmp_path, monkeypatch):
+        """Test a memory-mapped file split into more ranges than workers."""
+        monkeypatch.setattr(CSVParser, "PARALLEL_RANGE_SIZE", 1024)
+        path = tmp_path / "statement.csv"
+        path.write_bytes(b"\r\n" + self.CSV_CONTENT)
+        parser = CSVParser()
+        expected = parser.parse_columnar(self.CSV_CONTENT.decode("utf-8"))
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            batch = await parser.parse_parallel(content, workers=2, threshold=0)
+
+        assert list(batch.iter_rows()) == list(expected.iter_rows())
+
+    def test_parse_suffix_matches_tail_of_full_parse(self):
+        """Test parsing from a record boundary yields the remaining rows."""
+        parser = CSVParser()
+        expected = list(parser.parse_columnar(self.CSV_CONTENT.decode("utf-8")).iter_rows())
+        start = split_record_ranges(self.CSV_CONTENT, find_record_end(self.CSV_CONTENT), 4)[1][0]
+        skipped = self.CSV_CONTENT[:start].count(b"\n10/")
+
+        batch = parser.parse_suffix(self.CSV_CONTENT, start, skipped + 2)
+
+        assert list(batch.iter_rows()) == expected[skipped:]
+
+    def test_parse_suffix_reports_original_row_number(self):
+        """Test suffix row errors are numbered from the start of the file."""
+        content = self.CSV_CONTENT.replace(b"-150.00", b"not_a_number")
+        start = content.index(b"10/", content.index(b"line 100"))
+
+        with pytest.raises(CSVParseError) as exc_info:
+            CSVParser().parse_suffix(content, start, 102)
+        assert "row 151" in str(exc_info.value)
+
+    async def test_parallel_reports_progress(self):
+        """Test parsed rows are counted as ranges complete."""
+        progress = UploadProgress()
+        await CSVParser().parse_parallel(self.CSV_CONTENT, workers=4, threshold=0, progress=progress)
+        assert progress.rows_parsed == 200
+
+    async def test_parallel_missing_columns(self):
+        """Test header validation happens before fanning out."""
+        with pytest.raises(CSVParseError) as exc_info:
+            await CSVParser().parse_parallel(b"Transaction Date\n10/13/2025\n", threshold=0)
+        assert "missing" in str(exc_info.value).lower()
+
+
+class TestCSVParserLayouts:
+    """Tests for parsing non-Chase bank layouts."""
+
+    def test_parse_amex_csv(self):
+        """Test an Amex export is parsed into Chase-signed transactions."""
+        csv_content = """Date,Description,Amount,Category
+10/13/2025,WHOLE FOODS,54.21,Groceries
+10/14/2025,AUTOPAY PAYMENT,-200.00,"""
+
+        transactions = CSVParser().parse(csv_content)
+
+        assert transactions[0].amount == Decimal("-54.21")
+        assert transactions[0].post_date == "10/13/2025"
+        assert transactions[0].category == "Groceries"
+        assert transactions[1].amount == Decimal("200.00")
+        assert transactions[1].category == "Uncategorized"
+
+    def test_parse_capital_one_columnar(self):
+        """Test a Capital One export is parsed in columnar mode."""
+        csv_content = """Transaction Date,Posted Date,Card No.,Description,Category,Debit,Credit
+2025-10-13,2025-10-14,1234,Store,Dining,12.50,"""
+
+        rows = list(CSVParser().parse_columnar(csv_content).iter_rows())
+
+        assert rows[0].transaction_date == "10/13/2025"
+        assert rows[0].amount_cents == -1250
+
+    def test_parse_row_missing_trailing_memo(self):
+        """Test Chase rows without the trailing memo field still parse."""
+        csv_content = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00"""
+
+        transactions = CSVParser().parse(csv_content)
+        assert transactions[0].memo == ""
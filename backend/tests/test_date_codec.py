@@ -0,0 +1,52 @@
+"""Tests for the MM/DD/YYYY date codec."""
+
+import pytest
+from datetime import date
+from src.services.date_codec import format_date, format_ordinal, from_ordinal, parse_date
+
+
+class TestParseDate:
+    """Tests for parse_date."""
+
+    def test_parses_padded_and_unpadded(self):
+        """Test both zero-padded and unpadded components are accepted."""
+        assert parse_date("10/03/2025") == date(2025, 10, 3)
+        assert parse_date("1/2/2025") == date(2025, 1, 2)
+
+    def test_rejects_impossible_date(self):
+        """Test dates that do not exist on the calendar are rejected."""
+        with pytest.raises(ValueError, match="does not exist"):
+            parse_date("02/31/2025")
+        with pytest.raises(ValueError, match="does not exist"):
+            parse_date("02/29/2025")
+
+    def test_accepts_leap_day(self):
+        """Test leap days are accepted in leap years."""
+        assert parse_date("02/29/2024") == date(2024, 2, 29)
+
+    def test_reports_specific_errors(self):
+        """Test malformed dates keep their specific error messages."""
+        with pytest.raises(ValueError, match="MM/DD/YYYY"):
+            parse_date("2025-10-13")
+        with pytest.raises(ValueError, match="Month must be between 1 and 12"):
+            parse_date("13/01/2025")
+        with pytest.raises(ValueError, match="Year must be between 1900 and 2100"):
+            parse_date("01/01/1800")
+
+    def test_results_are_cached(self):
+        """Test repeated dates are served from the cache."""
+        parse_date.cache_clear()
+        parse_date("10/13/2025")
+        parse_date("10/13/2025")
+        assert parse_date.cache_info().hits == 1
+
+
+class TestFormatDate:
+    """Tests for ordinal and date formatting."""
+
+    def test_round_trip(self):
+        """Test dates survive conversion through ordinals."""
+        value = date(2025, 10, 3)
+        assert from_ordinal(value.toordinal()) == value
+        assert format_ordinal(value.toordinal()) == "10/03/2025"
+        assert format_date(value) == "10/03/2025"
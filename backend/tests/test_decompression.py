@@ -0,0 +1,141 @@
+"""Tests for streaming decompression of compressed uploads."""
+
+import gzip
+import pytest
+import zipfile
+import zstandard
+from io import BytesIO
+from src.services.csv_parser import CSVParser
+from src.services.decompression import (
+    DecompressionBombError,
+    UploadFormatError,
+    is_compressed_upload,
+    open_decompressed,
+)
+
+CSV_CONTENT = (
+    b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    b"10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00,\n"
+    b"10/14/2025,10/15/2025,PAYMENT - THANK YOU,Payment,Payment,250.00,\n"
+)
+
+
+def make_zip(entries: dict) -> BytesIO:
+    """Build an in-memory zip archive from name -> bytes entries."""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+async def read_all(stream) -> bytes:
+    """Drain a DecompressedStream in small reads."""
+    chunks = []
+    while chunk := await stream.read(16):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class TestDecompression:
+    """Tests for open_decompressed and DecompressedStream."""
+
+    def test_is_compressed_upload(self):
+        """Test compressed suffixes are recognized case-insensitively."""
+        assert is_compressed_upload("statement.CSV.GZ")
+        assert is_compressed_upload("statement.csv.zst")
+        assert is_compressed_upload("statement.zip")
+        assert not is_compressed_upload("statement.csv")
+        assert not is_compressed_upload("statement.gz")
+
+    @pytest.mark.parametrize(
+        "filename,payload",
+        [
+            ("statement.csv.gz", gzip.compress(CSV_CONTENT)),
+            ("statement.csv.zst", zstandard.ZstdCompressor().compress(CSV_CONTENT)),
+            ("statement.zip", make_zip({"statement.csv": CSV_CONTENT}).getvalue()),
+        ],
+    )
+    async def test_round_trip(self, filename, payload):
+        """Test every supported format decompresses to the original CSV."""
+        stream = open_decompressed(filename, BytesIO(payload))
+
+        assert await read_all(stream) == CSV_CONTENT
+
+    async def test_parser_reads_decompressed_stream(self):
+        """Test the streaming parser consumes decompressed uploads directly."""
+        stream = open_decompressed("statement.csv.gz", BytesIO(gzip.compress(CSV_CONTENT)))
+        batch = await CSVParser().parse_stream_columnar(stream, chunk_size=8)
+
+        assert len(batch) == 2
+        assert batch.summary.income_cents == 25000
+
+    async def test_ratio_guard_rejects_bomb(self, monkeypatch):
+        """Test output beyond the ratio limit is rejected while streaming."""
+        monkeypatch.setattr("src.services.decompression.settings.max_upload_size", 1024)
+        payload = gzip.compress(b"0" * 1024 * 1024)
+        stream = open_decompressed("bomb.csv.gz", BytesIO(payload), max_ratio=10)
+
+        with pytest.raises(DecompressionBombError):
+            await read_all(stream)
+        assert stream.bytes_read <= stream.max_size + 16
+
+    async def test_absolute_cap_rejects_output_within_ratio(self, monkeypatch):
+        """Test output within the ratio is still rejected beyond the absolute size cap."""
+        monkeypatch.setattr("src.services.decompression.settings.max_upload_size", 1024)
+        payload = gzip.compress(b"0" * 64 * 1024)
+        stream = open_decompressed(
+            "big.csv.gz", BytesIO(payload), max_ratio=10_000, max_decompressed_size=32 * 1024
+        )
+
+        assert stream.max_size == 32 * 1024
+        with pytest.raises(DecompressionBombError, match="maximum size of 32768 bytes"):
+            await read_all(stream)
+        assert stream.bytes_read <= stream.max_size + 16
+
+    def test_zip_declared_size_over_absolute_cap_rejected_upfront(self, monkeypatch):
+        """Test zip entries declaring more than the absolute cap fail before reading."""
+        monkeypatch.setattr("src.services.decompression.settings.max_upload_size", 1024)
+        archive = make_zip({"big.csv": b"0" * 64 * 1024})
+
+        with pytest.raises(DecompressionBombError, match="maximum size"):
+            open_decompressed("big.zip", archive, max_ratio=10_000, max_decompressed_size=32 * 1024)
+
+    def test_zip_declared_size_rejected_upfront(self, monkeypatch):
+        """Test zip entries declaring an oversized payload fail before reading."""
+        monkeypatch.setattr("src.services.decompression.settings.max_upload_size", 1024)
+        archive = make_zip({"bomb.csv": b"0" * 1024 * 1024})
+
+        with pytest.raises(DecompressionBombError):
+            open_decompressed("bomb.zip", archive, max_ratio=10)
+
+    @pytest.mark.parametrize(
+        "entries,message",
+        [
+            ({"a.csv": CSV_CONTENT, "b.csv": CSV_CONTENT}, "exactly one CSV file"),
+            ({"statement.xlsx": CSV_CONTENT}, "must contain a CSV file"),
+        ],
+    )
+    def test_zip_requires_single_csv_entry(self, entries, message):
+        """Test zip archives must hold exactly one CSV entry."""
+        with pytest.raises(UploadFormatError, match=message):
+            open_decompressed("statement.zip", make_zip(entries))
+
+    def test_zip_ignores_macos_metadata(self):
+        """Test __MACOSX resource forks do not count as entries."""
+        archive = make_zip({"statement.csv": CSV_CONTENT, "__MACOSX/._statement.csv": b"x"})
+
+        assert open_decompressed("statement.zip", archive) is not None
+
+    async def test_corrupt_gzip(self):
+        """Test corrupt compressed data surfaces as UploadFormatError."""
+        stream = open_decompressed("statement.csv.gz", BytesIO(b"not gzip data"))
+
+        with pytest.raises(UploadFormatError, match="Corrupt compressed upload"):
+            await read_all(stream)
+
+    def test_invalid_zip(self):
+        """Test non-zip data is rejected."""
+        with pytest.raises(UploadFormatError, match="Invalid ZIP archive"):
+            open_decompressed("statement.zip", BytesIO(b"not a zip"))
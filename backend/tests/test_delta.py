@@ -0,0 +1,77 @@
+"""Tests for delta ingestion detection."""
+
+import hashlib
+from io import BytesIO
+from src.models import UploadFingerprint
+from src.services.delta import digest_with_prefixes, find_delta_base
+
+HEADER = b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+ROW = b"10/13/2025,10/14/2025,Coffee,Food & Drink,Sale,-4.50,\n"
+
+
+def fingerprint(content: bytes, upload_id: int = 1, row_count: int = 1) -> UploadFingerprint:
+    """Build the fingerprint an upload of ``content`` would have."""
+    return UploadFingerprint(
+        id=upload_id,
+        file_hash=hashlib.sha256(content).hexdigest(),
+        file_size=len(content),
+        row_count=row_count,
+    )
+
+
+class TestDigestWithPrefixes:
+    """Tests for digest_with_prefixes."""
+
+    def test_prefix_digests_from_one_pass(self, monkeypatch):
+        """Test prefix digests match hashing each prefix separately."""
+        monkeypatch.setattr("src.services.delta.HASH_CHUNK_SIZE", 7)
+        content = HEADER + ROW * 5
+        fileobj = BytesIO(content)
+
+        digest, prefixes = digest_with_prefixes(fileobj, [40, 10, len(content) + 1])
+
+        assert digest == hashlib.sha256(content).hexdigest()
+        assert prefixes == {
+            10: hashlib.sha256(content[:10]).hexdigest(),
+            40: hashlib.sha256(content[:40]).hexdigest(),
+        }
+        assert fileobj.tell() == 0
+
+
+class TestFindDeltaBase:
+    """Tests for find_delta_base."""
+
+    def check(self, content: bytes, candidates):
+        """Run detection the way the upload endpoint does."""
+        fileobj = BytesIO(content)
+        _, prefixes = digest_with_prefixes(fileobj, [c.file_size for c in candidates])
+        return find_delta_base(fileobj, candidates, prefixes)
+
+    def test_largest_matching_prefix_wins(self):
+        """Test the longest earlier file that the new file extends is chosen."""
+        small = fingerprint(HEADER + ROW, upload_id=1)
+        large = fingerprint(HEADER + ROW * 2, upload_id=2, row_count=2)
+
+        assert self.check(HEADER + ROW * 3, [small, large]) == large
+
+    def test_unrelated_file_has_no_base(self):
+        """Test a different file of larger size does not match."""
+        other = fingerprint(HEADER + ROW.replace(b"Coffee", b"Bakery"))
+
+        assert self.check(HEADER + ROW * 3, [other]) is None
+
+    def test_prefix_must_end_on_record_boundary(self):
+        """Test an earlier file cut mid-row is not used as a base."""
+        content = HEADER + ROW * 2
+        cut = fingerprint(content[:len(HEADER) + 10])
+
+        assert self.check(content, [cut]) is None
+
+    def test_earlier_file_without_trailing_newline(self):
+        """Test a base whose last row had no newline still matches."""
+        earlier = fingerprint(HEADER + ROW.rstrip(b"\n"))
+
+        assert self.check(HEADER + ROW * 2, [earlier]) == earlier
+        assert self.check(HEADER + ROW + ROW.rstrip(b"\n"), [earlier]) == earlier
+        # The earlier last row continues with more characters in the new file
+        assert self.check(HEADER + ROW.rstrip(b"\n") + b"0\n", [earlier]) is None
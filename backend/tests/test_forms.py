@@ -0,0 +1,50 @@
+"""Tests for multipart form parsing of the upload endpoints."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.formparsers import MultiPartParser
+from src.config import settings
+from src.forms import SpoolingMultiPartParser
+from src.main import app
+
+
+class TestUploadForms:
+    """Tests for the upload form dependencies."""
+
+    def test_spool_threshold_is_not_patched_globally(self):
+        """Test only the upload parser uses the configured spool threshold."""
+        assert SpoolingMultiPartParser.spool_max_size == settings.upload_spool_threshold
+        assert MultiPartParser.spool_max_size == 1024 * 1024
+
+    async def test_missing_file_is_rejected(self):
+        """Test a form without the file field fails validation like a File parameter."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post(
+                "/api/transactions/upload", files={"other": ("statement.csv", b"x", "text/csv")}
+            )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "file"]
+
+    async def test_non_multipart_body_is_rejected(self):
+        """Test a body that is not a multipart form is rejected."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/api/ingest-jobs", content=b"Transaction Date\n")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "path,field,schema_type",
+        [
+            ("/api/transactions/upload", "file", "string"),
+            ("/api/transactions/upload/batch", "files", "array"),
+            ("/api/ingest-jobs", "file", "string"),
+        ],
+    )
+    def test_openapi_documents_file_fields(self, path, field, schema_type):
+        """Test the upload endpoints still document their multipart body."""
+        body = app.openapi()["paths"][path]["post"]["requestBody"]
+        schema = body["content"]["multipart/form-data"]["schema"]
+
+        assert schema["properties"][field]["type"] == schema_type
+        assert schema["required"] == [field]
@@ -1,8 +1,14 @@
 """Tests for main FastAPI application."""
 
+import gzip
+import json
 import pytest
 from httpx import AsyncClient, ASGITransport
 from src.main import app
+from src.services.pagination import encode_cursor
+from src.worker import IngestWorker
+
+pytestmark = pytest.mark.usefixtures("clean_database")
 
 
 @pytest.mark.asyncio
@@ -28,3 +34,628 @@ async def test_health_check():
         response = await client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions():
+    """Test uploading a CSV returns parsed transactions and summary."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00,\n"
+        "10/14/2025,10/15/2025,PAYMENT - THANK YOU,Payment,Payment,250.00,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert len(data["transactions"]) == 2
+        assert data["transactions"][0]["type"] == "debit"
+        assert data["summary"]["totalSpent"] == 100.0
+        assert data["summary"]["totalIncome"] == 250.0
+        assert data["summary"]["transactionCount"] == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_rejects_non_csv():
+    """Test uploading a non-CSV file is rejected."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.txt", "hello", "text/plain")},
+        )
+        assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_rejects_overlong_field():
+    """Test a field longer than its column is a 400 naming the row, not a database error."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        f"10/13/2025,10/14/2025,{'X' * 256},Shopping,Sale,-1.00,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+
+    assert response.status_code == 400
+    assert "row 2" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_gzip():
+    """Test a gzip-compressed CSV upload is decompressed and parsed."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/13/2025,10/14/2025,Test Merchant,Shopping,Sale,-100.00,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv.gz", gzip.compress(csv_content.encode()), "application/gzip")},
+        )
+        assert response.status_code == 200
+        assert response.json()["summary"]["totalSpent"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_rejects_decompression_bomb(monkeypatch):
+    """Test uploads inflating beyond the allowed ratio are rejected with 413."""
+    monkeypatch.setattr("src.services.decompression.settings.max_upload_size", 1024)
+    payload = gzip.compress(b"Transaction Date," + b"0" * 1024 * 1024)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("bomb.csv.gz", payload, "application/gzip")},
+        )
+        assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_large_file_is_memory_mapped(monkeypatch):
+    """Test uploads above the parallel threshold are parsed from the spooled file."""
+    monkeypatch.setattr("src.main.settings.parallel_parse_threshold", 64)
+    csv_content = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n" + "".join(
+        f"10/13/2025,10/14/2025,Merchant {i},Shopping,Sale,-{i}.00,\n" for i in range(1, 51)
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        assert response.status_code == 200
+        assert response.json()["summary"]["transactionCount"] == 50
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_repeat_served_from_cache():
+    """Test re-uploading identical bytes hits the parse cache and is not re-ingested."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/20/2025,10/21/2025,Cached Merchant,Shopping,Sale,-12.34,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        hits = (await client.get("/api/parse-cache/stats")).json()["hits"]
+        second = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        stats = (await client.get("/api/parse-cache/stats")).json()
+
+        assert second.status_code == 200
+        assert second.json()["transactions"] == first.json()["transactions"]
+        assert second.json()["summary"] == first.json()["summary"]
+        assert stats["hits"] == hits + 1
+
+        # The second upload resolves to the first one's stored upload
+        assert first.json()["duplicate"] is False
+        assert first.json()["newCount"] == 1
+        assert second.json()["duplicate"] is True
+        assert second.json()["newCount"] == 0
+        assert second.json()["duplicateCount"] == 1
+        assert second.json()["uploadId"] == first.json()["uploadId"]
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_returns_stored_ids():
+    """Test upload responses carry the IDs of the stored rows, including already stored ones."""
+    header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    grocer = "10/21/2025,10/22/2025,Stored Grocer,Groceries,Sale,-60.00,\n"
+    books = "10/25/2025,10/26/2025,Stored Books,Shopping,Sale,-12.00,\n"
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("first.csv", header + grocer, "text/csv")},
+        )
+        overlapping = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("second.csv", header + books + grocer, "text/csv")},
+        )
+        listed = (await client.get("/api/transactions")).json()["transactions"]
+
+    stored = {t["description"]: str(t["id"]) for t in listed}
+    assert [t["id"] for t in first.json()["transactions"]] == [stored["Stored Grocer"]]
+    assert overlapping.json()["duplicateCount"] == 1
+    assert [t["id"] for t in overlapping.json()["transactions"]] == [
+        stored["Stored Books"], stored["Stored Grocer"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_appended_rows_parsed_as_delta():
+    """Test a re-export with rows appended only parses and stores the new rows."""
+    header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    coffee = "10/20/2025,10/21/2025,Delta Coffee,Food & Drink,Sale,-4.50,\n"
+    september = header + coffee + "10/21/2025,10/22/2025,Delta Grocer,Groceries,Sale,-60.00,\n"
+    october = september + coffee + "10/25/2025,10/26/2025,Delta Books,Shopping,Sale,-12.00,\n"
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("september.csv", september, "text/csv")},
+        )
+        second = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("october.csv", october, "text/csv")},
+        )
+
+    assert first.json()["delta"] is None
+    body = second.json()
+    assert second.status_code == 200
+    assert body["delta"] == {"baseUploadId": first.json()["uploadId"], "skippedRows": 2}
+    assert [t["description"] for t in body["transactions"]] == ["Delta Coffee", "Delta Books"]
+    # The repeated coffee continues the earlier file's occurrences, so it is new
+    assert body["newCount"] == 2
+    assert body["duplicateCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_job_accepted_and_processed():
+    """Test a queued upload returns 202 and reports its outcome once processed."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/20/2025,10/21/2025,Queued Merchant,Shopping,Sale,-12.34,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        accepted = await client.post(
+            "/api/ingest-jobs",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        queued = await client.get(accepted.json()["statusUrl"])
+        await IngestWorker().run_once()
+        done = await client.get(accepted.json()["statusUrl"])
+
+    assert accepted.status_code == 202
+    assert accepted.json()["status"] == "queued"
+    assert queued.json()["status"] == "queued"
+    assert done.status_code == 200
+    assert done.json()["status"] == "succeeded"
+    assert done.json()["rowsParsed"] == 1
+    assert done.json()["newCount"] == 1
+    assert done.json()["uploadId"] is not None
+
+
+@pytest.mark.asyncio
+async def test_ingest_job_not_found():
+    """Test unknown job IDs return 404."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/ingest-jobs/999999")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ingest_job_id_out_of_range():
+    """Test job IDs beyond the integer column are rejected, not sent to the database."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/ingest-jobs/99999999999")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_upload_progress_events():
+    """Test an upload with a progress ID can be followed as Server-Sent Events."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/20/2025,10/21/2025,Progress Merchant,Shopping,Sale,-12.34,\n"
+        "10/21/2025,10/22/2025,Progress Grocer,Groceries,Sale,-5.00,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        upload = await client.post(
+            "/api/transactions/upload?progressId=test-progress",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        response = await client.get("/api/transactions/upload/progress/test-progress")
+
+    assert upload.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    final = events[-1]
+    assert final["stage"] == "done"
+    assert final["rowsParsed"] == final["rowsTotal"] == 2
+    assert final["rowsPersisted"] == 2
+    assert final["bytesReceived"] == final["bytesTotal"] > len(csv_content)
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_session():
+    """Test a file sent as byte ranges, with a resumed range, is ingested."""
+    csv_content = (
+        b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        b"10/20/2025,10/21/2025,Chunked Merchant,Shopping,Sale,-12.34,\n"
+        b"10/21/2025,10/22/2025,Chunked Grocer,Groceries,Sale,-5.00,\n"
+    )
+    total = len(csv_content)
+    cut = csv_content.index(b"10/21/2025,10/22") + 5  # Inside the second row
+
+    def content_range(start: int, end: int) -> dict:
+        return {"Content-Range": f"bytes {start}-{end - 1}/{total}"}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        created = await client.post(
+            "/api/transactions/upload/sessions", json={"filename": "statement.csv", "size": total}
+        )
+        url = created.json()["uploadUrl"]
+        first = await client.put(url, content=csv_content[:cut], headers=content_range(0, cut))
+        gap = await client.put(url, content=csv_content[cut + 10:], headers=content_range(cut + 10, total))
+        early = await client.post(f"{url}/finalize")
+        # Resume from an earlier offset than received: the overlap is skipped
+        rest = await client.put(url, content=csv_content[cut - 20:], headers=content_range(cut - 20, total))
+        status = await client.get(url)
+        finalized = await client.post(f"{url}/finalize")
+        gone = await client.get(url)
+
+    assert created.status_code == 201
+    assert first.json()["offset"] == cut
+    assert first.json()["rowsParsed"] == 1
+    assert gap.status_code == 409
+    assert gap.headers["Upload-Offset"] == str(cut)
+    assert early.status_code == 409
+    assert rest.json()["offset"] == total
+    assert status.json()["rowsParsed"] == 2
+    assert finalized.status_code == 200
+    body = finalized.json()
+    assert body["newCount"] == 2
+    assert [t["description"] for t in body["transactions"]] == ["Chunked Merchant", "Chunked Grocer"]
+    assert gone.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_session_rejects_invalid_rows():
+    """Test a range with an invalid row fails with the parse error."""
+    csv_content = (
+        b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        b"10/20/2025,10/21/2025,Chunked Merchant,Shopping,Sale,not_a_number,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        created = await client.post(
+            "/api/transactions/upload/sessions", json={"filename": "statement.csv"}
+        )
+        url = created.json()["uploadUrl"]
+        response = await client.put(
+            url, content=csv_content, headers={"Content-Range": f"bytes 0-{len(csv_content) - 1}/*"}
+        )
+        status = await client.get(url)
+        unsupported = await client.post(
+            "/api/transactions/upload/sessions", json={"filename": "statement.txt"}
+        )
+
+    assert response.status_code == 400
+    assert "row 2" in response.json()["detail"]
+    assert status.json()["error"] is not None
+    assert unsupported.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_session_rejects_mismatched_range():
+    """Test a body whose length differs from its Content-Range is rejected."""
+    csv_content = (
+        b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        b"10/20/2025,10/21/2025,Chunked Merchant,Shopping,Sale,-12.34,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        created = await client.post(
+            "/api/transactions/upload/sessions", json={"filename": "statement.csv"}
+        )
+        url = created.json()["uploadUrl"]
+        longer = await client.put(url, content=csv_content, headers={"Content-Range": "bytes 0-9/*"})
+        shorter = await client.put(url, content=csv_content[:10], headers={"Content-Range": "bytes 0-99/*"})
+        status = await client.get(url)
+
+    assert longer.status_code == 400
+    assert "Content-Length" in longer.json()["detail"]
+    assert shorter.status_code == 400
+    assert status.json()["offset"] == 0
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_batch():
+    """Test several files are ingested at once with per-file and combined results."""
+    header = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    shared = "10/31/2025,11/01/2025,Batch Overlap,Shopping,Sale,-10.00,\n"
+    october = header + "10/05/2025,10/06/2025,Batch Grocer,Groceries,Sale,-40.00,\n" + shared
+    november = header + shared + "11/03/2025,11/04/2025,Batch Payroll,Income,Payment,500.00,\n"
+    invalid = header + "11/03/2025,11/04/2025,Batch Broken,Shopping,Sale,not_a_number,\n"
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload/batch",
+            files=[
+                ("files", ("october.csv", october, "text/csv")),
+                ("files", ("november.csv", november, "text/csv")),
+                ("files", ("broken.csv", invalid, "text/csv")),
+                ("files", ("notes.txt", "hello", "text/plain")),
+            ],
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is False
+    assert [f["filename"] for f in body["files"]] == ["october.csv", "november.csv", "broken.csv", "notes.txt"]
+    assert [f["success"] for f in body["files"]] == [True, True, False, False]
+    assert "row 2" in body["files"][2]["error"]
+    # The overlapping row is stored once, whichever file got there first
+    assert body["newCount"] == 3
+    assert body["duplicateCount"] == 1
+    assert body["files"][0]["transactionCount"] == 2
+    assert body["summary"]["transactionCount"] == 3
+    assert body["summary"]["totalSpent"] == 50.0
+    assert body["summary"]["totalIncome"] == 500.0
+
+
+@pytest.mark.asyncio
+async def test_upload_transactions_batch_file_limit(monkeypatch):
+    """Test batches with too many files are rejected."""
+    monkeypatch.setattr("src.main.settings.max_batch_files", 1)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post(
+            "/api/transactions/upload/batch",
+            files=[("files", ("a.csv", "x", "text/csv")), ("files", ("b.csv", "y", "text/csv"))],
+        )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_paginated():
+    """Test the transaction listing pages through stored rows with cursors."""
+    csv_content = "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n" + "".join(
+        f"10/{i:02d}/2025,10/{i:02d}/2025,Listed Merchant {i},Shopping,Sale,-{i}.00,\n"
+        for i in range(1, 6)
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        first = await client.get("/api/transactions", params={"limit": 3})
+        second = await client.get(
+            "/api/transactions", params={"limit": 3, "cursor": first.json()["nextCursor"]}
+        )
+        invalid = await client.get("/api/transactions", params={"cursor": "garbage"})
+
+    assert first.status_code == 200
+    assert [t["transactionDate"] for t in first.json()["transactions"]] == [
+        "2025-10-05", "2025-10-04", "2025-10-03"
+    ]
+    assert first.json()["transactions"][0]["amount"] == -5.0
+    assert [t["description"] for t in second.json()["transactions"]] == [
+        "Listed Merchant 2", "Listed Merchant 1"
+    ]
+    assert second.json()["nextCursor"] is None
+    assert first.json()["totalCount"] == 5
+    assert first.json()["totalAmount"] == -15.0
+    assert second.json()["totalCount"] is None
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_transactions_filtered_and_sorted():
+    """Test listing filters and sort are read from camelCase query parameters."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/01/2025,10/02/2025,Corner Cafe,Food & Drink,Sale,-4.50,\n"
+        "10/02/2025,10/03/2025,Corner Market,Groceries,Sale,-35.00,\n"
+        "10/03/2025,10/04/2025,City Parking,Travel,Sale,-12.00,\n"
+        "10/04/2025,10/05/2025,Corner Cafe,Food & Drink,Sale,-6.25,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        response = await client.get(
+            "/api/transactions",
+            params=[
+                ("merchant", "corner"),
+                ("category", "Food & Drink"),
+                ("category", "Groceries"),
+                ("amountMin", "-20"),
+                ("dateFrom", "2025-10-01"),
+                ("sort", "amount"),
+                ("order", "asc"),
+            ],
+        )
+        reversed_range = await client.get(
+            "/api/transactions", params={"dateFrom": "2025-10-05", "dateTo": "2025-10-01"}
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [t["amount"] for t in body["transactions"]] == [-6.25, -4.5]
+    assert body["totalCount"] == 2
+    assert body["totalAmount"] == -10.75
+    assert reversed_range.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"amountMin": "1e30"},
+        {"amountMax": "99999999999999999999.00"},
+        {"uploadId": "1099511627776"},
+    ],
+)
+async def test_list_transactions_out_of_range_filters(params):
+    """Test filters beyond the stored column ranges are rejected, not sent to the database."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/transactions", params=params)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params, key",
+    [
+        ({}, ["date", "desc", 739_525, 2**31]),
+        ({"sort": "amount"}, ["amount", "desc", 2**63, 1]),
+    ],
+)
+async def test_list_transactions_out_of_range_cursor(params, key):
+    """Test cursors holding keys beyond the column ranges are rejected."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/transactions", params={**params, "cursor": encode_cursor(key)})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_uploads():
+    """Test uploads are listed with totals and a link to their transactions."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/20/2025,10/21/2025,Listed Upload Shop,Shopping,Sale,-12.34,\n"
+        "10/22/2025,10/23/2025,Listed Upload Refund,Shopping,Return,2.00,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        upload = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        listing = await client.get("/api/uploads")
+        single = await client.get(f"/api/uploads/{upload.json()['uploadId']}")
+        transactions = await client.get(single.json()["transactionsUrl"])
+        missing = await client.get("/api/uploads/999999")
+
+    assert listing.status_code == 200
+    assert listing.json()["nextCursor"] is None
+    assert listing.json()["uploads"] == [single.json()]
+    summary = single.json()
+    assert summary["transactionCount"] == 2
+    assert summary["totalSpent"] == 12.34
+    assert summary["totalIncome"] == 2.0
+    assert (summary["minDate"], summary["maxDate"]) == ("2025-10-20", "2025-10-22")
+    assert summary["categoryCount"] == 1
+    assert summary["categoryTotals"] == {"Shopping": -10.34}
+    assert transactions.json()["totalCount"] == 2
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_upload_ids_beyond_column_range():
+    """Test upload IDs and cursors no integer ID can match are rejected, not sent to the database."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        single = await client.get("/api/uploads/1099511627776")
+        deleted = await client.delete("/api/uploads/1099511627776")
+        listing = await client.get("/api/uploads", params={"cursor": encode_cursor([2**40])})
+
+    assert single.status_code == 422
+    assert deleted.status_code == 422
+    assert listing.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_analytics_summary():
+    """Test analytics summarize stored transactions in a date range and follow deletions."""
+    csv_content = (
+        "Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+        "10/20/2025,10/21/2025,Analytics Shop,Shopping,Sale,-12.34,\n"
+        "10/25/2025,10/26/2025,Analytics Refund,Shopping,Return,2.00,\n"
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        upload = await client.post(
+            "/api/transactions/upload",
+            files={"file": ("statement.csv", csv_content, "text/csv")},
+        )
+        everything = await client.get("/api/analytics/summary")
+        ranged = await client.get(
+            "/api/analytics/summary", params={"start_date": "2025-10-01", "end_date": "2025-10-21"}
+        )
+        reversed_range = await client.get(
+            "/api/analytics/summary", params={"start_date": "2025-10-21", "end_date": "2025-10-01"}
+        )
+        deleted = await client.delete(f"/api/uploads/{upload.json()['uploadId']}")
+        deleted_again = await client.delete(f"/api/uploads/{upload.json()['uploadId']}")
+        after_delete = await client.get("/api/analytics/summary")
+
+    assert everything.status_code == 200
+    assert everything.json() == upload.json()["summary"]
+    assert ranged.json()["transactionCount"] == 1
+    assert ranged.json()["totalSpent"] == 12.34
+    assert reversed_range.status_code == 422
+    assert deleted.status_code == 204
+    assert deleted_again.status_code == 404
+    assert after_delete.json()["transactionCount"] == 0
@@ -0,0 +1,94 @@
+"""Tests for ASGI middleware."""
+
+from fastapi import FastAPI, File, Request, UploadFile
+from httpx import AsyncClient, ASGITransport
+from src.middleware import UploadSizeLimitMiddleware
+
+BOUNDARY = "test-boundary"
+
+
+def make_app() -> FastAPI:
+    """Build an app limiting /upload bodies to 1KB."""
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_size=1024, paths=["/upload"])
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @app.post("/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    return app
+
+
+async def multipart_chunks(payload: bytes, chunk_size: int = 256):
+    """Yield a multipart body in chunks, so it is sent without Content-Length."""
+    body = (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="statement.csv"\r\n'
+        "Content-Type: text/csv\r\n\r\n"
+    ).encode() + payload + f"\r\n--{BOUNDARY}--\r\n".encode()
+    for i in range(0, len(body), chunk_size):
+        yield body[i:i + chunk_size]
+
+
+class TestUploadSizeLimitMiddleware:
+    """Tests for UploadSizeLimitMiddleware."""
+
+    async def test_accepts_small_upload(self):
+        """Test uploads under the limit pass through."""
+        async with AsyncClient(
+            transport=ASGITransport(app=make_app()), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/upload", files={"file": ("statement.csv", b"x" * 100, "text/csv")}
+            )
+            assert response.status_code == 200
+            assert response.json() == {"size": 100}
+
+    async def test_rejects_on_content_length(self):
+        """Test a declared Content-Length over the limit is rejected up front."""
+        async with AsyncClient(
+            transport=ASGITransport(app=make_app()), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/upload", files={"file": ("statement.csv", b"x" * 2048, "text/csv")}
+            )
+            assert response.status_code == 413
+            assert "maximum size of 1024 bytes" in response.json()["detail"]
+
+    async def test_rejects_on_running_byte_count(self):
+        """Test a streamed body without Content-Length is cut off at the limit."""
+        async with AsyncClient(
+            transport=ASGITransport(app=make_app()), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/upload",
+                content=multipart_chunks(b"x" * 4096),
+                headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+            )
+            assert response.status_code == 413
+
+    async def test_streamed_body_under_limit(self):
+        """Test a streamed body under the limit is parsed normally."""
+        async with AsyncClient(
+            transport=ASGITransport(app=make_app()), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/upload",
+                content=multipart_chunks(b"x" * 500),
+                headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+            )
+            assert response.status_code == 200
+            assert response.json() == {"size": 500}
+
+    async def test_other_paths_unaffected(self):
+        """Test paths outside the configured set have no limit."""
+        async with AsyncClient(
+            transport=ASGITransport(app=make_app()), base_url="http://test"
+        ) as client:
+            response = await client.post("/other", content=b"x" * 4096)
+            assert response.status_code == 200
+            assert response.json() == {"size": 4096}
@@ -0,0 +1,67 @@
+"""Tests for the integer-cents money kernel."""
+
+import pytest
+from decimal import Decimal
+from src.services.money import (
+    cents_to_decimal,
+    cents_to_float,
+    decimal_to_cents,
+    parse_cents,
+)
+
+
+class TestParseCents:
+    """Tests for parse_cents."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("-45.74", -4574),
+            ("500.00", 50000),
+            ("+3.5", 350),
+            ("7", 700),
+            ("0.05", 5),
+            ("-0.00", 0),
+        ],
+    )
+    def test_plain_amounts(self, value, expected):
+        """Test plain amounts are parsed exactly."""
+        assert parse_cents(value) == expected
+
+    def test_extra_precision_rounds_half_even(self):
+        """Test amounts with more than two places round like NUMERIC(10, 2)."""
+        assert parse_cents("1.005") == 100
+        assert parse_cents("1.015") == 102
+        assert parse_cents("1e2") == 10000
+
+    @pytest.mark.parametrize("value", ["1e30", "-1e30", "1e999999", "92233720368547758.08", "-92233720368547758.09"])
+    def test_out_of_range_amounts(self, value):
+        """Test amounts whose cents do not fit a BIGINT are rejected."""
+        with pytest.raises(ValueError, match="out of range"):
+            parse_cents(value)
+
+    def test_bigint_bounds(self):
+        """Test the largest and smallest BIGINT cents are accepted."""
+        assert parse_cents("92233720368547758.07") == 2**63 - 1
+        assert parse_cents("-92233720368547758.08") == -(2**63)
+
+    @pytest.mark.parametrize("value", ["", "abc", "NaN", "Infinity", "1,000.00"])
+    def test_invalid_amounts(self, value):
+        """Test non-numeric and non-finite amounts are rejected."""
+        with pytest.raises(ValueError, match="Invalid amount value"):
+            parse_cents(value)
+
+
+class TestConversions:
+    """Tests for cents conversions."""
+
+    def test_decimal_round_trip(self):
+        """Test cents convert to and from two-place Decimals."""
+        assert cents_to_decimal(-4574) == Decimal("-45.74")
+        assert str(cents_to_decimal(5)) == "0.05"
+        assert decimal_to_cents(Decimal("-45.74")) == -4574
+
+    def test_cents_to_float(self):
+        """Test cents convert to floats for JSON."""
+        assert cents_to_float(-4574) == -45.74
+
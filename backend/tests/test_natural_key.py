@@ -0,0 +1,75 @@
+"""Tests for transaction natural keys."""
+
+from datetime import date
+from src.services.natural_key import (
+    NaturalKeyBuilder,
+    OccurrenceIndex,
+    find_occurrence,
+    normalize_description,
+    transaction_base_hash,
+)
+
+
+class TestNaturalKey:
+    """Tests for natural key normalization and hashing."""
+
+    def test_normalize_description(self):
+        """Test whitespace and case differences are normalized away."""
+        assert normalize_description("  Sq *clever   BARBER\t") == "SQ *CLEVER BARBER"
+
+    def test_cosmetic_differences_share_a_key(self):
+        """Test the same charge from two exports gets the same key."""
+        first = NaturalKeyBuilder().key(date(2025, 10, 13), date(2025, 10, 14), "Coffee  Shop", -450)
+        second = NaturalKeyBuilder().key(date(2025, 10, 13), date(2025, 10, 14), "COFFEE SHOP", -450)
+
+        assert first == second
+        assert len(first) == 32
+
+    def test_repeats_get_distinct_keys(self):
+        """Test identical same-day transactions are told apart by occurrence."""
+        builder = NaturalKeyBuilder()
+        args = (date(2025, 10, 13), date(2025, 10, 14), "COFFEE SHOP", -450)
+
+        first, second = builder.key(*args), builder.key(*args)
+
+        assert first != second
+        # A later statement containing the same pair maps onto the same keys
+        overlap = NaturalKeyBuilder()
+        assert [overlap.key(*args), overlap.key(*args)] == [first, second]
+
+    def test_amount_and_dates_are_part_of_the_key(self):
+        """Test differing amounts or dates produce different keys."""
+        key = NaturalKeyBuilder().key
+        base = key(date(2025, 10, 13), date(2025, 10, 14), "SHOP", -450)
+
+        assert base != key(date(2025, 10, 13), date(2025, 10, 14), "SHOP", -451)
+        assert base != key(date(2025, 10, 13), date(2025, 10, 15), "SHOP", -450)
+
+    def test_prior_index_continues_occurrences(self):
+        """Test keys of a file's suffix match keying the whole file."""
+        repeat = (date(2025, 10, 13), date(2025, 10, 14), "COFFEE SHOP", -450)
+        other = (date(2025, 10, 13), date(2025, 10, 14), "BAKERY", -300)
+        rows = [repeat, other, repeat, repeat, other]
+
+        whole = NaturalKeyBuilder()
+        expected = [whole.key(*row) for row in rows]
+
+        prefix = NaturalKeyBuilder()
+        for row in rows[:2]:
+            prefix.key(*row)
+        stored = OccurrenceIndex.from_bytes(prefix.occurrence_index().to_bytes())
+        suffix = NaturalKeyBuilder(prior=stored)
+
+        assert [suffix.key(*row) for row in rows[2:]] == expected[2:]
+        assert suffix.occurrence_index().to_bytes() == whole.occurrence_index().to_bytes()
+        assert len(suffix.occurrence_index()) == 5
+
+    def test_find_occurrence_of_stored_key(self):
+        """Test a stored key is traced back to its occurrence and base hash."""
+        d = date(2025, 10, 13)
+        builder = NaturalKeyBuilder()
+        keys = [builder.key(d, d, "Coffee", -300) for _ in range(3)]
+
+        assert [find_occurrence(key, d, d, "coffee", -300, 3) for key in keys] == [0, 1, 2]
+        assert find_occurrence(keys[2], d, d, "Coffee", -300, 2) is None
+        assert builder.occurrence_index().count(transaction_base_hash(d, d, " COFFEE ", -300)) == 3
@@ -0,0 +1,36 @@
+"""Tests for keyset pagination cursors."""
+
+import pytest
+from src.services.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """Tests for encode_cursor and decode_cursor."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the values it was built from."""
+        cursor = encode_cursor((739_525, "Café, \"quoted\"", 42))
+
+        assert decode_cursor(cursor, (int, str, int)) == (739_525, "Café, \"quoted\"", 42)
+
+    def test_url_safe(self):
+        """Test cursors can be passed as query parameters unescaped."""
+        cursor = encode_cursor(("???>>>", 1))
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "!!!!", encode_cursor((1,)), encode_cursor(("1", 2))])
+    def test_invalid(self, cursor):
+        """Test malformed cursors and cursors of the wrong shape are rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, (int, int))
+
+    def test_bool_is_not_int(self):
+        """Test JSON booleans do not pass as integer keys."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor((True, 1)), (int, int))
+
+    @pytest.mark.parametrize("value", [2**63, -(2**63) - 1])
+    def test_int_outside_bigint_range(self, value):
+        """Test integer keys that no bigint column can hold are rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor((value, 1)), (int, int))
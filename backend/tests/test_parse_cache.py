@@ -0,0 +1,123 @@
+"""Tests for the content-addressed parse cache."""
+
+import pickle
+import stat
+from datetime import date
+from src.services.parse_cache import ParseCache
+from src.services.transaction_batch import TransactionBatch
+
+
+def make_batch(rows: int = 1) -> TransactionBatch:
+    """Build a batch with the given number of rows."""
+    batch = TransactionBatch()
+    for i in range(rows):
+        batch.append(
+            transaction_date=date(2025, 10, 13),
+            post_date=date(2025, 10, 14),
+            description=f"Merchant {i}",
+            category="Shopping",
+            type="Sale",
+            amount_cents=-100 * (i + 1),
+            memo="",
+        )
+    return batch
+
+
+class TestParseCache:
+    """Tests for ParseCache."""
+
+    async def test_hit_and_miss_counters(self):
+        """Test lookups count hits and misses."""
+        cache = ParseCache(max_bytes=1024 * 1024)
+        batch = make_batch()
+
+        assert await cache.get("a") is None
+        await cache.put("a", batch)
+
+        assert await cache.get("a") is batch
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.entries == 1
+
+    async def test_lru_eviction_by_size(self):
+        """Test the least recently used entry is evicted when over budget."""
+        size = make_batch().nbytes()
+        cache = ParseCache(max_bytes=size * 2)
+        await cache.put("a", make_batch())
+        await cache.put("b", make_batch())
+        await cache.get("a")
+        await cache.put("c", make_batch())
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+        assert cache.stats.evictions == 1
+        assert cache.stats.bytes <= cache.max_bytes
+
+    async def test_oversized_batch_not_cached_in_memory(self):
+        """Test batches larger than the whole budget skip the memory tier."""
+        cache = ParseCache(max_bytes=1)
+        await cache.put("a", make_batch())
+
+        assert await cache.get("a") is None
+        assert cache.stats.evictions == 0
+
+    async def test_disk_tier_survives_memory_loss(self, tmp_path):
+        """Test entries reload from disk after the memory tier is cleared."""
+        cache = ParseCache(max_bytes=1024 * 1024, disk_dir=str(tmp_path), disk_max_bytes=1024 * 1024)
+        await cache.put("a", make_batch(3))
+        cache.clear()
+
+        reloaded = await cache.get("a")
+        assert reloaded is not None
+        assert list(reloaded.iter_rows()) == list(make_batch(3).iter_rows())
+        assert reloaded.summary.spent_cents == 600
+        assert cache.stats.disk_hits == 1
+        assert cache.stats.entries == 1
+
+    async def test_disk_tier_budget(self, tmp_path):
+        """Test the disk tier drops its oldest files when over budget."""
+        cache = ParseCache(max_bytes=0, disk_dir=str(tmp_path), disk_max_bytes=1)
+        await cache.put("a", make_batch())
+
+        assert cache.stats.disk_writes == 1
+        assert cache.stats.disk_evictions == 1
+        assert not list(tmp_path.glob("*.batch"))
+
+    async def test_corrupt_disk_entry_is_a_miss(self, tmp_path):
+        """Test unreadable disk entries are treated as misses."""
+        cache = ParseCache(max_bytes=1024, disk_dir=str(tmp_path), disk_max_bytes=1024)
+        (tmp_path / "a.batch").write_bytes(b"garbage")
+
+        assert await cache.get("a") is None
+        assert cache.stats.misses == 1
+
+    async def test_pickle_entries_are_not_loaded(self, tmp_path):
+        """Test disk entries are only read in the batch format, never unpickled."""
+        cache = ParseCache(max_bytes=1024, disk_dir=str(tmp_path), disk_max_bytes=1024)
+        (tmp_path / "a.batch").write_bytes(pickle.dumps(make_batch()))
+
+        assert await cache.get("a") is None
+
+    def test_disk_dir_is_private(self, tmp_path):
+        """Test a created disk tier directory is only accessible by its owner."""
+        ParseCache(max_bytes=1024, disk_dir=str(tmp_path / "cache"), disk_max_bytes=1024)
+
+        assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) & 0o077 == 0
+
+    async def test_files_vanishing_during_eviction(self, tmp_path, monkeypatch):
+        """Test files removed by another process mid-scan do not fail the write."""
+        cache = ParseCache(max_bytes=0, disk_dir=str(tmp_path), disk_max_bytes=1)
+        (tmp_path / "gone.batch").write_bytes(b"x")
+        real_glob = type(tmp_path).glob
+
+        def glob_then_delete(self, pattern):
+            paths = list(real_glob(self, pattern))
+            (tmp_path / "gone.batch").unlink()
+            return paths
+
+        monkeypatch.setattr(type(tmp_path), "glob", glob_then_delete)
+        await cache.put("a", make_batch())
+
+        assert cache.stats.disk_writes == 1
+        assert not (tmp_path / "a.batch").exists()
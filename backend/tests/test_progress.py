@@ -0,0 +1,87 @@
+"""Tests for upload progress tracking."""
+
+import asyncio
+import json
+from src.services.progress import ProgressRegistry, UploadStage
+
+
+async def collect(events) -> list:
+    """Decode every event of a stream."""
+    return [json.loads(event.split("data: ", 1)[1]) async for event in events]
+
+
+class TestProgressRegistry:
+    """Tests for ProgressRegistry."""
+
+    async def test_subscriber_waits_for_upload(self):
+        """Test a stream opened before its upload starts follows it once registered."""
+        registry = ProgressRegistry()
+        events = registry.events("a", interval=0)
+        pending = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+        assert registry.get("a") is None
+
+        registry.start("a").rows_parsed = 3
+        first = json.loads((await pending).split("data: ", 1)[1])
+
+        assert first["rowsParsed"] == 3
+
+    async def test_unknown_id_ends_after_grace_period(self):
+        """Test a stream for an ID no upload registers ends without creating an entry."""
+        registry = ProgressRegistry(register_grace_seconds=0)
+
+        assert await collect(registry.events("never", interval=0)) == []
+        assert registry.get("never") is None
+
+    def test_oldest_entry_dropped_when_full(self):
+        """Test the registry keeps at most max_entries uploads."""
+        registry = ProgressRegistry(max_entries=2)
+        for progress_id in ("a", "b", "c"):
+            registry.start(progress_id)
+
+        assert list(registry._entries) == ["b", "c"]
+
+    def test_start_replaces_finished_entry(self):
+        """Test reusing an ID after its upload finished starts from zero."""
+        registry = ProgressRegistry()
+        old = registry.start("a")
+        old.rows_parsed = 10
+        old.finish()
+
+        new = registry.start("a")
+        assert new is not old
+        assert new.rows_parsed == 0
+
+    def test_finished_entries_expire(self):
+        """Test finished entries are pruned after their TTL."""
+        registry = ProgressRegistry(finished_ttl_seconds=0)
+        registry.start("a").finish()
+        registry.start("b")
+
+        assert list(registry._entries) == ["b"]
+
+    async def test_events_end_with_final_state(self):
+        """Test the stream only emits changes and ends once finished."""
+        registry = ProgressRegistry()
+        progress = registry.start("a")
+        progress.stage = UploadStage.PARSING
+        progress.rows_parsed = 5
+        events = registry.events("a", interval=0)
+
+        first = json.loads((await events.__anext__()).split("data: ", 1)[1])
+        progress.rows_parsed = 7
+        progress.finish()
+        rest = await collect(events)
+
+        assert first["stage"] == "parsing"
+        assert first["rowsParsed"] == 5
+        assert [e["stage"] for e in rest] == ["done"]
+        assert rest[-1]["rowsParsed"] == 7
+
+    async def test_events_stop_after_ttl(self):
+        """Test a stream for an upload that never finishes is closed."""
+        registry = ProgressRegistry(ttl_seconds=0.05)
+        registry.start("stalled")
+
+        events = await collect(registry.events("stalled", interval=0.01))
+        assert [e["stage"] for e in events] == ["receiving"]
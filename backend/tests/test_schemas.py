@@ -1,9 +1,17 @@
 """Tests for Pydantic schemas."""
 
 import pytest
+from datetime import date
 from decimal import Decimal
 from pydantic import ValidationError
-from src.schemas import TransactionCreate, TransactionResponse
+from src.schemas import (
+    AnalyticsQuery,
+    SortOrder,
+    TransactionCreate,
+    TransactionListQuery,
+    TransactionResponse,
+    TransactionSort,
+)
 
 
 class TestTransactionCreate:
@@ -98,6 +106,20 @@ class TestTransactionCreate:
             TransactionCreate(**data)
         assert "Day must be between 1 and 31" in str(exc_info.value)
 
+    def test_impossible_calendar_date(self):
+        """Test validation fails for dates that do not exist."""
+        data = {
+            "transaction_date": "02/31/2025",  # February has no 31st
+            "post_date": "10/14/2025",
+            "description": "Test",
+            "category": "Shopping",
+            "type": "Sale",
+            "amount": Decimal("-100.00"),
+        }
+        with pytest.raises(ValidationError) as exc_info:
+            TransactionCreate(**data)
+        assert "Date does not exist" in str(exc_info.value)
+
     def test_empty_description(self):
         """Test validation fails for empty description."""
         data = {
@@ -112,6 +134,24 @@ class TestTransactionCreate:
             TransactionCreate(**data)
         assert "Field cannot be empty" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        "field,max_length", [("description", 255), ("category", 100), ("type", 50), ("memo", 255)]
+    )
+    def test_field_longer_than_column(self, field, max_length):
+        """Test text fields are limited to their database column length."""
+        data = {
+            "transaction_date": "10/13/2025",
+            "post_date": "10/14/2025",
+            "description": "Test",
+            "category": "Shopping",
+            "type": "Sale",
+            "amount": Decimal("-100.00"),
+        }
+        TransactionCreate(**{**data, field: "x" * max_length})
+        with pytest.raises(ValidationError) as exc_info:
+            TransactionCreate(**{**data, field: "x" * (max_length + 1)})
+        assert f"at most {max_length} characters" in str(exc_info.value)
+
     def test_whitespace_only_category(self):
         """Test validation fails for whitespace-only category."""
         data = {
@@ -156,3 +196,64 @@ class TestTransactionCreate:
         assert "category" in missing_fields
         assert "type" in missing_fields
         assert "amount" in missing_fields
+
+
+class TestTransactionListQuery:
+    """Tests for TransactionListQuery schema."""
+
+    def test_defaults_to_newest_first(self):
+        """Test an empty query lists everything by date, descending."""
+        query = TransactionListQuery()
+        assert query.sort == TransactionSort.DATE
+        assert query.order == SortOrder.DESC
+
+    def test_camel_case_aliases(self):
+        """Test query parameters are accepted by their camelCase names."""
+        query = TransactionListQuery(dateFrom="2025-10-01", amountMax="-5", uploadId=3)
+        assert query.date_from == date(2025, 10, 1)
+        assert query.amount_max == Decimal("-5")
+        assert query.upload_id == 3
+
+    def test_blank_merchant_is_no_filter(self):
+        """Test a whitespace merchant search is ignored."""
+        assert TransactionListQuery(merchant="   ").merchant is None
+
+    def test_reversed_date_range(self):
+        """Test a date range ending before it starts is rejected."""
+        with pytest.raises(ValidationError):
+            TransactionListQuery(date_from=date(2025, 10, 2), date_to=date(2025, 10, 1))
+
+    def test_reversed_amount_range(self):
+        """Test an amount range with min above max is rejected."""
+        with pytest.raises(ValidationError):
+            TransactionListQuery(amount_min=Decimal("10"), amount_max=Decimal("5"))
+
+    @pytest.mark.parametrize("amount", ["1e30", "99999999999999999999.00", "NaN"])
+    def test_amount_out_of_range(self, amount):
+        """Test amounts whose cents do not fit a bigint are rejected."""
+        with pytest.raises(ValidationError):
+            TransactionListQuery(amountMin=amount)
+
+    def test_upload_id_out_of_range(self):
+        """Test upload IDs beyond the integer column range are rejected."""
+        with pytest.raises(ValidationError):
+            TransactionListQuery(uploadId=2**31)
+
+    def test_sub_cent_amount(self):
+        """Test amounts with more than two decimal places are rejected."""
+        with pytest.raises(ValidationError):
+            TransactionListQuery(amount_min=Decimal("1.005"))
+
+
+class TestAnalyticsQuery:
+    """Tests for AnalyticsQuery schema."""
+
+    def test_open_range(self):
+        """Test both bounds are optional."""
+        query = AnalyticsQuery(start_date="2025-10-01")
+        assert (query.start_date, query.end_date) == (date(2025, 10, 1), None)
+
+    def test_reversed_range(self):
+        """Test a range ending before it starts is rejected."""
+        with pytest.raises(ValidationError):
+            AnalyticsQuery(start_date=date(2025, 10, 2), end_date=date(2025, 10, 1))
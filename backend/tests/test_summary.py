@@ -0,0 +1,99 @@
+"""Tests for SummaryAccumulator."""
+
+from datetime import date
+from src.services.summary import SummaryAccumulator
+
+
+def make_summary(*rows) -> SummaryAccumulator:
+    """Build an accumulator from (date, category, type, cents) rows."""
+    summary = SummaryAccumulator()
+    for transaction_date, category, type_value, cents in rows:
+        summary.add(transaction_date.toordinal(), category, type_value, cents)
+    return summary
+
+
+class TestSummaryAccumulator:
+    """Tests for SummaryAccumulator."""
+
+    def test_empty_response(self):
+        """Test an empty summary reports zeros."""
+        response = SummaryAccumulator().to_response()
+
+        assert response["transactionCount"] == 0
+        assert response["avgTransactionAmount"] == 0
+        assert SummaryAccumulator().min_date is None
+
+    def test_add_tracks_all_aggregates(self):
+        """Test totals, date span, categories and types in one pass."""
+        summary = make_summary(
+            (date(2025, 10, 14), "Shopping", "Sale", -10050),
+            (date(2025, 10, 13), "Shopping", "Sale", -1000),
+            (date(2025, 10, 20), "Payment", "Payment", 25000),
+        )
+
+        assert summary.spent_cents == 11050
+        assert summary.income_cents == 25000
+        assert summary.min_date == date(2025, 10, 13)
+        assert summary.max_date == date(2025, 10, 20)
+        assert summary.category_totals == {"Shopping": -11050, "Payment": 25000}
+        assert summary.type_counts == {"Sale": 2, "Payment": 1}
+
+    def test_to_response(self):
+        """Test the endpoint payload matches the upload summary format."""
+        response = make_summary(
+            (date(2025, 10, 13), "Shopping", "Sale", -10000),
+            (date(2025, 10, 14), "Payment", "Payment", 25000),
+        ).to_response()
+
+        assert response == {
+            "totalSpent": 100.0,
+            "totalIncome": 250.0,
+            "netAmount": 150.0,
+            "transactionCount": 2,
+            "avgTransactionAmount": 175.0,
+        }
+
+    def test_net_amount_is_exact(self):
+        """Test net amount is computed in cents, not by float subtraction."""
+        response = make_summary(
+            (date(2025, 10, 13), "Shopping", "Sale", -10),
+            (date(2025, 10, 14), "Payment", "Payment", 30),
+        ).to_response()
+
+        assert response["netAmount"] == 0.2
+
+    def test_merge_matches_single_pass(self):
+        """Test merging partial summaries equals summarizing all rows at once."""
+        rows = [
+            (date(2025, 10, 14), "Shopping", "Sale", -10050),
+            (date(2025, 9, 1), "Travel", "Sale", -500),
+            (date(2025, 10, 20), "Payment", "Payment", 25000),
+            (date(2025, 10, 2), "Shopping", "Return", 700),
+        ]
+        merged = make_summary(*rows[:2])
+        merged.merge(make_summary(*rows[2:]))
+        merged.merge(SummaryAccumulator())
+        single = make_summary(*rows)
+
+        assert merged.to_response() == single.to_response()
+        assert merged.min_date == single.min_date == date(2025, 9, 1)
+        assert merged.max_date == single.max_date
+        assert merged.category_totals == single.category_totals
+        assert merged.type_counts == single.type_counts
+
+    def test_add_group_matches_rows(self):
+        """Test adding pre-aggregated groups equals adding their rows."""
+        rows = [
+            (date(2025, 10, 14), "Shopping", "Sale", -10050),
+            (date(2025, 10, 2), "Shopping", "Sale", -500),
+            (date(2025, 10, 20), "Payment", "Payment", 25000),
+        ]
+        grouped = SummaryAccumulator()
+        grouped.add_group(date(2025, 10, 2).toordinal(), date(2025, 10, 14).toordinal(), "Shopping", "Sale", 2, 10550, 0)
+        grouped.add_group(date(2025, 10, 20).toordinal(), date(2025, 10, 20).toordinal(), "Payment", "Payment", 1, 0, 25000)
+        single = make_summary(*rows)
+
+        assert grouped.to_response() == single.to_response()
+        assert (grouped.min_date, grouped.max_date) == (single.min_date, single.max_date)
+        assert grouped.category_totals == single.category_totals
+        assert grouped.type_counts == single.type_counts
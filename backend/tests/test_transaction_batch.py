@@ -0,0 +1,98 @@
+"""Tests for columnar TransactionBatch."""
+
+import pytest
+from datetime import date
+from src.services.transaction_batch import TransactionBatch
+
+
+def make_batch() -> TransactionBatch:
+    """Build a small batch with a debit and a credit."""
+    batch = TransactionBatch()
+    batch.append(
+        transaction_date=date(2025, 10, 13),
+        post_date=date(2025, 10, 14),
+        description="Test Merchant",
+        category="Shopping",
+        type="Sale",
+        amount_cents=-10050,
+        memo="",
+    )
+    batch.append(
+        transaction_date=date(2025, 10, 14),
+        post_date=date(2025, 10, 15),
+        description="PAYMENT - THANK YOU",
+        category="Payment",
+        type="Payment",
+        amount_cents=25000,
+        memo="",
+    )
+    return batch
+
+
+class TestTransactionBatch:
+    """Tests for TransactionBatch."""
+
+    def test_iter_rows_decodes_columns(self):
+        """Test rows decode back to formatted dates and strings."""
+        rows = list(make_batch().iter_rows())
+
+        assert rows[0].transaction_date == "10/13/2025"
+        assert rows[0].description == "Test Merchant"
+        assert rows[0].amount_cents == -10050
+        assert rows[1].type == "Payment"
+
+    def test_append_feeds_summary(self):
+        """Test the summary is kept up to date while rows are appended."""
+        summary = make_batch().summary
+
+        assert (summary.spent_cents, summary.income_cents) == (10050, 25000)
+        assert summary.count == 2
+        assert summary.max_date == date(2025, 10, 14)
+
+    def test_to_records(self):
+        """Test insert records carry upload id and cents amounts."""
+        records = make_batch().to_records(upload_id=7)
+
+        assert records[0]["upload_id"] == 7
+        assert records[0]["amount_cents"] == -10050
+        assert records[1]["post_date"] == date(2025, 10, 15)
+        assert len({r["natural_key"] for r in records}) == 2
+
+    def test_extend_remaps_string_codes(self):
+        """Test extending re-encodes codes against the target tables."""
+        batch = TransactionBatch()
+        batch.append(
+            transaction_date=date(2025, 10, 1),
+            post_date=date(2025, 10, 1),
+            description="Other",
+            category="Travel",
+            type="Sale",
+            amount_cents=-1,
+            memo="",
+        )
+        batch.extend(make_batch())
+
+        rows = list(batch.iter_rows())
+        assert len(batch) == 3
+        assert [r.category for r in rows] == ["Travel", "Shopping", "Payment"]
+        assert [r.type for r in rows] == ["Sale", "Sale", "Payment"]
+        assert batch.type_table.values == ["Sale", "Payment"]
+        assert batch.summary.count == 3
+        assert batch.summary.min_date == date(2025, 10, 1)
+
+    def test_bytes_round_trip(self):
+        """Test a serialized batch loads back with the same rows and summary."""
+        batch = make_batch()
+        loaded = TransactionBatch.from_bytes(batch.to_bytes())
+
+        assert list(loaded.iter_rows()) == list(batch.iter_rows())
+        assert loaded.summary.to_response() == batch.summary.to_response()
+        assert loaded.category_table.values == batch.category_table.values
+
+    @pytest.mark.parametrize("cut", [0, 3, 20, -1])
+    def test_from_bytes_rejects_damaged_data(self, cut):
+        """Test truncated or foreign data is rejected rather than loaded."""
+        data = make_batch().to_bytes()
+
+        with pytest.raises(ValueError):
+            TransactionBatch.from_bytes(data[:cut] if cut else b"garbage")
@@ -0,0 +1,204 @@
+"""Tests for resumable upload sessions."""
+
+import hashlib
+import pytest
+from src.services.csv_parser import CSVParseError
+from src.services.upload_sessions import (
+    UploadOffsetError,
+    UploadSessionError,
+    UploadSessionNotFoundError,
+    UploadSessionStore,
+    UploadSessionTooLargeError,
+    parse_content_range,
+)
+
+CSV_CONTENT = (
+    b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    b"10/13/2025,10/14/2025,Session Barber,Personal,Sale,-45.74,\n"
+    b"10/14/2025,10/15/2025,Session Grocer,Groceries,Sale,-18.07,\n"
+)
+
+
+async def body(*chunks: bytes):
+    """Stream chunks like a request body."""
+    for chunk in chunks:
+        yield chunk
+
+
+class TestUploadSession:
+    """Tests for UploadSession."""
+
+    async def test_ranges_are_stored_hashed_and_parsed(self, tmp_path):
+        """Test a file sent in ranges is assembled, hashed and parsed."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv", len(CSV_CONTENT))
+
+        await session.write(0, 89, body(CSV_CONTENT[:50], CSV_CONTENT[50:90]))
+        assert session.rows_parsed == 0
+        await session.write(90, len(CSV_CONTENT) - 1, body(CSV_CONTENT[90:]))
+        batch = await session.finish()
+
+        assert session.path.read_bytes() == CSV_CONTENT
+        assert session.digest == hashlib.sha256(CSV_CONTENT).hexdigest()
+        assert [t.description for t in batch.iter_rows()] == ["Session Barber", "Session Grocer"]
+
+    async def test_overlapping_range_is_trimmed(self, tmp_path):
+        """Test a retransmitted range only appends the bytes not yet received."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv")
+
+        await session.write(0, 79, body(CSV_CONTENT[:80]))
+        offset = await session.write(40, len(CSV_CONTENT) - 1, body(CSV_CONTENT[40:]))
+
+        assert offset == len(CSV_CONTENT)
+        assert session.path.read_bytes() == CSV_CONTENT
+        assert len(await session.finish()) == 2
+
+    async def test_gap_is_rejected_with_offset(self, tmp_path):
+        """Test a range starting past the received bytes reports the offset."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv")
+        await session.write(0, 9, body(CSV_CONTENT[:10]))
+
+        with pytest.raises(UploadOffsetError) as exc_info:
+            await session.write(20, len(CSV_CONTENT) - 1, body(CSV_CONTENT[20:]))
+        assert exc_info.value.offset == 10
+
+    async def test_incomplete_upload_cannot_finish(self, tmp_path):
+        """Test finishing before the declared size arrived is rejected."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv", len(CSV_CONTENT))
+        await session.write(0, 9, body(CSV_CONTENT[:10]))
+
+        with pytest.raises(UploadOffsetError):
+            await session.finish()
+
+    async def test_body_longer_than_range_is_rejected(self, tmp_path):
+        """Test bytes past the end of the range are not stored."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv")
+
+        with pytest.raises(UploadSessionError):
+            await session.write(0, 9, body(CSV_CONTENT[:10], CSV_CONTENT[10:20]))
+        assert session.offset == 10
+        assert session.path.read_bytes() == CSV_CONTENT[:10]
+
+    async def test_body_shorter_than_range_is_rejected(self, tmp_path):
+        """Test a body ending before the range does is rejected, keeping what arrived."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv")
+
+        with pytest.raises(UploadSessionError):
+            await session.write(0, 19, body(CSV_CONTENT[:10]))
+        assert session.offset == 10
+
+    async def test_size_limit(self, tmp_path):
+        """Test bytes beyond the upload limit are rejected."""
+        session = await UploadSessionStore(str(tmp_path), 64, 60).create("statement.csv")
+
+        with pytest.raises(UploadSessionTooLargeError):
+            await session.write(0, len(CSV_CONTENT) - 1, body(CSV_CONTENT))
+
+    async def test_parse_error_fails_session(self, tmp_path):
+        """Test an invalid row fails the range and every later request."""
+        content = CSV_CONTENT.replace(b"-18.07", b"not_a_number")
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv")
+
+        with pytest.raises(CSVParseError):
+            await session.write(0, len(content) - 1, body(content))
+        with pytest.raises(UploadSessionError):
+            await session.finish()
+
+    async def test_compressed_upload_is_not_parsed(self, tmp_path):
+        """Test compressed files are only stored until finalized."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv.gz")
+        await session.write(0, 1, body(b"\x1f\x8b"))
+
+        assert await session.finish() is None
+
+
+class TestUploadSessionStore:
+    """Tests for UploadSessionStore."""
+
+    async def test_discard_removes_file(self, tmp_path):
+        """Test discarding a session forgets it and deletes its files."""
+        store = UploadSessionStore(str(tmp_path), 1024, 60)
+        session = await store.create("statement.csv")
+
+        await store.discard(session.id)
+
+        assert not session.path.exists()
+        assert not session.metadata_path.exists()
+        with pytest.raises(UploadSessionNotFoundError):
+            await store.get(session.id)
+
+    async def test_idle_sessions_expire(self, tmp_path):
+        """Test idle sessions are pruned when a new one starts."""
+        store = UploadSessionStore(str(tmp_path), 1024, 0)
+        old = await store.create("old.csv")
+        new = await store.create("new.csv")
+
+        assert await store.get(new.id) is new
+        assert not old.path.exists()
+        with pytest.raises(UploadSessionNotFoundError):
+            await store.get(old.id)
+
+    async def test_declared_size_over_limit(self, tmp_path):
+        """Test sessions for files over the limit are refused upfront."""
+        with pytest.raises(UploadSessionTooLargeError):
+            await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv", 2048)
+
+    async def test_session_survives_restart(self, tmp_path):
+        """Test a new store over the same directory resumes a session."""
+        session = await UploadSessionStore(str(tmp_path), 1024, 60).create("statement.csv", len(CSV_CONTENT))
+        await session.write(0, 89, body(CSV_CONTENT[:90]))
+
+        resumed = await UploadSessionStore(str(tmp_path), 1024, 60).get(session.id)
+        await resumed.refresh()
+        assert resumed.offset == 90
+        await resumed.write(90, len(CSV_CONTENT) - 1, body(CSV_CONTENT[90:]))
+        batch = await resumed.finish()
+
+        assert resumed.digest == hashlib.sha256(CSV_CONTENT).hexdigest()
+        assert [t.description for t in batch.iter_rows()] == ["Session Barber", "Session Grocer"]
+
+    async def test_ranges_alternate_between_workers(self, tmp_path):
+        """Test stores sharing a directory each catch up on the other's ranges."""
+        first = UploadSessionStore(str(tmp_path), 1024, 60)
+        second = UploadSessionStore(str(tmp_path), 1024, 60)
+        session = await first.create("statement.csv")
+
+        await session.write(0, 39, body(CSV_CONTENT[:40]))
+        await (await second.get(session.id)).write(40, 99, body(CSV_CONTENT[40:100]))
+        await session.write(100, len(CSV_CONTENT) - 1, body(CSV_CONTENT[100:]))
+
+        assert session.path.read_bytes() == CSV_CONTENT
+        assert len(await session.finish()) == 2
+
+    async def test_parse_error_is_shared(self, tmp_path):
+        """Test a session failed by one worker is failed for the others."""
+        first = UploadSessionStore(str(tmp_path), 1024, 60)
+        session = await first.create("statement.csv")
+        other = await UploadSessionStore(str(tmp_path), 1024, 60).get(session.id)
+        content = CSV_CONTENT.replace(b"-18.07", b"not_a_number")
+
+        with pytest.raises(CSVParseError):
+            await session.write(0, len(content) - 1, body(content))
+        await other.refresh()
+
+        assert other.error == session.error
+
+    @pytest.mark.parametrize("session_id", ["../etc/passwd", "abc", "A" * 32])
+    async def test_invalid_ids_are_not_found(self, tmp_path, session_id):
+        """Test IDs that are not session IDs never reach the filesystem."""
+        with pytest.raises(UploadSessionNotFoundError):
+            await UploadSessionStore(str(tmp_path), 1024, 60).get(session_id)
+
+
+class TestParseContentRange:
+    """Tests for parse_content_range."""
+
+    def test_range(self):
+        """Test the first and last byte of the range are returned."""
+        assert parse_content_range("bytes 100-199/1000") == (100, 199)
+        assert parse_content_range("bytes 0-99/*") == (0, 99)
+
+    @pytest.mark.parametrize("value", [None, "", "bytes */1000", "bytes 10-5/100", "items 0-1/2"])
+    def test_invalid(self, value):
+        """Test missing or malformed headers are rejected."""
+        with pytest.raises(UploadSessionError):
+            parse_content_range(value)
@@ -0,0 +1,155 @@
+"""Tests for the ingest job queue and worker."""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import select, text, update
+from src.api import IngestJobsContextManager, UploadsContextManager
+from src.models import IngestJobDTO, IngestJobStatus
+from src.worker import IngestWorker
+
+pytestmark = pytest.mark.usefixtures("clean_database")
+
+CSV_CONTENT = (
+    b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    b"10/13/2025,10/14/2025,Worker Coffee,Food & Drink,Sale,-4.50,\n"
+    b"10/14/2025,10/15/2025,Worker Grocer,Groceries,Sale,-60.00,\n"
+)
+
+
+async def chunked(content: bytes, size: int = 50):
+    """Stream content in chunks like a spooled upload."""
+    for start in range(0, len(content), size):
+        yield content[start:start + size]
+
+
+async def queue_job(content: bytes = CSV_CONTENT, filename: str = "statement.csv"):
+    """Queue a job and return it."""
+    async with IngestJobsContextManager() as db:
+        return await db.create_job(filename, chunked(content))
+
+
+class TestIngestWorker:
+    """Tests for IngestWorker and IngestJobsContextManager."""
+
+    async def test_run_once_ingests_job(self):
+        """Test a queued job is parsed, stored and marked succeeded."""
+        job = await queue_job()
+
+        assert await IngestWorker().run_once() is True
+
+        async with IngestJobsContextManager() as db:
+            done = await db.get_job(job.id)
+            content_oid = await db.session.scalar(select(IngestJobDTO.content_oid))
+            stored_files = await db.session.scalar(text("SELECT count(*) FROM pg_largeobject_metadata"))
+        async with UploadsContextManager() as db:
+            upload = await db.get_upload(done.upload_id)
+
+        assert done.status == IngestJobStatus.SUCCEEDED
+        assert done.attempts == 1
+        assert done.rows_parsed == 2
+        assert done.rows_inserted == 2
+        assert done.rows_duplicate == 0
+        assert done.finished_at is not None
+        assert content_oid is None
+        assert stored_files == 0
+        assert [t.description for t in upload.transactions] == ["Worker Coffee", "Worker Grocer"]
+
+    async def test_run_once_empty_queue(self):
+        """Test the worker reports an empty queue."""
+        assert await IngestWorker().run_once() is False
+
+    async def test_invalid_file_fails_job(self):
+        """Test parse errors mark the job failed with the error message."""
+        job = await queue_job(b"Transaction Date\n10/13/2025\n")
+
+        await IngestWorker().run_once()
+
+        async with IngestJobsContextManager() as db:
+            failed = await db.get_job(job.id)
+        assert failed.status == IngestJobStatus.FAILED
+        assert "missing" in failed.error.lower()
+        assert failed.upload_id is None
+
+    async def test_concurrent_claims_skip_locked_jobs(self):
+        """Test a job claimed in an open transaction is skipped, not waited on."""
+        first = await queue_job()
+        second = await queue_job()
+
+        async with IngestJobsContextManager() as holder:
+            held = await holder.claim_job(lease_seconds=60)
+            async with IngestJobsContextManager() as other:
+                claimed = await other.claim_job(lease_seconds=60)
+                content = b"".join([chunk async for chunk in other.read_job_content(claimed.id)])
+
+        assert held.id == first.id
+        assert claimed.id == second.id
+        assert content == CSV_CONTENT
+
+    async def test_expired_lease_is_reclaimed(self):
+        """Test a job abandoned by a crashed worker is claimed again."""
+        job = await queue_job()
+        async with IngestJobsContextManager() as db:
+            await db.claim_job(lease_seconds=60)
+        async with IngestJobsContextManager() as db:
+            assert await db.claim_job(lease_seconds=60) is None
+            await db.session.execute(
+                update(IngestJobDTO).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+            )
+
+        async with IngestJobsContextManager() as db:
+            reclaimed = await db.claim_job(lease_seconds=60)
+        assert reclaimed.id == job.id
+        assert reclaimed.attempts == 2
+
+    async def test_job_fails_after_max_attempts(self):
+        """Test a job that keeps being abandoned is eventually failed."""
+        job = await queue_job()
+        async with IngestJobsContextManager() as db:
+            await db.session.execute(
+                update(IngestJobDTO).values(
+                    status=IngestJobStatus.PARSING.value,
+                    attempts=1,
+                    lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+                )
+            )
+
+        await IngestWorker(max_attempts=1).run_once()
+
+        async with IngestJobsContextManager() as db:
+            failed = await db.get_job(job.id)
+        assert failed.status == IngestJobStatus.FAILED
+        assert "attempts" in failed.error
+
+    async def test_content_is_streamed_in_chunks(self, monkeypatch):
+        """Test job files larger than one chunk are stored and read back whole."""
+        monkeypatch.setattr("src.api.settings.ingest_job_chunk_size", 7)
+        job = await queue_job()
+
+        async with IngestJobsContextManager() as db:
+            chunks = [chunk async for chunk in db.read_job_content(job.id)]
+
+        assert job.file_size == len(CSV_CONTENT)
+        assert b"".join(chunks) == CSV_CONTENT
+        assert max(len(chunk) for chunk in chunks) == 7
+
+    async def test_transient_error_requeues_job(self, monkeypatch):
+        """Test a job whose storage fails is retried, then failed after max attempts."""
+        async def unavailable(file, parsed):
+            raise ConnectionError("database unavailable")
+
+        monkeypatch.setattr("src.worker.store_upload", unavailable)
+        job = await queue_job()
+        worker = IngestWorker(max_attempts=2)
+
+        await worker.run_once()
+        async with IngestJobsContextManager() as db:
+            retried = await db.get_job(job.id)
+        await worker.run_once()
+        async with IngestJobsContextManager() as db:
+            failed = await db.get_job(job.id)
+
+        assert retried.status == IngestJobStatus.QUEUED
+        assert retried.error == "database unavailable"
+        assert failed.status == IngestJobStatus.FAILED
+        assert failed.attempts == 2
+        assert "Gave up after 2 attempts" in failed.error